@@ -0,0 +1,636 @@
+"""
+Cache policies determine which entries are evicted from a keyed
+cache, such as the cache of a DynamicMap, once it exceeds its item,
+memory or age limits. Each policy also keeps track of the number of
+cache hits, misses and evictions.
+
+The DiskCache persists the return values of a Callable to disk so
+they can be reloaded after restarting the kernel or server.
+
+The DataCache memoizes values derived from a data object, such as
+dimension ranges, for as long as the data object is alive, while the
+RangeAccumulator incrementally maintains the range of streamed data.
+"""
+
+import inspect
+import os
+import pickle
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import warnings
+import weakref
+
+from collections import OrderedDict
+from functools import partial
+
+import numpy as np
+import param
+
+from .dimension import Dimensioned
+from .util import stablehash
+
+
+def nbytes(obj):
+    """
+    Estimates the number of bytes held by an object. HoloViews
+    containers are traversed and the sizes of the data of all
+    contained elements are summed, NumPy arrays, pandas objects and
+    any object declaring an ``nbytes`` attribute (e.g. xarray and
+    dask objects) report their own size while other objects fall
+    back to ``sys.getsizeof``.
+    """
+    if isinstance(obj, Dimensioned):
+        data = obj.data
+        if isinstance(data, dict) and all(isinstance(v, Dimensioned) for v in data.values()):
+            return sum(nbytes(v) for v in data.values())
+        return nbytes(data)
+    elif isinstance(obj, np.ndarray):
+        return obj.nbytes
+    elif isinstance(obj, (dict, list, tuple)):
+        values = obj.values() if isinstance(obj, dict) else obj
+        return sum(nbytes(v) for v in values)
+    elif hasattr(obj, 'memory_usage'):
+        try:
+            usage = obj.memory_usage(index=True, deep=False)
+            return int(usage.sum() if hasattr(usage, 'sum') else usage)
+        except Exception:
+            pass
+    if hasattr(obj, 'nbytes'):
+        try:
+            size = obj.nbytes
+            if np.isfinite(size):
+                return int(size)
+        except Exception:
+            pass
+    return sys.getsizeof(obj)
+
+
+class CachePolicy(param.Parameterized):
+    """
+    Baseclass for cache policies, which keep track of the entries in
+    a cache and determine which entries should be evicted once the
+    cache exceeds the maximum number of items or bytes. Entries older
+    than the ``ttl`` are considered expired and are treated as cache
+    misses.
+
+    Subclasses must implement the _eviction_order method, which sorts
+    the entries by the order in which they should be evicted.
+    """
+
+    max_items = param.Integer(default=None, allow_None=True, bounds=(1, None), doc="""
+        The maximum number of entries to hold in the cache. If None
+        the limit is determined by the object owning the cache, e.g.
+        the DynamicMap cache_size.""")
+
+    max_bytes = param.Number(default=None, allow_None=True, bounds=(0, None), doc="""
+        The maximum number of bytes of data to hold in the cache, as
+        estimated from the data of the cached objects.""")
+
+    ttl = param.Number(default=None, allow_None=True, bounds=(0, None), doc="""
+        The time in seconds after which a cached entry expires.""")
+
+    def __init__(self, **params):
+        super().__init__(**params)
+        self.clear()
+
+    def clone(self):
+        """
+        Returns a new policy with the same settings but without any
+        recorded entries or statistics.
+        """
+        params = {k: v for k, v in self.param.values().items() if k != 'name'}
+        return type(self)(**params)
+
+    def clear(self):
+        "Clears all recorded entries and resets the statistics."
+        # Entries map from key to [nbytes, timestamp, count] and are
+        # ordered from least to most recently used
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def nbytes(self):
+        "The estimated number of bytes held by the recorded entries."
+        return sum(entry[0] for entry in self._entries.values())
+
+    @property
+    def stats(self):
+        "Dictionary of cache statistics."
+        return {'hits': self.hits, 'misses': self.misses,
+                'evictions': self.evictions, 'items': len(self._entries),
+                'nbytes': self.nbytes}
+
+    def expired(self, key):
+        "Whether the entry for the supplied key has exceeded the ttl."
+        if self.ttl is None or key not in self._entries:
+            return False
+        return (time.monotonic() - self._entries[key][1]) > self.ttl
+
+    def hit(self, key):
+        "Records a cache hit for the supplied key."
+        self.hits += 1
+        if key in self._entries:
+            self._entries[key][2] += 1
+            self._entries.move_to_end(key)
+
+    def miss(self, key):
+        "Records a cache miss for the supplied key."
+        self.misses += 1
+
+    def add(self, key, value):
+        "Records a new entry for the supplied key and value."
+        self._entries.pop(key, None)
+        self._entries[key] = [nbytes(value), time.monotonic(), 1]
+
+    def discard(self, key):
+        "Discards the entry for the supplied key."
+        self._entries.pop(key, None)
+
+    def evict(self, cache, max_items=None, keep=None):
+        """
+        Determines the keys which have to be evicted from the supplied
+        cache (a mapping of keys to values) to satisfy the item and
+        byte limits, never evicting the ``keep`` key. The max_items
+        argument overrides the max_items parameter of the policy.
+        Entries which have not been recorded by the policy are evicted
+        first. The returned keys are discarded from the policy.
+        """
+        max_items = self.max_items if max_items is None else max_items
+        for key in [k for k in self._entries if k not in cache]:
+            del self._entries[key]
+        for key, value in cache.items():
+            if key not in self._entries:
+                self._entries[key] = [nbytes(value), time.monotonic(), 0]
+                self._entries.move_to_end(key, last=False)
+
+        evicted = [k for k in self._entries if k != keep and self.expired(k)]
+        remaining = len(self._entries) - len(evicted)
+        total = self.nbytes - sum(self._entries[k][0] for k in evicted)
+        skip = set(evicted)
+        for key in self._eviction_order():
+            over_items = max_items is not None and remaining > max_items
+            over_bytes = self.max_bytes is not None and total > self.max_bytes
+            if not (over_items or over_bytes):
+                break
+            elif key == keep or key in skip:
+                continue
+            evicted.append(key)
+            remaining -= 1
+            total -= self._entries[key][0]
+        for key in evicted:
+            del self._entries[key]
+        self.evictions += len(evicted)
+        return evicted
+
+    def _eviction_order(self):
+        raise NotImplementedError
+
+
+
+class LRUCachePolicy(CachePolicy):
+    """
+    Evicts the least recently used entries first.
+    """
+
+    def _eviction_order(self):
+        return list(self._entries)
+
+
+
+class LFUCachePolicy(CachePolicy):
+    """
+    Evicts the least frequently used entries first, evicting the
+    least recently used entries among entries with equal counts.
+    """
+
+    def _eviction_order(self):
+        order = {k: i for i, k in enumerate(self._entries)}
+        return sorted(self._entries, key=lambda k: (self._entries[k][2], order[k]))
+
+
+
+class DiskCache(param.Parameterized):
+    """
+    DiskCache persists the return values of a Callable to a directory
+    on disk, keyed on the identity of the callable and the arguments
+    it was called with, e.g. the key dimension values and stream
+    parameters supplied by a DynamicMap.
+
+    Each value is pickled with the array buffers (e.g. the columns of
+    a DataFrame, or the arrays of an xarray Dataset or dictionary)
+    stored out-of-band in a single binary file. When loading, that
+    file is memory mapped so the data is only read when it is
+    accessed.
+
+    The identity of the callable is derived from its module, name,
+    code, defaults and closure, which requires all of these to be
+    stably hashable. If that is not possible, e.g. for callables that
+    close over other HoloViews objects, results are not persisted
+    unless an explicit ``namespace`` is declared. Similarly the
+    arguments must be stably hashable; calls with other arguments
+    are not cached.
+    """
+
+    path = param.String(default=None, doc="""
+        Directory in which the cached results are stored. Defaults to
+        a holoviews directory in the user's cache directory, which is
+        only accessible to the current user. Since the stored results
+        are unpickled when loading, the directory must not be writable
+        by untrusted users.""")
+
+    namespace = param.String(default=None, doc="""
+        Explicit identifier for the callable, overriding the identity
+        derived from its code. Must be changed whenever the behavior
+        of the callable changes.""")
+
+    mmap = param.Boolean(default=True, doc="""
+        Whether to memory map the stored data when loading, deferring
+        reads from disk until the data is accessed.""")
+
+    _buffer_file = 'buffers.bin'
+
+    _meta_file = 'meta.pkl'
+
+    _alignment = 64
+
+    def __init__(self, path=None, **params):
+        super().__init__(path=path, **params)
+        if self.path is None:
+            self.path = self._default_path()
+        self._pickle_warned = False
+
+    @classmethod
+    def _default_path(cls):
+        """
+        Returns the default, per-user cache directory, creating it
+        so that it is only accessible to the current user.
+        """
+        root = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+        path = os.path.join(root, 'holoviews')
+        os.makedirs(path, mode=0o700, exist_ok=True)
+        if os.name == 'posix':
+            # The mode is not applied if the directory already exists
+            st = os.stat(path)
+            if st.st_uid != os.getuid():
+                raise PermissionError(f'The disk cache directory {path!r} is not '
+                                      'owned by the current user.')
+            if st.st_mode & 0o077:
+                os.chmod(path, 0o700)
+        return path
+
+    @classmethod
+    def identity(cls, fn):
+        """
+        Returns a digest identifying the callable, which is stable
+        across interpreter sessions, or None if it cannot be derived.
+        """
+        if isinstance(fn, partial):
+            func = cls.identity(fn.func)
+            return None if func is None else stablehash([func, fn.args, fn.keywords])
+        elif inspect.ismethod(fn):
+            owner = fn.__self__
+            if isinstance(owner, param.Parameterized):
+                state = {k: v for k, v in owner.param.values().items() if k != 'name'}
+            elif isinstance(owner, type):
+                state = owner.__qualname__
+            else:
+                return None
+            func = cls.identity(fn.__func__)
+            return None if func is None else stablehash([func, type(owner).__qualname__, state])
+        elif not inspect.isfunction(fn):
+            return None
+        closure = [c.cell_contents for c in (fn.__closure__ or [])]
+        return stablehash([fn.__module__, fn.__qualname__, cls._code_digest(fn.__code__),
+                           fn.__defaults__, fn.__kwdefaults__, closure])
+
+    @classmethod
+    def _code_digest(cls, code):
+        consts = [cls._code_digest(c) if inspect.iscode(c) else
+                  sorted(map(repr, c)) if isinstance(c, frozenset) else repr(c)
+                  for c in code.co_consts]
+        return stablehash([code.co_code.hex(), consts, code.co_names])
+
+    def key(self, fn, args=(), kwargs={}):
+        """
+        Returns the key for the supplied callable and arguments or
+        None if the call cannot be persisted.
+        """
+        identity = self.namespace or self.identity(fn)
+        if identity is None:
+            return None
+        return stablehash([identity, args, kwargs])
+
+    def _entry_path(self, key):
+        return os.path.join(self.path, key[:2], key)
+
+    def __contains__(self, key):
+        return os.path.isfile(os.path.join(self._entry_path(key), self._meta_file))
+
+    def load(self, key):
+        """
+        Loads the value stored under the key, raising a KeyError if
+        it has not been stored.
+        """
+        entry = self._entry_path(key)
+        try:
+            with open(os.path.join(entry, self._meta_file), 'rb') as f:
+                offsets, meta = pickle.load(f)
+        except FileNotFoundError:
+            raise KeyError(key) from None
+        if offsets and self.mmap:
+            data = np.memmap(os.path.join(entry, self._buffer_file), dtype=np.uint8, mode='c')
+        elif offsets:
+            with open(os.path.join(entry, self._buffer_file), 'rb') as f:
+                data = np.frombuffer(bytearray(f.read()), dtype=np.uint8)
+        buffers = [data[start:start+size] for start, size in offsets]
+        return pickle.loads(meta, buffers=buffers)
+
+    def store(self, key, value):
+        """
+        Stores the value under the supplied key. Values that cannot
+        be pickled are not stored.
+        """
+        buffers = []
+        try:
+            meta = pickle.dumps(value, protocol=5, buffer_callback=buffers.append)
+        except (pickle.PicklingError, AttributeError, TypeError) as e:
+            if not self._pickle_warned:
+                self.param.warning(f'Could not store value in the disk cache since '
+                                   f'it cannot be pickled: {e!r}')
+                self._pickle_warned = True
+            return
+        os.makedirs(os.path.dirname(self._entry_path(key)), mode=0o700, exist_ok=True)
+        tmp = tempfile.mkdtemp(dir=os.path.dirname(self._entry_path(key)))
+        offsets, position = [], 0
+        try:
+            with open(os.path.join(tmp, self._buffer_file), 'wb') as f:
+                for buf in buffers:
+                    raw = buf.raw()
+                    padding = -position % self._alignment
+                    f.write(b'\0'*padding)
+                    position += padding
+                    f.write(raw)
+                    offsets.append((position, raw.nbytes))
+                    position += raw.nbytes
+            with open(os.path.join(tmp, self._meta_file), 'wb') as f:
+                pickle.dump((offsets, meta), f, protocol=5)
+            os.replace(tmp, self._entry_path(key))
+        except OSError:
+            # Another process may have stored the same entry
+            shutil.rmtree(tmp, ignore_errors=True)
+
+    def clear(self):
+        "Deletes all entries in the cache directory."
+        shutil.rmtree(self.path, ignore_errors=True)
+
+
+
+class DataCache(param.Parameterized):
+    """
+    DataCache memoizes values computed from a data object, e.g. the
+    ranges of the dimensions of an element, keyed on the identity of
+    the data object and an arbitrary hashable key. Since elements are
+    cheap wrappers around their data this allows reusing computations
+    across elements sharing the same data, e.g. across the frames of
+    a HoloMap, the layers of an Overlay or linked plots.
+
+    Entries are dropped when the data object is garbage collected or
+    explicitly invalidated, which is required if a data object is
+    modified inplace, e.g. Pipe and Buffer streams invalidate the data
+    they send. Only data objects supporting weak references, such as
+    NumPy arrays and pandas or xarray objects, are cached. The cache
+    may be accessed from multiple threads, e.g. by the thread refining
+    a progressive aggregate.
+    """
+
+    max_items = param.Integer(default=1000, allow_None=True, bounds=(1, None), doc="""
+        The maximum number of data objects to hold cached values for,
+        evicting the least recently used data objects first.""")
+
+    enabled = param.Boolean(default=True, doc="""
+        Whether to cache values.""")
+
+    def __init__(self, **params):
+        super().__init__(**params)
+        self._entries = OrderedDict()
+        self._linked = []
+        # Reentrant since weakref callbacks may run while it is held
+        self._lock = threading.RLock()
+
+    def link(self, cache):
+        """
+        Links another cache holding values derived from data objects,
+        which is invalidated whenever this cache is invalidated.
+        """
+        self._linked.append(cache)
+
+    def get(self, data, key, fn):
+        """
+        Returns the value cached for the data object and key, calling
+        fn to compute the value if it has not been cached.
+        """
+        with self._lock:
+            values = self._values(data) if self.enabled else None
+            try:
+                if values is not None and key in values:
+                    return values[key]
+            except TypeError:
+                # Unhashable key
+                values = None
+        value = fn()
+        if values is not None:
+            with self._lock:
+                values[key] = value
+        return value
+
+    def lookup(self, data, key, default=None):
+        """
+        Returns the value cached for the data object and key or the
+        default if no value has been cached.
+        """
+        with self._lock:
+            entry = self._entries.get(id(data))
+            if not self.enabled or entry is None or entry[0]() is not data:
+                return default
+            return entry[1].get(key, default)
+
+    def set(self, data, key, value):
+        """
+        Caches the value for the data object and key, e.g. to supply
+        a value which was computed incrementally.
+        """
+        with self._lock:
+            values = self._values(data) if self.enabled else None
+            if values is not None:
+                values[key] = value
+
+    def _values(self, data):
+        """
+        Returns the dictionary of values cached for the data object,
+        creating it if necessary, or None if the data object does not
+        support weak references.
+        """
+        ident = id(data)
+        entry = self._entries.get(ident)
+        if entry is not None and entry[0]() is data:
+            self._entries.move_to_end(ident)
+            return entry[1]
+        try:
+            ref = weakref.ref(data, partial(self._remove, ident))
+        except TypeError:
+            return None
+        entry = self._entries[ident] = (ref, {})
+        if self.max_items is not None and len(self._entries) > self.max_items:
+            self._entries.popitem(last=False)
+        return entry[1]
+
+    def _remove(self, ident, ref):
+        with self._lock:
+            entry = self._entries.get(ident)
+            if entry is not None and entry[0] is ref:
+                del self._entries[ident]
+
+    def invalidate(self, data=None):
+        """
+        Drops the values cached for the supplied data object or all
+        cached values if no data is supplied, along with the values
+        held by linked caches.
+        """
+        for cache in self._linked:
+            cache.invalidate(data)
+        with self._lock:
+            if data is None:
+                self._entries.clear()
+                return
+            entry = self._entries.get(id(data))
+            if entry is not None and entry[0]() is data:
+                del self._entries[id(data)]
+
+    def __len__(self):
+        return len(self._entries)
+
+
+range_cache = DataCache(name='range_cache')
+
+
+
+class RangeAccumulator:
+    """
+    RangeAccumulator incrementally maintains the range and approximate
+    percentiles of a numeric column which is updated by appending
+    chunks of rows and evicting the oldest rows, e.g. by a Buffer
+    stream.
+
+    Appending a chunk only scans the new rows. Evicting rows only
+    requires rescanning the whole column (lazily, on the next query)
+    if the evicted rows contained the current minimum or maximum.
+    Percentiles are approximated by a histogram sketch, which is only
+    built once percentiles are first requested and is then updated
+    by adding and subtracting the counts of the appended and evicted
+    rows, until a chunk falls outside the range of the histogram.
+    """
+
+    # Number of histogram bins used to approximate percentiles
+    bins = 1024
+
+    # Fraction of the range the histogram is padded by on each side
+    padding = 0.1
+
+    def __init__(self, values=None):
+        self.values = values
+        self._lower = self._upper = np.nan
+        self._stale = True
+        self._hist = None
+        self._edges = None
+
+    @classmethod
+    def supports(cls, values):
+        "Whether the values can be accumulated, i.e. are numeric"
+        return isinstance(values, np.ndarray) and values.ndim == 1 and values.dtype.kind in 'uif'
+
+    @classmethod
+    def _finite_range(cls, values):
+        if not len(values):
+            return np.nan, np.nan
+        with warnings.catch_warnings():
+            warnings.filterwarnings('ignore', r'All-NaN (slice|axis) encountered')
+            return np.nanmin(values), np.nanmax(values)
+
+    def evict(self, values):
+        """
+        Removes the supplied rows, which are about to be evicted from
+        the column, from the accumulated state.
+        """
+        if not len(values):
+            return
+        if not self._stale:
+            lower, upper = self._finite_range(values)
+            if not (lower > self._lower and upper < self._upper):
+                self._stale = True
+        if self._hist is not None:
+            self._hist -= np.histogram(values, self._edges)[0]
+
+    def append(self, chunk, values):
+        """
+        Adds the appended chunk of rows to the accumulated state, given
+        the values of the whole column after appending.
+        """
+        self.values = values
+        if len(chunk) >= len(values):
+            self._stale = True
+            self._hist = None
+            return
+        lower, upper = self._finite_range(chunk)
+        if np.isinf(lower) or np.isinf(upper):
+            # Infinite values require a rescan to find the finite range
+            self._stale = True
+        elif not self._stale:
+            self._lower = np.fmin(self._lower, lower)
+            self._upper = np.fmax(self._upper, upper)
+        if self._hist is None:
+            return
+        elif lower < self._edges[0] or upper > self._edges[-1]:
+            self._hist = None
+        else:
+            self._hist += np.histogram(chunk, self._edges)[0]
+
+    def range(self):
+        "Returns the finite range of the column, ignoring NaNs."
+        if self._stale:
+            values = self.values
+            lower, upper = self._finite_range(values)
+            if np.isinf(lower) or np.isinf(upper):
+                finite = values[np.isfinite(values)]
+                lower, upper = self._finite_range(finite)
+            self._lower, self._upper = lower, upper
+            self._stale = False
+        return self._lower, self._upper
+
+    def percentile(self, q):
+        """
+        Returns the approximate q-th percentile of the column, ignoring
+        NaNs, accurate to the width of a histogram bin.
+        """
+        if self._hist is None:
+            lower, upper = self.range()
+            if not np.isfinite(lower):
+                return np.nan
+            pad = (upper - lower) * self.padding or 0.5
+            self._edges = np.linspace(lower-pad, upper+pad, self.bins+1)
+            self._hist = np.histogram(self.values, self._edges)[0]
+        cumulative = np.cumsum(self._hist)
+        total = cumulative[-1]
+        if not total:
+            return np.nan
+        target = q / 100. * total
+        idx = min(np.searchsorted(cumulative, target), len(self._hist)-1)
+        previous = cumulative[idx-1] if idx else 0
+        fraction = (target - previous) / self._hist[idx] if self._hist[idx] else 0
+        lower, upper = self.range()
+        value = self._edges[idx] + fraction * (self._edges[idx+1] - self._edges[idx])
+        return min(max(value, lower), upper)
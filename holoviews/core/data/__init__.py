@@ -31,6 +31,7 @@ from .pandas import PandasAPI, PandasInterface        # noqa (API import)
 from .spatialpandas import SpatialPandasInterface     # noqa (API import)
 from .spatialpandas_dask import DaskSpatialPandasInterface # noqa (API import)
 from .xarray import XArrayInterface           # noqa (API import)
+from .util import spatial_index
 
 # Ensures correct holoviews.core.util is sourced
 from .. import util
@@ -446,7 +447,9 @@ class Dataset(Element, metaclass=PipelineMeta):
         Raises:
             NotImplementedError: Raised if snapping is not supported
         """
-        if self.ndims > 1:
+        if self.ndims == 2 and not kwargs:
+            return self._closest_2d(coords)
+        elif self.ndims > 1:
             raise NotImplementedError("Closest method currently only "
                                       "implemented for 1D Elements")
 
@@ -463,6 +466,24 @@ class Dataset(Element, metaclass=PipelineMeta):
         idxs = [np.argmin(np.abs(xs-coord)) for coord in coords]
         return [type(s)(xs[idx]) for s, idx in zip(coords, idxs)]
 
+    def _closest_2d(self, coords):
+        """
+        Snaps 2D coordinates to the closest point in the Dataset, using
+        the spatial index if enabled via hv.config.spatial_index.
+        """
+        xs, ys = (self.dimension_values(i) for i in range(2))
+        if xs.dtype.kind not in 'uif' or ys.dtype.kind not in 'uif':
+            raise NotImplementedError("Closest only supported for numeric types")
+        index = spatial_index(xs, ys)
+        snapped = []
+        for x, y in coords:
+            if index is None:
+                idx = np.nanargmin((xs-x)**2 + (ys-y)**2)
+            else:
+                idx = index.nearest(x, y)
+            snapped.append((type(x)(xs[idx]), type(y)(ys[idx])))
+        return snapped
+
 
     def sort(self, by=None, reverse=False):
         """
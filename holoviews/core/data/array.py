@@ -201,7 +201,7 @@ class ArrayInterface(Interface):
     @classmethod
     def select(cls, dataset, selection_mask=None, **selection):
         if selection_mask is None:
-            selection_mask = cls.select_mask(dataset, selection)
+            selection_mask = cls.select_index(dataset, selection)
         indexed = cls.indexed(dataset, selection)
         data = np.atleast_2d(dataset.data[selection_mask, :])
         if len(data) == 1 and indexed and len(dataset.vdims) == 1:
@@ -33,6 +33,8 @@ class cuDFInterface(PandasInterface):
 
     datatype = 'cuDF'
 
+    lazy = True
+
     types = ()
 
     @classmethod
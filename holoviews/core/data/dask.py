@@ -36,6 +36,8 @@ class DaskInterface(PandasInterface):
 
     default_partitions = 100
 
+    lazy = True
+
     @classmethod
     def loaded(cls):
         return 'dask.dataframe' in sys.modules and 'pandas' in sys.modules
@@ -89,6 +91,23 @@ class DaskInterface(PandasInterface):
                 column = cls.replace_value(column, dimension.nodata)
             return dd.compute(column.min(), column.max())
 
+    @classmethod
+    def ranges(cls, dataset, dimensions):
+        import dask.dataframe as dd
+        dimensions = [dataset.get_dimension(d, strict=True) for d in dimensions]
+        ranges, extents = {}, {}
+        for dimension in dimensions:
+            column = dataset.data[dimension.name]
+            if column.dtype.kind == 'O':
+                ranges[dimension] = cls.range(dataset, dimension)
+                continue
+            if dimension.nodata is not None:
+                column = cls.replace_value(column, dimension.nodata)
+            extents[dimension] = (column.min(), column.max())
+        # Compute all extents in a single pass over the partitions
+        ranges.update(zip(extents, dd.compute(*extents.values())))
+        return {d: ranges[d] for d in dimensions}
+
     @classmethod
     def sort(cls, dataset, by=[], reverse=False):
         dataset.param.warning('Dask dataframes do not support sorting')
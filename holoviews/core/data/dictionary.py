@@ -318,8 +318,13 @@ class DictInterface(Interface):
     @classmethod
     def select(cls, dataset, selection_mask=None, **selection):
         if selection_mask is None:
-            selection_mask = cls.select_mask(dataset, selection)
-        empty = not selection_mask.sum()
+            selection_mask = cls.select_index(dataset, selection)
+        if isinstance(selection_mask, slice):
+            empty = selection_mask.stop <= selection_mask.start
+        elif selection_mask.dtype.kind in 'iu':
+            empty = not len(selection_mask)
+        else:
+            empty = not selection_mask.sum()
         dimensions = dataset.dimensions()
         if empty:
             return {d.name: np.array([], dtype=cls.dtype(dataset, d))
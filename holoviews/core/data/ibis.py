@@ -5,6 +5,7 @@ from functools import lru_cache
 from packaging.version import Version
 
 from .. import util
+from ..cache import nbytes, range_cache
 from ..element import Element
 from ..ndmapping import NdMapping, item_check, sorted_context
 from .interface import Interface
@@ -31,6 +32,12 @@ class IbisInterface(Interface):
 
     default_partitions = 100
 
+    lazy = True
+
+    # The maximum size in bytes of an executed query which is cached
+    # to answer subsequent lookups on the same query from memory
+    max_cached_bytes = 100 * 1024**2
+
     zero_indexed_backend_modules = [
         'ibis.backends.omniscidb.client',
     ]
@@ -96,6 +103,56 @@ class IbisInterface(Interface):
     def persist(cls, dataset):
         return cls.compute(dataset)
 
+    @classmethod
+    def materialized(cls, dataset):
+        """
+        Returns the in-memory version of the dataset if it has been
+        persisted or if the columns of its dimensions have already been
+        executed for this or another dataset wrapping the same query.
+        """
+        if dataset._cached is not None:
+            return dataset._cached
+        columns = dataset.dimensions(label='name')
+        executed = range_cache.lookup(dataset.data, 'ibis_executed')
+        if executed is None or not all(c in executed.columns for c in columns):
+            return None
+        dataset._cached = dataset.clone(executed, dataset=None, pipeline=None,
+                                        transforms=None)
+        return dataset._cached
+
+    @classmethod
+    def _execute(cls, dataset):
+        """
+        Executes the query projected onto the columns of the dataset
+        dimensions in a single round trip. Unless the result exceeds
+        max_cached_bytes it is cached so that subsequent lookups of
+        values, lengths and ranges on datasets wrapping the same query
+        are answered from memory.
+        """
+        columns = [c for c in dataset.dimensions(label='name')
+                   if c in dataset.data.columns]
+        executed = dataset.data[columns].execute()
+        materialized = dataset.clone(executed, dataset=None, pipeline=None,
+                                     transforms=None)
+        if nbytes(executed) <= cls.max_cached_bytes:
+            range_cache.set(dataset.data, 'ibis_executed', executed)
+            dataset._cached = materialized
+        else:
+            # Record that the projection is too large to be cached so
+            # that subsequent lookups only fetch the requested column
+            range_cache.set(dataset.data, ('ibis_uncached', tuple(columns)), True)
+        return materialized
+
+    @classmethod
+    def _uncached(cls, dataset):
+        """
+        Whether executing the projection of the query onto the columns
+        of the dataset dimensions previously exceeded max_cached_bytes.
+        """
+        columns = tuple(c for c in dataset.dimensions(label='name')
+                        if c in dataset.data.columns)
+        return bool(range_cache.lookup(dataset.data, ('ibis_uncached', columns)))
+
     @classmethod
     @cached
     def length(self, dataset):
@@ -127,6 +184,29 @@ class IbisInterface(Interface):
             dataset.data.aggregate([column.min(), column.max()]).execute().values[0, :]
         )
 
+    @classmethod
+    @cached
+    def ranges(cls, dataset, dimensions):
+        dimensions = [dataset.get_dimension(d, strict=True) for d in dimensions]
+        ranges, aggregates, numeric = {}, [], []
+        for dimension in dimensions:
+            if cls.dtype(dataset, dimension).kind in 'SUO':
+                ranges[dimension] = (None, None)
+            elif dimension.nodata is not None:
+                ranges[dimension] = Interface.range(dataset, dimension)
+            else:
+                column = dataset.data[dimension.name]
+                i = len(numeric)
+                aggregates += [column.min().name(f'hv_min_{i}'),
+                               column.max().name(f'hv_max_{i}')]
+                numeric.append(dimension)
+        if aggregates:
+            # Compute the extents of all columns in a single query
+            row = dataset.data.aggregate(aggregates).execute().values[0, :]
+            for i, dimension in enumerate(numeric):
+                ranges[dimension] = tuple(row[2*i:2*i+2])
+        return {d: ranges[d] for d in dimensions}
+
     @classmethod
     @cached
     def values(
@@ -138,10 +218,20 @@ class IbisInterface(Interface):
         compute=True,
         keep_index=False,
     ):
-        import ibis
-
         dimension = dataset.get_dimension(dimension, strict=True)
+        if compute and not keep_index and not cls._uncached(dataset):
+            # Fetch all columns the element may need in one query
+            executed = cls._execute(dataset)
+            return executed.interface.values(
+                executed, dimension, expanded=expanded, flat=flat
+            )
         data = dataset.data[dimension.name]
+        if compute and expanded and not keep_index:
+            # The projection is too large to be cached so only the
+            # requested column is fetched
+            return data.execute().values.flatten()
+
+        import ibis
         if (
             ibis_version() > Version("3")
             and isinstance(data, ibis.expr.types.AnyColumn)
@@ -184,7 +274,9 @@ class IbisInterface(Interface):
     @cached
     def dtype(cls, dataset, dimension):
         dimension = dataset.get_dimension(dimension)
-        return dataset.data.head(0).execute().dtypes[dimension.name]
+        dtypes = range_cache.get(dataset.data, 'ibis_dtypes',
+                                 lambda: dataset.data.head(0).execute().dtypes)
+        return dtypes[dimension.name]
 
     dimension_type = dtype
 
@@ -1,3 +1,4 @@
+import numbers
 import sys
 import warnings
 
@@ -5,9 +6,10 @@ import param
 import numpy as np
 
 from .. import util
+from ..cache import range_cache
 from ..element import Element
 from ..ndmapping import NdMapping
-from .util import finite_range
+from .util import finite_range, spatial_index
 
 
 class DataError(ValueError):
@@ -138,6 +140,11 @@ class Interface(param.Parameterized):
     # Whether the interface stores the names of the underlying dimensions
     named = True
 
+    # Whether the data is evaluated lazily or held outside host memory,
+    # i.e. whether operations should be applied to the native column
+    # objects rather than to materialized arrays
+    lazy = False
+
     @classmethod
     def loaded(cls):
         """
@@ -280,6 +287,15 @@ class Interface(param.Parameterized):
                             "dimensions, the following dimensions were "
                             "not found: %s" % repr(not_found), cls)
 
+    @classmethod
+    def materialized(cls, dataset):
+        """
+        Returns the in-memory version of a dataset backed by a lazy
+        interface if it has been evaluated, e.g. by Dataset.persist,
+        otherwise None.
+        """
+        return dataset._cached
+
     @classmethod
     def persist(cls, dataset):
         """
@@ -378,6 +394,127 @@ class Interface(param.Parameterized):
         return mask
 
 
+    @classmethod
+    def select_index(cls, dataset, selection):
+        """
+        Given a Dataset object and a dictionary with dimension keys and
+        selection keys return the selected rows as a slice or sorted
+        integer index if they can be determined without scanning all
+        rows (see select_slice and select_spatial), falling back to
+        a boolean mask computed by select_mask.
+        """
+        index = cls.select_slice(dataset, selection)
+        if index is None:
+            index = cls.select_spatial(dataset, selection)
+        if index is None:
+            index = cls.select_mask(dataset, selection)
+        return index
+
+
+    @classmethod
+    def _range_bounds(cls, dataset, dim, sel):
+        """
+        Returns the values along the dimension and the (start, stop)
+        bounds of a range selection (i.e. tuple or slice) converted to
+        the dtype of the values, or None if the selection is not a
+        numeric or datetime range.
+        """
+        if isinstance(sel, tuple) and len(sel) == 2:
+            sel = slice(*sel)
+        if not isinstance(sel, slice) or sel.step is not None:
+            return None
+        dim = dataset.get_dimension(dim)
+        if dim is None:
+            return None
+        arr = cls.values(dataset, dim)
+        if not isinstance(arr, np.ndarray) or arr.ndim != 1:
+            return None
+        bounds = (sel.start, sel.stop)
+        if arr.dtype.kind == 'M':
+            try:
+                sel = util.parse_datetime_selection(sel)
+                bounds = tuple(None if b is None else np.asarray(b, dtype=arr.dtype)
+                               for b in (sel.start, sel.stop))
+            except Exception:
+                return None
+        elif arr.dtype.kind not in 'uif' or not all(
+                b is None or (isinstance(b, numbers.Number) and not isinstance(b, bool))
+                for b in bounds):
+            return None
+        return arr, bounds
+
+
+    @classmethod
+    def select_slice(cls, dataset, selection):
+        """
+        Given a Dataset object and a dictionary with dimension keys and
+        range selections (i.e. tuples or slices) return a slice of the
+        rows in the Dataset that have been selected, computed using a
+        binary search. Returns None if any of the selections is not a
+        range or the values of a selected dimension are not sorted,
+        in which case select_mask should be used.
+        """
+        if not selection:
+            return None
+        start, stop = 0, len(dataset)
+        for dim, sel in selection.items():
+            range_bounds = cls._range_bounds(dataset, dim, sel)
+            if range_bounds is None:
+                return None
+            arr, bounds = range_bounds
+            if not cls.sorted(dataset, dim, arr):
+                return None
+            if bounds[0] is not None:
+                start = max(start, int(np.searchsorted(arr, bounds[0], side='left')))
+            if bounds[1] is not None:
+                stop = min(stop, int(np.searchsorted(arr, bounds[1], side='left')))
+        return slice(start, max(start, stop))
+
+
+    @classmethod
+    def select_spatial(cls, dataset, selection):
+        """
+        Given a Dataset object and a dictionary of range selections
+        along two numeric dimensions return the sorted integer index
+        of the selected rows, looked up from a cached spatial index
+        if enabled via hv.config.spatial_index. Returns None if the
+        spatial index is disabled or not applicable.
+        """
+        if not util.config.spatial_index or len(selection) != 2:
+            return None
+        ranges = [cls._range_bounds(dataset, dim, sel) for dim, sel in selection.items()]
+        if any(r is None for r in ranges):
+            return None
+        (xs, (x0, x1)), (ys, (y0, y1)) = ranges
+        index = spatial_index(xs, ys)
+        if index is None:
+            return None
+        return index.box(x0, x1, y0, y1)
+
+
+    @classmethod
+    def sorted(cls, dataset, dim, values=None):
+        """
+        Returns whether the values along the supplied dimension are
+        monotonically increasing and free of NaNs. If hv.config.cache_ranges
+        is enabled the result is cached for as long as the data is alive,
+        which assumes the data is not modified inplace.
+        """
+        dim = dataset.get_dimension(dim, strict=True)
+        if values is None:
+            values = cls.values(dataset, dim)
+        data = values if isinstance(dataset.data, dict) else dataset.data
+        def is_sorted():
+            if values.dtype.kind not in 'uifM':
+                return False
+            with warnings.catch_warnings():
+                warnings.filterwarnings('ignore', r'invalid value encountered')
+                return bool((values[1:] >= values[:-1]).all())
+        if not util.config.cache_ranges:
+            return is_sorted()
+        return range_cache.get(data, ('sorted', dim.name), is_sorted)
+
+
     @classmethod
     def indexed(cls, dataset, selection):
         """
@@ -410,6 +547,16 @@ class Interface(param.Parameterized):
                     return np.NaN, np.NaN
                 return column[0], column[-1]
 
+    @classmethod
+    def ranges(cls, dataset, dimensions):
+        """
+        Returns a dictionary of the ranges of the supplied dimensions.
+        Interfaces to lazy data may override this to compute all ranges
+        in a single pass over the data instead of one per dimension.
+        """
+        dimensions = [dataset.get_dimension(d, strict=True) for d in dimensions]
+        return {d: cls.range(dataset, d) for d in dimensions}
+
     @classmethod
     def concatenate(cls, datasets, datatype=None, new_type=None):
         """
@@ -332,7 +332,7 @@ class PandasInterface(Interface, PandasAPI):
     def select(cls, dataset, selection_mask=None, **selection):
         df = dataset.data
         if selection_mask is None:
-            selection_mask = cls.select_mask(dataset, selection)
+            selection_mask = cls.select_index(dataset, selection)
 
         indexed = cls.indexed(dataset, selection)
         if isinstance(selection_mask, pd.Series):
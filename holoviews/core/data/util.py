@@ -1,6 +1,7 @@
 import numpy as np
 
 from .. import util
+from ..cache import range_cache
 
 
 def finite_range(column, cmin, cmax):
@@ -60,10 +61,150 @@ def cached(method):
     Decorates an Interface method and using a cached version
     """
     def cached(*args, **kwargs):
-        cache = getattr(args[1], '_cached')
+        cache = args[0].materialized(args[1])
         if cache is None:
             return method(*args, **kwargs)
         else:
             args = (cache,)+args[2:]
             return getattr(cache.interface, method.__name__)(*args, **kwargs)
     return cached
+
+
+class SpatialIndex:
+    """
+    SpatialIndex buckets 2D points into the cells of a regular grid
+    spanning their bounds, so that box, polygon and nearest-point
+    queries only have to consider the points in the cells overlapping
+    the queried region. Points with non-finite coordinates are never
+    returned.
+    """
+
+    def __init__(self, xs, ys, points_per_cell=64):
+        self.xs, self.ys = xs, ys
+        valid = np.ones(len(xs), dtype=bool)
+        for vals in (xs, ys):
+            if vals.dtype.kind == 'f':
+                valid &= np.isfinite(vals)
+        n_valid = int(valid.sum())
+        # Limit the number of cells so the cell ids fit into 16-bit
+        # integers, which numpy sorts in linear time using radix sort
+        ncells = min(max(1, int(np.sqrt(n_valid / points_per_cell))), 255)
+        self.shape = (ncells, ncells)
+        if n_valid:
+            self.bounds = (xs[valid].min(), ys[valid].min(), xs[valid].max(), ys[valid].max())
+        else:
+            self.bounds = (0, 0, 0, 0)
+        cells = (self._cell(ys, 1) * ncells + self._cell(xs, 0)).astype(np.uint16)
+        # Invalid points are sorted into a trailing bucket
+        cells[~valid] = ncells * ncells
+        self.order = np.argsort(cells, kind='stable')
+        self.offsets = np.concatenate([[0], np.cumsum(
+            np.bincount(cells, minlength=ncells * ncells + 1)[:ncells * ncells])])
+
+    def _cell(self, values, axis):
+        """
+        Returns the index of the cell containing each value along the
+        x (0) or y (1) axis.
+        """
+        low, high = self.bounds[axis], self.bounds[axis+2]
+        n = self.shape[1-axis]
+        values = np.asarray(values, dtype=np.float64)
+        if not high > low:
+            # All points lie in the first cell along a degenerate axis
+            return np.zeros(values.shape, dtype=np.int64)
+        # Clamp to the data extent first so infinite bounds do not
+        # overflow, non-finite values are assigned to the first cell
+        cells = (np.clip(np.nan_to_num(values, nan=low), low, high) - low) * (n / (high - low))
+        np.clip(cells, 0, n-1, out=cells)
+        # Values are non-negative so truncation is equivalent to floor
+        return cells.astype(np.int64)
+
+    def _ranges(self, cx0, cx1, cy0, cy1):
+        """
+        Returns the start and end offsets into the sorted order of the
+        points in each row of the supplied cell range.
+        """
+        rows = np.arange(cy0, cy1+1) * self.shape[1]
+        return self.offsets[rows + cx0], self.offsets[rows + cx1 + 1]
+
+    def _candidates(self, starts, ends):
+        return np.concatenate([self.order[s:e] for s, e in zip(starts, ends)])
+
+    def box(self, x0=None, x1=None, y0=None, y1=None, closed='left'):
+        """
+        Returns the sorted indexes of the points within the box. By
+        default the upper bounds are exclusive, matching range
+        selections, while closed='both' includes them. Bounds of None
+        are unbounded.
+        """
+        bx0, by0, bx1, by1 = self.bounds
+        x0, y0 = (-np.inf if v is None else v for v in (x0, y0))
+        x1, y1 = (np.inf if v is None else v for v in (x1, y1))
+        if x1 < bx0 or x0 > bx1 or y1 < by0 or y0 > by1 or x0 > x1 or y0 > y1:
+            return np.array([], dtype=np.int64)
+        starts, ends = self._ranges(*self._cell([x0, x1], 0), *self._cell([y0, y1], 1))
+        n = len(self.xs)
+        if (ends - starts).sum() > n // 8:
+            # Scanning all points is cheaper than gathering the candidates
+            xs, ys, candidates = self.xs, self.ys, None
+        else:
+            candidates = self._candidates(starts, ends)
+            xs, ys = self.xs[candidates], self.ys[candidates]
+        with np.errstate(invalid='ignore'):
+            mask = (xs >= x0) & (ys >= y0)
+            if closed == 'both':
+                mask &= (xs <= x1) & (ys <= y1)
+            else:
+                mask &= (xs < x1) & (ys < y1)
+        if candidates is None:
+            return np.flatnonzero(mask)
+        return np.sort(candidates[mask])
+
+    def nearest(self, x, y):
+        """
+        Returns the index of the point closest to the supplied
+        coordinate or None if there are no valid points.
+        """
+        if not self.offsets[-1]:
+            return None
+        cx, cy = self._cell([x], 0)[0], self._cell([y], 1)[0]
+        ny, nx = self.shape
+        radius = 0
+        while True:
+            starts, ends = self._ranges(max(cx-radius, 0), min(cx+radius, nx-1),
+                                        max(cy-radius, 0), min(cy+radius, ny-1))
+            if (ends - starts).any():
+                break
+            radius += 1
+        # Closer points may lie in cells outside the searched ring
+        candidates = self._candidates(starts, ends)
+        dists = (self.xs[candidates] - x)**2 + (self.ys[candidates] - y)**2
+        dist = np.sqrt(dists.min())
+        candidates = self.box(x-dist, x+dist, y-dist, y+dist, closed='both')
+        dists = (self.xs[candidates] - x)**2 + (self.ys[candidates] - y)**2
+        return candidates[dists.argmin()]
+
+
+def spatial_index(xs, ys):
+    """
+    Returns a SpatialIndex of the supplied numeric coordinate arrays
+    (or pandas Series) if enabled via hv.config.spatial_index, or None
+    otherwise. The index is cached on the array owning the memory of
+    the x-coordinates, e.g. the block of a DataFrame, and therefore
+    assumes the data is not modified inplace.
+    """
+    if not util.config.spatial_index:
+        return None
+    xs, ys = np.asarray(xs), np.asarray(ys)
+    if (xs.ndim != 1 or ys.shape != xs.shape or xs.dtype.kind not in 'uif'
+        or ys.dtype.kind not in 'uif'):
+        return None
+    owner = xs
+    while isinstance(owner.base, np.ndarray):
+        owner = owner.base
+    # The index holds references to both arrays so the memory they
+    # point to cannot be reused while the cache entry is alive
+    key = ('spatial_index',) + tuple(
+        (arr.__array_interface__['data'][0], arr.strides, arr.dtype.str)
+        for arr in (xs, ys)) + (len(xs),)
+    return range_cache.get(owner, key, lambda: SpatialIndex(xs, ys))
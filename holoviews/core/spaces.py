@@ -1,10 +1,14 @@
+import asyncio
+import inspect
 import itertools
+import pickle
 import types
 
 from numbers import Number
 from itertools import groupby
 from functools import partial
 from collections import defaultdict
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from contextlib import contextmanager
 from types import FunctionType
 
@@ -13,6 +17,7 @@ import param
 
 from . import traversal, util
 from .accessors import Opts, Redim
+from .cache import CachePolicy, DiskCache
 from .dimension import OrderedDict, Dimension, ViewableElement
 from .layout import Layout, AdjointLayout, NdLayout, Empty, Layoutable
 from .ndmapping import UniformNdMapping, NdMapping, item_check
@@ -425,6 +430,27 @@ class HoloMap(Layoutable, UniformNdMapping, Overlayable):
             return histmaps[0]
 
 
+class _NotCached: pass
+
+
+_executors = {}
+
+def get_executor(executor):
+    """
+    Returns the supplied concurrent.futures.Executor or, if 'thread' or
+    'process' is supplied, a shared thread or process pool.
+    """
+    if isinstance(executor, Executor):
+        return executor
+    elif executor not in ('thread', 'process'):
+        raise ValueError(f"Executor must be a concurrent.futures.Executor, "
+                         f"'thread' or 'process', not {executor!r}.")
+    elif executor not in _executors:
+        pool = ThreadPoolExecutor if executor == 'thread' else ProcessPoolExecutor
+        _executors[executor] = pool()
+    return _executors[executor]
+
+
 class Callable(param.Parameterized):
     """
     Callable allows wrapping callbacks on one or more DynamicMaps
@@ -493,15 +519,43 @@ class Callable(param.Parameterized):
          Defines how streams should be mapped to objects returned by
          the Callable, e.g. when it returns a Layout.""")
 
+    disk_cache = param.ClassSelector(class_=DiskCache, default=None, doc="""
+         Optional DiskCache used to persist the return values of the
+         callable to disk, keyed on the callable and the arguments it
+         is called with, so they can be reloaded instead of being
+         recomputed, e.g. after restarting the kernel or server.""")
+
+    executor = param.ClassSelector(class_=(str, Executor), default=None, doc="""
+         Optional executor to offload calls to the callable to, either
+         a concurrent.futures.Executor or 'thread' or 'process' to use
+         a shared thread or process pool. When evaluated by a plot
+         running on a server, the plot awaits the result without
+         blocking the event loop and discards results which have been
+         superseded by newer events. A DynamicMap also uses it to
+         evaluate the callable for multiple keys concurrently, e.g.
+         when indexing it with lists of values, laying it out with
+         the layout or grid methods or saving it, and DynamicMaps
+         derived from it, e.g. using opts or redim, inherit it. A
+         process pool requires the callable to be
+         picklable, otherwise the shared thread pool is used instead.
+         Coroutine functions are always awaited on the event loop.""")
+
     def __init__(self, callable, **params):
         super().__init__(callable=callable,
                          **dict(params, name=util.callable_name(callable)))
         self._memoized = {}
+        self._prefetched = {}
         self._is_overlay = False
         self.args = None
         self.kwargs = None
         self._stream_memoization = self.memoize
 
+    @property
+    def is_async(self):
+        "Whether calls to the callable are awaited or offloaded to an executor"
+        return self.executor is not None or inspect.iscoroutinefunction(self.callable)
+
+
     @property
     def argspec(self):
         return util.argspec(self.callable)
@@ -546,7 +600,107 @@ class Callable(param.Parameterized):
         # Nothing to do for callbacks that accept no arguments
         kwarg_hash = kwargs.pop('_memoization_hash_', ())
         (self.args, self.kwargs) = (args, kwargs)
-        if not args and not kwargs and not any(kwarg_hash): return self.callable()
+        if not args and not kwargs and not any(kwarg_hash):
+            return self._resolve(self.callable())
+        hashed_key, _, args, kwargs, disk_key, ret = self._lookup(args, kwargs, kwarg_hash)
+        if ret is not _NotCached:
+            return ret
+        try:
+            ret = self._resolve(self.callable(*args, **kwargs))
+        except Exception as e:
+            self._warn_error(e)
+            raise
+        return self._record(hashed_key, disk_key, ret)
+
+
+    async def call_async(self, *args, **kwargs):
+        """Calls the callable function with supplied args and kwargs
+        without blocking the event loop.
+
+        Coroutine functions are awaited and, if an executor is
+        declared, other callables are run on the executor. The return
+        value is prefetched, i.e. a subsequent (synchronous) call with
+        the same arguments returns it without calling the function
+        again, irrespective of the memoization settings.
+
+        Args:
+            *args: Arguments passed to the callable function
+            **kwargs: Keyword arguments passed to the callable function
+
+        Returns:
+            Return value of the wrapped callable function
+        """
+        kwarg_hash = kwargs.pop('_memoization_hash_', ())
+        (self.args, self.kwargs) = (args, kwargs)
+        hashed_key, call_key, args, kwargs, disk_key, ret = self._lookup(
+            args, kwargs, kwarg_hash, prefetch=True)
+        if ret is _NotCached:
+            try:
+                if inspect.iscoroutinefunction(self.callable):
+                    ret = await self.callable(*args, **kwargs)
+                elif self.executor is not None:
+                    loop = asyncio.get_running_loop()
+                    fn = partial(self.callable, *args, **kwargs)
+                    ret = await loop.run_in_executor(self._get_executor(), fn)
+                else:
+                    ret = self.callable(*args, **kwargs)
+            except Exception as e:
+                self._warn_error(e)
+                raise
+            ret = self._record(hashed_key, disk_key, ret)
+        self._prefetched = {call_key: ret}
+        return ret
+
+
+    def _get_executor(self, obj=None):
+        """
+        Returns the executor to submit the object (by default the
+        wrapped callable) to, falling back to the shared thread pool
+        if it cannot be pickled to submit it to a process pool.
+        """
+        executor = get_executor(self.executor)
+        if isinstance(executor, ProcessPoolExecutor):
+            try:
+                pickle.dumps(self.callable if obj is None else obj)
+            except Exception as e:
+                self.param.warning(
+                    f'Callable {self.name!r} could not be pickled to evaluate it '
+                    f'in a process pool ({e!r}), using a thread pool instead.')
+                executor = get_executor('thread')
+        return executor
+
+
+    def _resolve(self, ret):
+        """
+        Resolves coroutines returned by the callable by running them
+        to completion. Blocking on a coroutine while this thread is
+        running an event loop would stall the loop, so in that case
+        the callable has to be awaited using call_async instead.
+        """
+        if inspect.iscoroutine(ret):
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                return asyncio.run(ret)
+            ret.close()
+            raise RuntimeError(
+                f'Callable {self.name!r} returned a coroutine while an event '
+                'loop is running in this thread, it cannot be evaluated '
+                'synchronously without blocking the loop. Await '
+                'Callable.call_async instead, e.g. build plots with '
+                'Renderer.get_plot_async or supply a placeholder frame '
+                'as the initial_items of the DynamicMap.')
+        return ret
+
+
+    def _lookup(self, args, kwargs, kwarg_hash, prefetch=False):
+        """
+        Computes the memoization key and looks the call up in the
+        prefetched, memoized and disk cached values, returning the
+        memoization key, the hash of the call, the arguments to call
+        the function with, the disk cache key and the cached value (or
+        _NotCached).
+        """
         inputs = [i for i in self.inputs if isinstance(i, DynamicMap)]
         streams = []
         for stream in [s for i in inputs for s in get_nested_streams(i)]:
@@ -556,9 +710,17 @@ class Callable(param.Parameterized):
         values = tuple(tuple(sorted(s.hashkey.items())) for s in streams)
         key = args + kwarg_hash + values
 
-        hashed_key = util.deephash(key) if self.memoize else None
+        call_key = None
+        if self.memoize or self._prefetched or prefetch:
+            call_key = util.deephash(key)
+        if self._prefetched and not prefetch:
+            # Prefetched values are only consumed once
+            prefetched, self._prefetched = self._prefetched, {}
+            if call_key in prefetched:
+                return call_key, call_key, args, kwargs, None, prefetched[call_key]
+        hashed_key = call_key if self.memoize else None
         if hashed_key is not None and memoize and hashed_key in self._memoized:
-            return self._memoized[hashed_key]
+            return hashed_key, call_key, args, kwargs, None, self._memoized[hashed_key]
 
         if self.argspec.varargs is not None:
             # Missing information on positional argument names, cannot promote to keywords
@@ -575,26 +737,43 @@ class Callable(param.Parameterized):
                     f'Positional arguments {list(clashes)!r} overridden by keywords')
             args, kwargs = (), dict(pos_kwargs, **kwargs)
 
-        try:
-            ret = self.callable(*args, **kwargs)
-        except KeyError:
-            # KeyError is caught separately because it is used to signal
-            # invalid keys on DynamicMap and should not warn
-            raise
-        except Exception as e:
-            posstr = ', '.join([f'{el!r}' for el in self.args]) if self.args else ''
-            kwstr = ', '.join(f'{k}={v!r}' for k,v in self.kwargs.items())
-            argstr = ', '.join([el for el in [posstr, kwstr] if el])
-            message = ("Callable raised \"{e}\".\n"
-                       "Invoked as {name}({argstr})")
-            self.param.warning(message.format(name=self.name, argstr=argstr, e=repr(e)))
-            raise
+        disk_key = None
+        if self.disk_cache is not None:
+            disk_key = self.disk_cache.key(self.callable, args, kwargs)
+            if disk_key is not None and disk_key in self.disk_cache:
+                try:
+                    ret = self.disk_cache.load(disk_key)
+                except Exception as e:
+                    self.param.warning(f'Could not load cached value from disk: {e!r}')
+                else:
+                    if hashed_key is not None:
+                        self._memoized = {hashed_key : ret}
+                    return hashed_key, call_key, args, kwargs, None, ret
+        return hashed_key, call_key, args, kwargs, disk_key, _NotCached
+
 
+    def _record(self, hashed_key, disk_key, ret):
+        "Records the return value in the memoization and disk caches"
         if hashed_key is not None:
             self._memoized = {hashed_key : ret}
+        if disk_key is not None:
+            self.disk_cache.store(disk_key, ret)
         return ret
 
 
+    def _warn_error(self, e):
+        # KeyError is not warned about because it is used to signal
+        # invalid keys on DynamicMap
+        if isinstance(e, KeyError):
+            return
+        posstr = ', '.join([f'{el!r}' for el in self.args]) if self.args else ''
+        kwstr = ', '.join(f'{k}={v!r}' for k,v in self.kwargs.items())
+        argstr = ', '.join([el for el in [posstr, kwstr] if el])
+        message = ("Callable raised \"{e}\".\n"
+                   "Invoked as {name}({argstr})")
+        self.param.warning(message.format(name=self.name, argstr=argstr, e=repr(e)))
+
+
 
 class Generator(Callable):
     """
@@ -758,6 +937,14 @@ class DynamicMap(HoloMap):
        cache where the least recently used item is overwritten once
        the cache is full.""")
 
+    cache_policy = param.ClassSelector(class_=CachePolicy, default=None, doc="""
+       Optional CachePolicy determining which cached entries are
+       evicted, e.g. an LRUCachePolicy or LFUCachePolicy with limits
+       on the number of items, the number of bytes held by the
+       cached elements and the age of entries. The policy also
+       records cache hits, misses and evictions. If set on the class
+       every DynamicMap receives its own copy of the policy.""")
+
     positional_stream_args = param.Boolean(default=False, constant=True, doc="""
        If False, stream parameters are passed to the callback as keyword arguments.
        If True, stream parameters are passed to callback as positional arguments.
@@ -766,7 +953,7 @@ class DynamicMap(HoloMap):
        and they are ordered to match the order of the DynamicMap's streams list.
     """)
 
-    def __init__(self, callback, initial_items=None, streams=None, **params):
+    def __init__(self, callback, initial_items=None, streams=None, executor=None, **params):
         streams = (streams or [])
         if isinstance(streams, dict):
             streams = streams_list_from_dict(streams)
@@ -779,7 +966,9 @@ class DynamicMap(HoloMap):
         if isinstance(callback, types.GeneratorType):
             callback = Generator(callback)
         elif not isinstance(callback, Callable):
-            callback = Callable(callback)
+            callback = Callable(callback, executor=executor)
+        elif executor is not None:
+            callback = callback.clone(executor=executor)
 
         valid, invalid = Stream._process_streams(streams)
         if invalid:
@@ -955,6 +1144,85 @@ class DynamicMap(HoloMap):
 
     def _execute_callback(self, *args):
         "Executes the callback with the appropriate args and kwargs"
+        args, kwargs = self._callback_args(args)
+        with dynamicmap_memoization(self.callback, self.streams):
+            retval = self.callback(*args, **kwargs)
+        return self._style(retval)
+
+
+    def _execute_callbacks(self, keys):
+        """
+        Executes the callback for each of the supplied keys, fanning
+        the calls out to the executor of the callback if one is
+        declared, and returns the values in the order of the keys.
+        Each concurrent call is made on its own clone of the callback
+        so the calls do not share their arguments and memoization
+        state.
+        """
+        callback = self.callback
+        if len(keys) > 1:
+            # Evaluate the keys on the DynamicMaps an operation is applied
+            # to first, so they are evaluated using their executors
+            for dmap in callback.inputs:
+                if isinstance(dmap, DynamicMap) and dmap is not self and dmap.kdims == self.kdims:
+                    dmap._precompute(keys)
+        if callback.executor is None or len(keys) < 2 or isinstance(callback, Generator):
+            return [self._execute_callback(*key) for key in keys]
+        with dynamicmap_memoization(callback, self.streams):
+            calls = []
+            for key in keys:
+                args, kwargs = self._callback_args(key)
+                clone = callback.clone()
+                clone._memoized = callback._memoized
+                clone._stream_memoization = callback._stream_memoization
+                calls.append((clone, args, kwargs))
+            executor = callback._get_executor(calls[0][0])
+            futures = [executor.submit(clone, *args, **kwargs)
+                       for clone, args, kwargs in calls]
+            try:
+                values = [future.result() for future in futures]
+            finally:
+                for future in futures:
+                    future.cancel()
+        return [self._style(val) for val in values]
+
+
+    def _precompute(self, keys):
+        """
+        Evaluates the callback for the supplied keys which have not
+        been cached using _execute_callbacks and caches the values.
+        Skipped if the cache is disabled by dimensionless streams or
+        cannot hold all the values.
+        """
+        dimensionless = util.dimensionless_contents(get_nested_streams(self),
+                                                    self.kdims, no_duplicates=False)
+        policy = self.cache_policy
+        cache_size = self.cache_size
+        if policy is not None and policy.max_items is not None:
+            cache_size = policy.max_items
+        if dimensionless or not self.kdims or len(keys) > cache_size:
+            return
+        keys = [util.wrap_tuple(key) for key in keys]
+        missing = [key for key in keys if key not in self.data or self._cache_expired(key)]
+        for key, val in zip(missing, self._execute_callbacks(missing)):
+            self._cache(key, val)
+
+
+    async def _execute_callback_async(self, *args):
+        """
+        Executes the callback without blocking the event loop, the
+        result is prefetched by the callback so that subsequently
+        indexing the DynamicMap with the same key does not call the
+        callback again.
+        """
+        args, kwargs = self._callback_args(args)
+        with dynamicmap_memoization(self.callback, self.streams):
+            retval = await self.callback.call_async(*args, **kwargs)
+        return self._style(retval)
+
+
+    def _callback_args(self, args):
+        "Validates the key and returns the args and kwargs for the callback"
         self._validate_key(args)      # Validate input key
 
         # Additional validation needed to ensure kwargs don't clash
@@ -974,10 +1242,7 @@ class DynamicMap(HoloMap):
             kwargs = dict(flattened)
         if not isinstance(self.callback, Generator):
             kwargs['_memoization_hash_'] = hash_items
-
-        with dynamicmap_memoization(self.callback, self.streams):
-            retval = self.callback(*args, **kwargs)
-        return self._style(retval)
+        return args, kwargs
 
 
     def options(self, *args, **kwargs):
@@ -1042,6 +1307,8 @@ class DynamicMap(HoloMap):
             data = self.data
             if link and callback is self.callback:
                 overrides['plot_id'] = self._plot_id
+        if self.cache_policy is not None and 'cache_policy' not in overrides:
+            overrides['cache_policy'] = self.cache_policy.clone()
         clone = super(UniformNdMapping, self).clone(
             callback, shared_data, new_type, link,
             *(data,) + args, **overrides)
@@ -1062,6 +1329,8 @@ class DynamicMap(HoloMap):
     def reset(self):
         "Clear the DynamicMap cache"
         self.data = OrderedDict()
+        if self.cache_policy is not None:
+            self.cache_policy.clear()
         return self
 
 
@@ -1088,16 +1357,25 @@ class DynamicMap(HoloMap):
                     else {el} for el in tuple_key]
             product = itertools.product(*args)
 
-        data = []
+        data, missing = [], []
         for inner_key in product:
             key = util.wrap_tuple(inner_key)
-            if key in cache:
+            if key in cache and not self._cache_expired(key):
                 val = cache[key]
+                if self.cache_policy is not None:
+                    self.cache_policy.hit(self._cache_key(key))
             else:
-                val = self._execute_callback(*key)
-            if data_slice:
-                val = self._dataslice(val, data_slice)
+                val = None
+                missing.append(len(data))
+                if self.cache_policy is not None:
+                    self.cache_policy.miss(self._cache_key(key))
             data.append((key, val))
+
+        values = self._execute_callbacks([data[i][0] for i in missing])
+        for i, val in zip(missing, values):
+            data[i] = (data[i][0], val)
+        if data_slice:
+            data = [(key, self._dataslice(val, data_slice)) for key, val in data]
         product = self.clone(data)
 
         if data_slice:
@@ -1198,6 +1476,8 @@ class DynamicMap(HoloMap):
             empty = self._stream_parameters() == [] and self.kdims==[]
             if dimensionless or empty:
                 raise KeyError('Using dimensionless streams disables DynamicMap cache')
+            if self._cache_expired(tuple_key):
+                raise KeyError('Cached entry has expired')
             cache = super().__getitem__(key)
         except KeyError:
             cache = None
@@ -1208,7 +1488,13 @@ class DynamicMap(HoloMap):
             return product
 
         # Not a cross product and nothing cached so compute element.
-        if cache is not None: return cache
+        policy = self.cache_policy
+        if cache is not None:
+            if policy is not None:
+                policy.hit(self._cache_key(tuple_key))
+            return cache
+        elif policy is not None:
+            policy.miss(self._cache_key(tuple_key))
         val = self._execute_callback(*tuple_key)
         if data_slice:
             val = self._dataslice(val, data_slice)
@@ -1275,6 +1561,32 @@ class DynamicMap(HoloMap):
             return dmap
 
 
+    def _cache_key(self, key):
+        """
+        Returns the key under which an entry is stored in the cache,
+        applying the key dimension types.
+        """
+        dim_types = [kd.type for kd in self.kdims]
+        return tuple(v if None in (t, v) else t(v) for t, v in zip(dim_types, key))
+
+
+    def _cache_expired(self, key):
+        """
+        Whether the cached entry for the key has expired according
+        to the cache policy, evicting it if it has.
+        """
+        policy = self.cache_policy
+        if policy is None or any(isinstance(k, (list, set, slice)) for k in key):
+            return False
+        key = self._cache_key(key)
+        if not policy.expired(key):
+            return False
+        self.data.pop(key, None)
+        policy.discard(key)
+        policy.evictions += 1
+        return True
+
+
     def _cache(self, key, val):
         """
         Request that a key/value pair be considered for caching.
@@ -1282,6 +1594,16 @@ class DynamicMap(HoloMap):
         cache_size = (1 if util.dimensionless_contents(
             self.streams, self.kdims, no_duplicates=not self.positional_stream_args)
                       else self.cache_size)
+        policy = self.cache_policy
+        if policy is not None:
+            if cache_size != 1 and policy.max_items is not None:
+                cache_size = policy.max_items
+            self[key] = val
+            key = self._cache_key(key)
+            policy.add(key, val)
+            for evicted in policy.evict(self.data, cache_size, keep=key):
+                self.data.pop(evicted, None)
+            return
         if len(self) >= cache_size:
             first_key = next(k for k in self.data)
             self.data.pop(first_key)
@@ -1561,6 +1883,13 @@ class DynamicMap(HoloMap):
         else:
             outer_product = itertools.product(*[self.get_dimension(d).values
                                                 for d in dimensions])
+            lazy = inner_dynamic and (inner_kdims or self.streams)
+            if not lazy:
+                # Evaluate all groups at once, so the keys are evaluated
+                # concurrently if the callback declares an executor
+                with item_check(False):
+                    evaluated = HoloMap(self.select(**{d.name: list(d.values)
+                                                       for d in self.kdims}))
             groups = []
             for outer in outer_product:
                 outer_vals = [(d.name, [o]) for d, o in zip(outer_kdims, outer)]
@@ -1569,20 +1898,20 @@ class DynamicMap(HoloMap):
                         inner_dims = zip(inner_kdims, util.wrap_tuple(key))
                         inner_vals = [(d.name, k) for d, k in inner_dims]
                         return self.select(**dict(outer_vals+inner_vals)).last
-                    if inner_kdims or self.streams:
+                    if lazy:
                         callback = Callable(partial(inner_fn, outer_vals),
                                             inputs=[self])
                         group = self.clone(
                             callback=callback, kdims=inner_kdims
                         )
                     else:
-                        group = inner_fn(outer_vals, ())
+                        group = evaluated.select(**dict(outer_vals)).last
                     groups.append((outer, group))
                 else:
                     inner_vals = [(d.name, self.get_dimension(d).values)
                                      for d in inner_kdims]
                     with item_check(False):
-                        selected = HoloMap(self.select(**dict(outer_vals+inner_vals)))
+                        selected = evaluated.select(**dict(outer_vals+inner_vals))
                         group = group_type(selected.reindex(inner_kdims))
                     groups.append((outer, group))
             return container_type(groups, kdims=outer_kdims)
@@ -135,6 +135,36 @@ class Config(param.ParameterizedFunction):
        Global default colormap for HeatMap elements. Prior to HoloViews
        1.14.0, the default value was the 'RdYlBu_r' colormap.""")
 
+    spatial_index = param.Boolean(default=False, doc="""
+       Whether to build a spatial index of the coordinates of 2D point
+       data the first time they are queried by a 2D range selection,
+       lasso selection or closest lookup. The index is cached for as
+       long as the data is alive, making subsequent queries scale with
+       the number of points in the queried region rather than the
+       size of the data, at the cost of the initial build.""")
+
+    cache_ranges = param.Boolean(default=False, doc="""
+       Whether plots should memoize the ranges computed for the data of
+       an element, keyed on the identity of the data object, so that
+       elements sharing the same data, e.g. across the frames of a
+       HoloMap, overlay layers or linked plots, do not rescan it. Also
+       memoizes whether dimensions are sorted, which allows range
+       selections to use a binary search without checking the order of
+       the values, and the most recent datashader aggregate of the
+       data, which is reused when only shading parameters change. Data modified inplace is only rescanned if it is
+       sent through a Pipe or Buffer stream or if
+       hv.core.cache.range_cache.invalidate is called on it, otherwise
+       stale ranges are displayed and stale selections are returned.""")
+
+    compile_transforms = param.Boolean(default=False, doc="""
+       Whether to compile dim expressions consisting solely of
+       elementwise operations on numeric columns, e.g. style mappings
+       such as dim('z').norm()*255 or selection expressions, into a
+       fused evaluator. The compiled form is cached on the expression
+       and evaluated with numexpr if it is installed, otherwise NumPy
+       operations reuse intermediate buffers rather than allocating a
+       new array per operation.""")
+
     def __call__(self, **params):
         self.param.update(**params)
         return self
@@ -172,6 +202,10 @@ class HashableJSON(json.JSONEncoder):
     string_hashable = (dt.datetime,)
     repr_hashable = ()
 
+    # Whether large arrays and pandas objects are hashed by a sample
+    # of their values rather than their full contents
+    sample_large = True
+
     def default(self, obj):
         if isinstance(obj, set):
             return hash(frozenset(obj))
@@ -179,13 +213,13 @@ class HashableJSON(json.JSONEncoder):
             h = hashlib.new("md5")
             for s in obj.shape:
                 h.update(_int_to_bytes(s))
-            if obj.size >= _NP_SIZE_LARGE:
+            if self.sample_large and obj.size >= _NP_SIZE_LARGE:
                 state = np.random.RandomState(0)
                 obj = state.choice(obj.flat, size=_NP_SAMPLE_SIZE)
             h.update(obj.tobytes())
             return h.hexdigest()
         if isinstance(obj, (pd.Series, pd.DataFrame)):
-            if len(obj) > _PANDAS_ROWS_LARGE:
+            if self.sample_large and len(obj) > _PANDAS_ROWS_LARGE:
                 obj = obj.sample(n=_PANDAS_SAMPLE_SIZE, random_state=0)
             try:
                 pd_values = list(pd.util.hash_pandas_object(obj, index=True).values)
@@ -216,6 +250,38 @@ class HashableJSON(json.JSONEncoder):
             return id(obj)
 
 
+class StableHashableJSON(HashableJSON):
+    """
+    Variant of HashableJSON which only accepts objects that have a
+    representation which is stable across interpreter sessions,
+    raising a TypeError for objects that HashableJSON would represent
+    by their hash or id. Arrays and pandas objects are hashed by their
+    full contents, since the digests are used as persistent keys.
+    """
+
+    sample_large = False
+
+    def default(self, obj):
+        if isinstance(obj, (set, frozenset)):
+            return sorted(obj, key=repr)
+        elif isinstance(obj, np.generic):
+            return obj.item()
+        elif isinstance(obj, np.ndarray):
+            h = hashlib.sha1(repr((obj.shape, obj.dtype.str)).encode('utf-8'))
+            if obj.dtype.kind == 'O':
+                # The bytes of object arrays are pointers so hash the values
+                h.update(pd.util.hash_array(obj.ravel()).tobytes())
+            else:
+                h.update(np.ascontiguousarray(obj).reshape(-1).view(np.uint8))
+            return h.hexdigest()
+        elif isinstance(obj, (pd.Series, pd.DataFrame) +
+                        self.string_hashable + self.repr_hashable):
+            return super().default(obj)
+        elif isinstance(obj, (dt.date, dt.time, dt.timedelta, np.datetime64, pd.Timestamp)):
+            return str(obj)
+        raise TypeError(f'{type(obj).__name__} object cannot be hashed stably.')
+
+
 def merge_option_dicts(old_opts, new_opts):
     """
     Update the old_opts option dictionary with the options defined in
@@ -370,6 +436,20 @@ def deephash(obj):
         return None
 
 
+def stablehash(obj):
+    """
+    Given an object, return a hex digest of its StableHashableJSON
+    representation. Unlike deephash the digest is stable across
+    interpreter sessions, making it suitable for persistent caches.
+    Returns None if the object cannot be hashed stably.
+    """
+    try:
+        encoded = json.dumps(obj, cls=StableHashableJSON, sort_keys=True)
+    except Exception:
+        return None
+    return hashlib.sha1(encoded.encode('utf-8')).hexdigest()
+
+
 def tree_attribute(identifier):
     """
     Predicate that returns True for custom attributes added to AttrTrees
@@ -9,6 +9,7 @@ import numpy as np
 import pandas as pd
 
 from ..core import Dataset, NdOverlay, util
+from ..core.data.util import spatial_index
 from ..streams import SelectionXY, Selection1D, Lasso
 from ..util.transform import dim
 from .annotation import HSpan, VSpan
@@ -116,9 +117,20 @@ def spatial_select_columnar(xvals, yvals, geometry):
                 yvals = np.asarray(yvals)
     x0, x1 = geometry[:, 0].min(), geometry[:, 0].max()
     y0, y1 = geometry[:, 1].min(), geometry[:, 1].max()
-    sel_mask = (xvals>=x0) & (xvals<=x1) & (yvals>=y0) & (yvals<=y1)
-    masked_xvals = xvals[sel_mask]
-    masked_yvals = yvals[sel_mask]
+    index = spatial_index(xvals, yvals)
+    if index is None:
+        sel_mask = (xvals>=x0) & (xvals<=x1) & (yvals>=y0) & (yvals<=y1)
+        candidates = np.where(sel_mask)[0]
+        masked_xvals = xvals[sel_mask]
+        masked_yvals = yvals[sel_mask]
+    else:
+        # Look up the points within the bounding box from the index
+        candidates = index.box(x0, x1, y0, y1, closed='both')
+        masked_xvals = index.xs[candidates]
+        masked_yvals = index.ys[candidates]
+        sel_mask = np.zeros(len(xvals), dtype=bool)
+        if isinstance(xvals, pd.Series):
+            sel_mask = pd.Series(sel_mask, index=xvals.index)
     try:
         from spatialpandas.geometry import Polygon, PointArray
         points = PointArray((masked_xvals.astype('float'), masked_yvals.astype('float')))
@@ -134,9 +146,9 @@ def spatial_select_columnar(xvals, yvals, geometry):
             raise ImportError("Lasso selection on tabular data requires "
                               "either spatialpandas or shapely to be available.")
     if isinstance(xvals, pd.Series):
-        sel_mask[sel_mask.index[np.where(sel_mask)[0]]] = geom_mask
+        sel_mask[sel_mask.index[candidates]] = geom_mask
     else:
-        sel_mask[np.where(sel_mask)[0]] = geom_mask
+        sel_mask[candidates] = geom_mask
     return sel_mask
 
 
@@ -1,4 +1,8 @@
+import asyncio
+import math
+import threading
 import warnings
+import weakref
 
 from collections import OrderedDict
 from collections.abc import Callable, Iterable
@@ -26,18 +30,21 @@ except ImportError:
 from ..core import (
     CompositeOverlay, Dimension, Element, Operation, Overlay, NdOverlay, Store
 )
+from ..core.cache import LRUCachePolicy, range_cache
 from ..core.data import (
     Dataset, PandasInterface, XArrayInterface, DaskInterface, cuDFInterface
 )
+from ..core.data.util import spatial_index
+from ..core.spaces import get_executor
 from ..core.util import (
-    cast_array_to_int64, cftime_types, cftime_to_timestamp,
+    cast_array_to_int64, cftime_types, cftime_to_timestamp, config,
     datetime_types, dt_to_int, get_param_values
 )
 from ..element import (Image, Path, Curve, RGB, Graph, TriMesh,
                        QuadMesh, Contours, Spikes, Area, Rectangles,
                        Spread, Segments, Scatter, Points, Polygons)
 from ..element.util import connect_tri_edges_pd
-from ..streams import PointerXY
+from ..streams import Counter, PointerXY
 from .resample import LinkableOperation, ResampleOperation2D
 
 
@@ -51,6 +58,186 @@ def __getattr__(name):
 
 ds_version = Version(ds.__version__)
 
+# Collections of reductions computing multiple aggregates in one pass
+summary_types = (rd.summary,) if hasattr(rd, 'summary') else ()
+
+
+class TileCache(param.Parameterized):
+    """
+    TileCache holds the tiles computed by the aggregate operation when
+    a tile_size is declared, keyed on the identity of the aggregated
+    data object and a key identifying the tile. Tiles are evicted in
+    least recently used order once the total size of the cached tiles
+    exceeds max_bytes and are dropped once the data object is garbage
+    collected or invalidated along with the range_cache, e.g. when a
+    Pipe or Buffer stream sends data which was modified inplace.
+    """
+
+    max_bytes = param.Number(default=256*1024**2, allow_None=True, bounds=(0, None), doc="""
+        The maximum number of bytes of tiles to hold in the cache.""")
+
+    def __init__(self, **params):
+        super().__init__(**params)
+        self.policy = LRUCachePolicy()
+        self._tiles = OrderedDict()
+        self._refs = {}
+        self._lock = threading.RLock()
+
+    def get(self, data, key):
+        """
+        Returns the tile cached for the data object and key or None.
+        """
+        ident = id(data)
+        key = (ident,) + key
+        with self._lock:
+            ref = self._refs.get(ident)
+            tile = self._tiles.get(key) if ref is not None and ref() is data else None
+            if tile is None:
+                self.policy.miss(key)
+            else:
+                self.policy.hit(key)
+        return tile
+
+    def set(self, data, key, tile):
+        """
+        Caches the tile for the data object and key, evicting the least
+        recently used tiles if the cache exceeds max_bytes.
+        """
+        ident = id(data)
+        with self._lock:
+            ref = self._refs.get(ident)
+            if ref is None or ref() is not data:
+                try:
+                    ref = weakref.ref(data, partial(self._remove, ident))
+                except TypeError:
+                    return
+                self._drop(ident)
+                self._refs[ident] = ref
+            key = (ident,) + key
+            self._tiles[key] = tile
+            self.policy.max_bytes = self.max_bytes
+            self.policy.add(key, tile)
+            for evicted in self.policy.evict(self._tiles, keep=key):
+                del self._tiles[evicted]
+
+    def _remove(self, ident, ref):
+        with self._lock:
+            if self._refs.get(ident) is ref:
+                del self._refs[ident]
+                self._drop(ident)
+
+    def _drop(self, ident):
+        for key in [k for k in self._tiles if k[0] == ident]:
+            del self._tiles[key]
+            self.policy.discard(key)
+
+    def invalidate(self, data=None):
+        """
+        Drops the tiles cached for the supplied data object or all
+        cached tiles if no data is supplied.
+        """
+        if data is None:
+            self.clear()
+            return
+        ident = id(data)
+        with self._lock:
+            ref = self._refs.get(ident)
+            if ref is not None and ref() is data:
+                del self._refs[ident]
+                self._drop(ident)
+
+    def clear(self):
+        "Drops all cached tiles."
+        with self._lock:
+            self._tiles.clear()
+            self._refs.clear()
+            self.policy.clear()
+
+    def __len__(self):
+        return len(self._tiles)
+
+
+tile_cache = TileCache(name='tile_cache')
+range_cache.link(tile_cache)
+
+
+
+class Refinement(Counter):
+    """
+    Refinement is the stream used by progressive aggregation to
+    trigger the DynamicMap once the aggregate of the most recently
+    requested viewport has been computed at full resolution, which
+    is then rendered in place of the preliminary aggregate. The full
+    resolution aggregates are computed one at a time on the shared
+    thread pool and refinements which are superseded by a newer
+    request are cancelled or, if they are already running, discarded.
+    The event is triggered on the next tick of the Document being
+    served or on the event loop the refinement was submitted from.
+    """
+
+    def __init__(self, **params):
+        super().__init__(**params)
+        self._future = None
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def submit(self, fn):
+        """
+        Schedules the supplied function, which computes and caches the
+        refined aggregate, cancelling any pending refinement. Once the
+        function returns an event is triggered unless the refinement
+        has been superseded in the meantime.
+        """
+        self.cancel()
+        generation = self._generation
+        dispatch = self._dispatcher()
+
+        def refine():
+            with self._lock:
+                if generation != self._generation:
+                    return
+                try:
+                    fn()
+                except Exception as e:
+                    self.param.warning(f'Progressive refinement failed: {e}')
+                    return
+            if generation == self._generation:
+                dispatch(partial(self._trigger, generation))
+
+        self._future = get_executor('thread').submit(refine)
+        return self._future
+
+    def _trigger(self, generation):
+        if generation == self._generation:
+            self.event()
+
+    @classmethod
+    def _dispatcher(cls):
+        """
+        Returns a function scheduling a callback on the next tick of
+        the current Document if it is being served, on the running
+        event loop or, if there is neither, calling it immediately.
+        """
+        try:
+            from panel.io.state import state
+            doc = state.curdoc
+        except ImportError:
+            doc = None
+        if doc is not None and doc.session_context:
+            return doc.add_next_tick_callback
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return lambda callback: callback()
+        return loop.call_soon_threadsafe
+
+    def cancel(self):
+        "Cancels or discards any pending refinement."
+        self._generation += 1
+        if self._future is not None:
+            self._future.cancel()
+            self._future = None
+
 
 class AggregationOperation(ResampleOperation2D):
     """
@@ -58,17 +245,70 @@ class AggregationOperation(ResampleOperation2D):
     aggregator parameter used to define a datashader Reduction.
     """
 
-    aggregator = param.ClassSelector(class_=(ds.reductions.Reduction, str),
+    aggregator = param.ClassSelector(class_=(ds.reductions.Reduction, str)+summary_types,
                                      default=ds.count(), doc="""
         Datashader reduction function used for aggregating the data.
         The aggregator may also define a column to aggregate; if
         no column is defined the first value dimension of the element
-        will be used. May also be defined as a string.""")
+        will be used. May also be defined as a string. A ds.summary
+        of named reductions computes all of them in a single pass,
+        returning an Image with one value dimension per reduction.""")
 
     vdim_prefix = param.String(default='{kdims} ', allow_None=True, doc="""
         Prefix to prepend to value dimension name where {kdims}
         templates in the names of the input element key dimensions.""")
 
+    tile_size = param.Integer(default=None, allow_None=True, bounds=(1, None), doc="""
+        If set, points are aggregated into square tiles of tile_size
+        pixels, laid out at power-of-two zoom levels of the data
+        extent, which are cached in the tile_cache and composed into
+        the requested viewport. Panning and zooming then only
+        aggregates the newly exposed tiles. Tiling only applies to
+        numeric point data aggregated with the count, any, sum, min
+        or max reductions; counts and sums are distributed across
+        the viewport pixels in proportion to their overlap with the
+        tile pixels, with counts rounded to the nearest integer. The
+        extent of the data is cached, so data modified inplace has to
+        be sent through a Pipe or Buffer stream.""")
+
+    prune_partitions = param.Boolean(default=False, doc="""
+        Whether to skip the partitions of dask DataFrames lying
+        entirely outside the viewport when aggregating points. The
+        bounds of the partitions are computed in an additional pass
+        over the data, which is cached until the data is invalidated.
+        When disabled partitions are only pruned if their bounds are
+        known without computation, i.e. for spatialpandas
+        DaskGeoDataFrames or if they have already been cached.""")
+
+    progressive = param.Boolean(default=False, doc="""
+        Whether to render aggregates progressively when applied
+        dynamically. A preliminary aggregate of a strided sample of
+        the rows (or of the partitions of a dask DataFrame) is
+        returned immediately while the full aggregate is computed in
+        the background, re-rendering once it is available. Counts
+        and sums of the sample are scaled up by the inverse of the
+        sampled fraction.""")
+
+    progressive_sample = param.Number(default=0.01, bounds=(0, 1),
+                                      inclusive_bounds=(False, True), doc="""
+        The approximate fraction of the data aggregated for the
+        preliminary aggregate in progressive mode.""")
+
+    refinement = param.ClassSelector(class_=Refinement, default=None, precedence=-1, doc="""
+        The stream triggered once a progressive aggregate has been
+        refined. Created automatically when a progressive operation
+        is applied dynamically.""")
+
+    def __call__(self, element, **kwargs):
+        progressive = kwargs.get('progressive', self.progressive)
+        dynamic = kwargs.get('dynamic', self.dynamic)
+        streams = kwargs.get('streams', self.streams)
+        if (progressive and dynamic is not False and isinstance(streams, list)
+            and kwargs.get('refinement') is None):
+            refinement = Refinement()
+            kwargs = dict(kwargs, refinement=refinement, streams=streams+[refinement])
+        return super().__call__(element, **kwargs)
+
     _agg_methods = {
         'any':   rd.any,
         'count': rd.count,
@@ -86,7 +326,10 @@ class AggregationOperation(ResampleOperation2D):
 
     @classmethod
     def _get_aggregator(cls, element, agg, add_field=True):
-        if isinstance(agg, str):
+        if isinstance(agg, summary_types):
+            return type(agg)(**{k: cls._get_aggregator(element, v, add_field)
+                                for k, v in zip(agg.keys, agg.values)})
+        elif isinstance(agg, str):
             if agg not in cls._agg_methods:
                 agg_methods = sorted(cls._agg_methods)
                 raise ValueError("Aggregation method '{!r}' is not known; "
@@ -126,6 +369,8 @@ class AggregationOperation(ResampleOperation2D):
             params['xdensity'] = 1
         if height == 0:
             params['ydensity'] = 1
+        if isinstance(agg_fn, summary_types):
+            xarray = xr.Dataset({vd.name: xarray for vd in params['vdims']})
         el = self.p.element_type(xarray, **params)
         if isinstance(agg_fn, ds.count_cat):
             vals = element.dimension_values(agg_fn.column, expanded=False)
@@ -133,10 +378,68 @@ class AggregationOperation(ResampleOperation2D):
             return NdOverlay({v: el for v in vals}, dim)
         return el
 
+    @classmethod
+    def _partition_bounds(cls, df, x, y):
+        """
+        Computes the bounds (x0, x1, y0, y1) of the x- and y-columns of
+        each partition of a dask DataFrame. The bounds of spatialpandas
+        DaskGeoDataFrames are those of their partitions' geometries.
+        """
+        if hasattr(df, 'partition_bounds'):
+            bounds = df.partition_bounds
+            return tuple(bounds[c].values for c in ('x0', 'x1', 'y0', 'y1'))
+
+        def partition_bounds(part):
+            return pd.DataFrame({'x0': [part[x].min()], 'x1': [part[x].max()],
+                                 'y0': [part[y].min()], 'y1': [part[y].max()]},
+                                dtype='float64')
+
+        meta = pd.DataFrame({c: pd.Series(dtype='float64') for c in ('x0', 'x1', 'y0', 'y1')})
+        bounds = df[[x, y]].map_partitions(partition_bounds, meta=meta).compute()
+        return tuple(bounds[c].values for c in ('x0', 'x1', 'y0', 'y1'))
+
+    @classmethod
+    def _prune_partitions(cls, df, x, y, x_range, y_range, compute=False):
+        """
+        Drops the partitions of a dask DataFrame whose bounds do not
+        intersect the x_range and y_range. Unless compute is enabled
+        partitions are only pruned if their bounds are available
+        without a pass over the data, otherwise the bounds are
+        computed once per DataFrame and cached.
+        """
+        if not isinstance(df, dd.DataFrame) or df.npartitions < 2:
+            return df
+        key = ('partition_bounds', x, y)
+        if compute or hasattr(df, 'partition_bounds'):
+            bounds = range_cache.get(df, key, lambda: cls._partition_bounds(df, x, y))
+        else:
+            bounds = range_cache.lookup(df, key)
+        if bounds is None:
+            return df
+        (vx0, vx1), (vy0, vy1) = x_range, y_range
+        x0, x1, y0, y1 = bounds
+        with np.errstate(invalid='ignore'):
+            keep = np.flatnonzero((x1 >= vx0) & (x0 <= vx1) & (y1 >= vy0) & (y0 <= vy1))
+        if len(keep) == df.npartitions:
+            return df
+        # Keep one partition so the aggregate has the correct schema
+        return df.partitions[list(keep) or [0]]
+
     def _get_agg_params(self, element, x, y, agg_fn, bounds):
         params = dict(get_param_values(element), kdims=[x, y],
                       datatype=['xarray'], bounds=bounds)
 
+        if isinstance(agg_fn, summary_types):
+            # One value dimension per reduction, named after its key
+            kdim_list = '_'.join(str(kd) for kd in params['kdims'])
+            vdim_prefix = self.vdim_prefix.format(kdims=kdim_list) if self.vdim_prefix else ''
+            params['vdims'] = [
+                self._get_agg_params(element, x, y, fn, bounds)['vdims'].clone(
+                    vdim_prefix+key, label=key)
+                for key, fn in zip(agg_fn.keys, agg_fn.values)
+            ]
+            return params
+
         if self.vdim_prefix:
             kdim_list = '_'.join(str(kd) for kd in params['kdims'])
             vdim_prefix = self.vdim_prefix.format(kdims=kdim_list)
@@ -296,6 +599,219 @@ class aggregate(LineAggregationOperation):
         return x, y, Dataset(df, kdims=kdims, vdims=vdims), glyph
 
 
+    # Reductions whose tiles can be composed into a viewport and the
+    # method used to combine the tile pixels
+    _tile_reductions = {rd.count: 'sum', rd.sum: 'sum', rd.any: 'any',
+                        rd.min: 'min', rd.max: 'max'}
+
+    # The deepest zoom level at which tiles are aggregated
+    _max_tile_zoom = 24
+
+    # The minimum number of rows for which progressive aggregation
+    # first aggregates a sample of the data
+    _progressive_min_rows = 100000
+
+    def _aggregate_tiles(self, data, dfdata, x, y, agg_fn, x_range, y_range,
+                         width, height, xs, ys):
+        """
+        Composes the aggregate of the viewport from tiles of tile_size
+        pixels at the shallowest power-of-two zoom level of the data
+        extent at which the tile pixels are no larger than the
+        viewport pixels. Tiles which have not been cached are
+        aggregated in a single pass over the points falling into
+        their bounding box. Returns None if the data cannot be tiled.
+        """
+        size = self.p.tile_size
+        extents, pixels = [], []
+        for dim, (v0, v1), n in ((x, x_range, width), (y, y_range, height)):
+            lower, upper = range_cache.get(data.data, ('tile_extent', dim.name),
+                                           lambda: data.range(dim))
+            if not (isinstance(lower, (int, float, np.number)) and
+                    np.isfinite(lower) and np.isfinite(upper) and upper > lower):
+                return None
+            # Pad the extent so points on the upper bound fall into a tile
+            extents.append((float(lower), float(upper-lower)*(1+2**-20)))
+            pixels.append((v1-v0)/n)
+        zoom = max(0, *(math.ceil(math.log2(span/(size*pixel)))
+                        for (_, span), pixel in zip(extents, pixels)))
+        if zoom > self._max_tile_zoom:
+            return None
+
+        ntiles = 2**zoom
+        (xlower, xspan), (ylower, yspan) = extents
+        tw, th = xspan/ntiles, yspan/ntiles
+        i0, i1 = math.floor((x_range[0]-xlower)/tw), math.ceil((x_range[1]-xlower)/tw)
+        j0, j1 = math.floor((y_range[0]-ylower)/th), math.ceil((y_range[1]-ylower)/th)
+        i1, j1 = max(i1, i0+1), max(j1, j0+1)
+
+        how = self._tile_reductions[type(agg_fn)]
+        base_key = (x.name, y.name, type(agg_fn).__name__, getattr(agg_fn, 'column', None),
+                    size, tuple(extents), zoom)
+        tiles, missing = {}, []
+        for j in range(max(j0, 0), min(j1, ntiles)):
+            for i in range(max(i0, 0), min(i1, ntiles)):
+                tile = tile_cache.get(dfdata, base_key+(i, j))
+                if tile is None:
+                    missing.append((i, j))
+                else:
+                    tiles[(i, j)] = tile
+        if missing:
+            mi0, mi1 = min(i for i, _ in missing), max(i for i, _ in missing)+1
+            mj0, mj1 = min(j for _, j in missing), max(j for _, j in missing)+1
+            bx0, bx1 = xlower+mi0*tw, xlower+mi1*tw
+            by0, by1 = ylower+mj0*th, ylower+mj1*th
+            subset = self._tile_subset(dfdata, x.name, y.name, bx0, bx1, by0, by1,
+                                       prune=self.p.prune_partitions)
+            cvs = ds.Canvas(plot_width=(mi1-mi0)*size, plot_height=(mj1-mj0)*size,
+                            x_range=(bx0, bx1), y_range=(by0, by1))
+            block = np.asarray(cvs.points(subset, x.name, y.name, agg_fn).data)
+            for j in range(mj0, mj1):
+                for i in range(mi0, mi1):
+                    tile = block[(j-mj0)*size:(j-mj0+1)*size,
+                                 (i-mi0)*size:(i-mi0+1)*size].copy()
+                    tile_cache.set(dfdata, base_key+(i, j), tile)
+                    tiles[(i, j)] = tile
+
+        fill = False if how == 'any' else 0 if isinstance(agg_fn, rd.count) else np.NaN
+        empty = np.full((size, size), fill)
+        mosaic = np.block([[tiles.get((i, j), empty) for i in range(i0, i1)]
+                           for j in range(j0, j1)])
+        if how == 'sum':
+            mosaic = mosaic.astype('float64')
+        for axis, start, step, (v0, v1), n in ((1, xlower+i0*tw, tw/size, x_range, width),
+                                               (0, ylower+j0*th, th/size, y_range, height)):
+            mosaic = self._resample_tiles(mosaic, axis, start, step, v0, (v1-v0)/n, n, how)
+        if isinstance(agg_fn, rd.count):
+            dtype = next(iter(tiles.values())).dtype if tiles else 'uint32'
+            mosaic = np.round(mosaic).astype(dtype)
+        return xr.DataArray(mosaic, dims=[y.name, x.name], coords={x.name: xs, y.name: ys})
+
+    @classmethod
+    def _tile_subset(cls, df, x, y, x0, x1, y0, y1, prune=False):
+        """
+        Selects the rows of the dataframe falling into the half-open
+        box if a spatial index of the coordinates is enabled and prunes
+        the partitions of dask DataFrames outside the box (computing
+        their bounds if prune is enabled). Otherwise the rows are not
+        filtered, since scanning them would cost as much as
+        aggregating them, which skips rows outside the box.
+        """
+        if isinstance(df, pd.DataFrame):
+            index = spatial_index(df[x], df[y])
+            if index is not None:
+                return df.iloc[index.box(x0, x1, y0, y1)]
+            return df
+        return cls._prune_partitions(df, x, y, (x0, x1), (y0, y1), compute=prune)
+
+    @classmethod
+    def _resample_tiles(cls, values, axis, start, step, v0, pixel, n, how):
+        """
+        Resamples the tile pixels along an axis, starting at start and
+        spaced by step, onto n viewport pixels of the supplied size
+        starting at v0. Sums are distributed in proportion to the
+        overlap between the tile and viewport pixels while the other
+        reductions combine the tile pixels whose centers fall into
+        each viewport pixel.
+        """
+        count = values.shape[axis]
+        if how == 'sum':
+            # Integrate the tile pixels up to the viewport pixel edges
+            # by interpolating their cumulative sum
+            edges = np.clip((v0 + np.arange(n+1)*pixel - start)/step, 0, count)
+            nans = np.isnan(values)
+            has_nans = nans.any()
+            summed = np.diff(cls._integrate(np.where(nans, 0, values) if has_nans else values,
+                                            axis, edges), axis=axis)
+            if not has_nans:
+                return summed
+            valid = np.diff(cls._integrate((~nans).astype('float64'), axis, edges), axis=axis)
+            return np.where(valid > 0, summed, np.NaN)
+        centers = start + (np.arange(count)+0.5)*step
+        bins = np.floor((centers-v0)/pixel)
+        inside = np.flatnonzero((bins >= 0) & (bins < n))
+        starts = np.searchsorted(bins[inside], np.arange(n))
+        values = np.take(values, inside, axis=axis)
+        ufunc = {'any': np.logical_or, 'min': np.fmin, 'max': np.fmax}[how]
+        return ufunc.reduceat(values, np.minimum(starts, len(inside)-1), axis=axis)
+
+    @classmethod
+    def _integrate(cls, values, axis, positions):
+        """
+        Returns the integral of the pixel values along the axis from
+        zero up to the supplied (fractional) pixel positions, assuming
+        the values are uniformly distributed within each pixel.
+        """
+        index = np.minimum(positions.astype(int), values.shape[axis]-1)
+        shape = [1]*values.ndim
+        shape[axis] = len(positions)
+        remainder = (index + 1 - positions).reshape(shape)
+        pixels = np.take(values, index, axis=axis)
+        return np.take(np.cumsum(values, axis=axis), index, axis=axis) - remainder*pixels
+
+    def _progressive_sample(self, data, x, y, glyph, x_range, y_range):
+        """
+        Returns a strided sample of the rows of the data, or of the
+        partitions of a dask DataFrame, along with the fraction of
+        the data it represents, or None if the data is too small to
+        be sampled. Partitions outside the viewport are pruned before
+        sampling if their bounds have already been computed.
+        """
+        df = PandasInterface.as_dframe(data)
+        step = int(round(1/self.p.progressive_sample))
+        if step < 2:
+            return None
+        elif isinstance(df, dd.DataFrame):
+            if glyph == 'points':
+                df = self._prune_partitions(df, x.name, y.name, x_range, y_range)
+            if df.npartitions < 2:
+                return None
+            sample = df.partitions[::step]
+            return sample, sample.npartitions/df.npartitions
+        elif len(df) < self._progressive_min_rows:
+            return None
+        sample = df.iloc[::step]
+        return sample, len(sample)/len(df)
+
+    def _aggregate(self, data, x, y, glyph, agg_fn, x_range, y_range,
+                   xtype, ytype, width, height, xs, ys, full=True):
+        """
+        Aggregates the data onto the canvas returning an xarray
+        DataArray. Aggregates of the full data, rather than of a
+        sample, may be composed from tiles and prune the partitions
+        of dask DataFrames.
+        """
+        agg_kwargs = {}
+        if self.p.line_width and glyph == 'line' and ds_version >= Version('0.14.0'):
+            agg_kwargs['line_width'] = self.p.line_width
+
+        dfdata = PandasInterface.as_dframe(data)
+        agg = None
+        if (full and self.p.tile_size and glyph == 'points' and
+            xtype == ytype == 'numeric' and type(agg_fn) in self._tile_reductions):
+            agg = self._aggregate_tiles(data, dfdata, x, y, agg_fn, x_range, y_range,
+                                        width, height, xs, ys)
+        if agg is None:
+            if glyph == 'points' and full:
+                dfdata = self._prune_partitions(dfdata, x.name, y.name, x_range, y_range,
+                                                compute=self.p.prune_partitions)
+            cvs = ds.Canvas(plot_width=width, plot_height=height,
+                            x_range=x_range, y_range=y_range)
+            # Suppress numpy warning emitted by dask:
+            # https://github.com/dask/dask/issues/8439
+            with warnings.catch_warnings():
+                warnings.filterwarnings(
+                    action='ignore', message='casting datetime64',
+                    category=FutureWarning
+                )
+                agg = getattr(cvs, glyph)(dfdata, x.name, y.name, agg_fn, **agg_kwargs)
+        if 'x_axis' in agg.coords and 'y_axis' in agg.coords:
+            agg = agg.rename({'x_axis': x, 'y_axis': y})
+        if xtype == 'datetime':
+            agg[x.name] = agg[x.name].astype('datetime64[ns]')
+        if ytype == 'datetime':
+            agg[y.name] = agg[y.name].astype('datetime64[ns]')
+        return agg
+
     def _process(self, element, key=None):
         agg_fn = self._get_aggregator(element, self.p.aggregator)
         if hasattr(agg_fn, 'cat_column'):
@@ -328,32 +844,58 @@ class aggregate(LineAggregationOperation):
             empty_val = 0 if isinstance(agg_fn, ds.count) else np.NaN
             xarray = xr.DataArray(np.full((height, width), empty_val),
                                   dims=[y.name, x.name], coords={x.name: xs, y.name: ys})
+            if isinstance(agg_fn, summary_types):
+                xarray = xr.Dataset({
+                    vd.name: xarray.copy(data=np.full((height, width), 0 if isinstance(fn, ds.count) else np.NaN))
+                    for vd, fn in zip(params['vdims'], agg_fn.values)})
             return self.p.element_type(xarray, **params)
 
-        cvs = ds.Canvas(plot_width=width, plot_height=height,
-                        x_range=x_range, y_range=y_range)
-
-        agg_kwargs = {}
-        if self.p.line_width and glyph == 'line' and ds_version >= Version('0.14.0'):
-            agg_kwargs['line_width'] = self.p.line_width
-
-        dfdata = PandasInterface.as_dframe(data)
-        # Suppress numpy warning emitted by dask:
-        # https://github.com/dask/dask/issues/8439
-        with warnings.catch_warnings():
-            warnings.filterwarnings(
-                action='ignore', message='casting datetime64',
-                category=FutureWarning
-            )
-            agg = getattr(cvs, glyph)(dfdata, x.name, y.name, agg_fn, **agg_kwargs)
-        if 'x_axis' in agg.coords and 'y_axis' in agg.coords:
-            agg = agg.rename({'x_axis': x, 'y_axis': y})
-        if xtype == 'datetime':
-            agg[x.name] = agg[x.name].astype('datetime64[ns]')
-        if ytype == 'datetime':
-            agg[y.name] = agg[y.name].astype('datetime64[ns]')
-
-        if agg.ndim == 2:
+        # If enabled via hv.config.cache_ranges memoize the most recent
+        # aggregate of the data so that changes to downstream parameters,
+        # e.g. of shade or spread, reuse it. Progressive aggregation
+        # always memoizes the refined aggregate to deliver it. Copies
+        # are returned so modifying the output cannot alter the memo.
+        if isinstance(element, Element) and not isinstance(element, Graph):
+            source = element.data
+        else:
+            source = PandasInterface.as_dframe(data)
+        refinement = self.p.refinement if self.p.progressive else None
+        memoize = config.cache_ranges or refinement is not None
+        memo_key = ('aggregate', x.name, y.name, glyph, agg_fn)
+        geometry = (x_range, y_range, width, height, self.p.line_width, self.p.tile_size)
+        memo = range_cache.lookup(source, memo_key) if memoize else None
+        sample = None if refinement is None else self._progressive_sample(
+            data, x, y, glyph, x_range, y_range)
+        args = (x, y, glyph, agg_fn, x_range, y_range, xtype, ytype, width, height, xs, ys)
+        if memo is not None and memo[0] == geometry:
+            agg, sample = memo[1].copy(), None
+        elif sample is not None:
+            sample, fraction = sample
+            agg = self._aggregate(data.clone(sample), *args, full=False)
+            if isinstance(agg_fn, summary_types):
+                agg = agg.assign(**{k: agg[k]/fraction for k, fn in zip(agg_fn.keys, agg_fn.values)
+                                    if type(fn) in (rd.count, rd.sum)})
+            elif type(agg_fn) in (rd.count, rd.sum):
+                agg = agg.copy(data=agg.data/fraction)
+            # Snapshot the parameter values, since self.p is replaced on
+            # the next call while the refinement is computed
+            values = {k: self.p[k] for k in self.param if k != 'name'}
+            op = self.instance(**values)
+            op.p = param.ParamOverrides(op, values)
+            refinement.submit(lambda: range_cache.set(
+                source, memo_key, (geometry, op._aggregate(data, *args))))
+        else:
+            agg = self._aggregate(data, *args)
+            if memoize:
+                range_cache.set(source, memo_key, (geometry, agg))
+                agg = agg.copy()
+        if refinement is not None and sample is None:
+            refinement.cancel()
+
+        if isinstance(agg, xr.Dataset):
+            agg = agg.rename({k: vd.name for k, vd in zip(agg_fn.keys, params['vdims'])})
+            return self.p.element_type(agg, **params)
+        elif agg.ndim == 2:
             # Replacing x and y coordinates to avoid numerical precision issues
             eldata = agg if ds_version > Version('0.5.0') else (xs, ys, agg.data)
             return self.p.element_type(eldata, **params)
@@ -720,7 +1262,7 @@ class regrid(AggregationOperation):
     """
 
     aggregator = param.ClassSelector(default=ds.mean(),
-                                     class_=(ds.reductions.Reduction, str))
+                                     class_=(ds.reductions.Reduction, str)+summary_types)
 
     expand = param.Boolean(default=False, doc="""
        Whether the x_range and y_range should be allowed to expand
@@ -858,7 +1400,7 @@ class contours_rasterize(aggregate):
     """
 
     aggregator = param.ClassSelector(default=ds.mean(),
-                                     class_=(ds.reductions.Reduction, str))
+                                     class_=(ds.reductions.Reduction, str)+summary_types)
 
     @classmethod
     def _get_aggregator(cls, element, agg, add_field=True):
@@ -877,7 +1419,7 @@ class trimesh_rasterize(aggregate):
     """
 
     aggregator = param.ClassSelector(default=ds.mean(),
-                                     class_=(ds.reductions.Reduction, str))
+                                     class_=(ds.reductions.Reduction, str)+summary_types)
 
     interpolation = param.ObjectSelector(default='bilinear',
                                          objects=['bilinear', 'linear', None, False], doc="""
@@ -1110,6 +1652,11 @@ class shade(LinkableOperation):
         ``cnorm!=`eq_hist``. Set this value to False if you need to
         match historical unscaled behavior, prior to HoloViews 1.14.4.""")
 
+    vdim = param.String(default=None, allow_None=True, doc="""
+        The name or label of the value dimension to shade, e.g. one
+        of the reductions of a summary aggregate. Defaults to the
+        first value dimension.""")
+
     @classmethod
     def concatenate(cls, overlay):
         """
@@ -1189,7 +1736,10 @@ class shade(LinkableOperation):
             ydensity = element.ydensity
             bounds = element.bounds
 
-        vdim = element.vdims[0].name
+        if self.p.vdim is None:
+            vdim = element.vdims[0].name
+        else:
+            vdim = element.get_dimension(self.p.vdim, strict=True).name
         array = element.data[vdim]
         kdims = element.kdims
 
@@ -1258,7 +1808,7 @@ class geometry_rasterize(LineAggregationOperation):
     """
 
     aggregator = param.ClassSelector(default=ds.mean(),
-                                     class_=(ds.reductions.Reduction, str))
+                                     class_=(ds.reductions.Reduction, str)+summary_types)
 
     @classmethod
     def _get_aggregator(cls, element, agg, add_field=True):
@@ -1297,6 +1847,9 @@ class geometry_rasterize(LineAggregationOperation):
         if isinstance(agg_fn, ds.count_cat) and data[agg_fn.column].dtype.name != 'category':
             data[agg_fn.column] = data[agg_fn.column].astype('category')
 
+        # Skip the partitions of spatialpandas dask frames outside the viewport
+        data = self._prune_partitions(data, xdim.name, ydim.name, x_range, y_range)
+
         agg_kwargs = dict(geometry=col, agg=agg_fn)
         if isinstance(element, Polygons):
             agg = cvs.polygons(data, **agg_kwargs)
@@ -1342,7 +1895,7 @@ class rasterize(AggregationOperation):
     dimensions of the linked plot and the ranges of the axes.
     """
 
-    aggregator = param.ClassSelector(class_=(ds.reductions.Reduction, str),
+    aggregator = param.ClassSelector(class_=(ds.reductions.Reduction, str)+summary_types,
                                      default='default')
 
     interpolation = param.ObjectSelector(
@@ -1728,6 +2281,12 @@ class inspect(Operation):
       the Points element. Can be used to customize the value dimensions
       e.g. to implement custom hover behavior.""")
 
+    vdim = param.String(default=None, allow_None=True, doc="""
+      The name or label of the value dimension of the raster used to
+      determine whether there are hits under the cursor, e.g. one of
+      the reductions of a summary aggregate. Defaults to the first
+      value dimension.""")
+
     # Stream values and overrides
     streams = param.ClassSelector(default=dict(x=PointerXY.param.x,
                                                y=PointerXY.param.y),
@@ -1788,6 +2347,10 @@ class inspect_base(inspect):
         self._validate(raster)
         if isinstance(raster, RGB):
             raster = raster[..., raster.vdims[-1]]
+        elif self.p.vdim is not None or len(raster.vdims) > 1:
+            vdim = raster.vdims[0] if self.p.vdim is None else raster.get_dimension(self.p.vdim, strict=True)
+            data = raster.data[[vdim.name]] if isinstance(raster.data, xr.Dataset) else raster.data
+            raster = raster.clone(data, vdims=[vdim], dataset=raster.dataset)
         x_range, y_range = raster.range(0), raster.range(1)
         xdelta, ydelta = self._distance_args(raster, x_range, y_range, self.p.pixels)
         x, y = self.p.x, self.p.y
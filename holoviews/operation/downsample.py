@@ -34,91 +34,125 @@ import numpy as np
 import param
 
 from .resample import ResampleOperation1D
+from ..core.cache import range_cache
+from ..core.data import Dataset
+from ..core.overlay import CompositeOverlay
 from ..element.chart import Area
 
 
-def _argmax_area(prev_x, prev_y, avg_next_x, avg_next_y, x_bucket, y_bucket):
-    """Vectorized triangular area argmax computation.
-    Parameters
-    ----------
-    prev_x : float
-        The previous selected point is x value.
-    prev_y : float
-        The previous selected point its y value.
-    avg_next_x : float
-        The x mean of the next bucket
-    avg_next_y : float
-        The y mean of the next bucket
-    x_bucket : np.ndarray
-        All x values in the bucket
-    y_bucket : np.ndarray
-        All y values in the bucket
-    Returns
-    -------
-    int
-        The index of the point with the largest triangular area.
-    """
-    return np.abs(
-        x_bucket * (prev_y - avg_next_y)
-        + y_bucket * (avg_next_x - prev_x)
-        + (prev_x * avg_next_y - avg_next_x * prev_y)
-    ).argmax()
+def _lttb_offsets(n, n_out):
+    """
+    Computes the start offsets of the LTTB buckets, leaving room for
+    the first and last data points.
+    """
+    # Bucket size. Leave room for start and end data points
+    block_size = (n - 2) / (n_out - 2)
+    # Note this 'astype' cast must take place after array creation (and not with the
+    # aranage() its dtype argument) or it will cast the `block_size` step to an int
+    # before the arange array creation
+    return np.arange(start=1, stop=n, step=block_size).astype(np.int64)
 
 
 def _lttb_inner(x, y, n_out, sampled_x, offset):
-    a = 0
-    for i in range(n_out - 3):
-        o0, o1, o2 = offset[i], offset[i + 1], offset[i + 2]
-        a = (
-            _argmax_area(
-                x[a],
-                y[a],
-                x[o1:o2].mean(),
-                y[o1:o2].mean(),
-                x[o0:o1],
-                y[o0:o1],
-            )
-            + offset[i]
-        )
-        sampled_x[i + 1] = a
-
-    # ------------ EDGE CASE ------------
-    # next-average of last bucket = last point
-    sampled_x[-2] = (
-        _argmax_area(
-            x[a],
-            y[a],
-            x[-1],  # last point
-            y[-1],
-            x[offset[-2] : offset[-1]],
-            y[offset[-2] : offset[-1]],
+    """
+    Selects the LTTB points of one or more series sharing the same x
+    values, where y is a 2D array of shape (n_series, n_samples) and
+    sampled_x is the output array of shape (n_series, n_out).
+
+    The buckets have to be processed sequentially since each
+    selection depends on the previously selected point, but each
+    bucket is processed for all series at once.
+    """
+    n_series = y.shape[0]
+    rows = np.arange(n_series)
+    # The mean of the next bucket does not depend on the selection so
+    # the means of all buckets may be computed in a single pass.
+    counts = np.diff(np.append(offset, x.shape[0]))
+    x_means = np.add.reduceat(x, offset, dtype=np.float64) / counts
+    y_means = np.add.reduceat(y, offset, axis=1, dtype=np.float64) / counts
+    a = np.zeros(n_series, dtype=np.int64)
+    for i in range(n_out - 2):
+        if i < n_out - 3:
+            o0, o1 = offset[i], offset[i+1]
+            avg_next_x, avg_next_y = x_means[i+1], y_means[:, i+1]
+        else:
+            # ------------ EDGE CASE ------------
+            # next-average of last bucket = last point
+            o0, o1 = offset[-2], offset[-1]
+            avg_next_x, avg_next_y = x[-1], y[:, -1]
+        prev_x, prev_y = x[a], y[rows, a]
+        # Triangular areas of the points in the bucket
+        area = np.abs(
+            x[o0:o1] * (prev_y - avg_next_y)[:, None]
+            + y[:, o0:o1] * (avg_next_x - prev_x)[:, None]
+            + (prev_x * avg_next_y - avg_next_x * prev_y)[:, None]
         )
-        + offset[-2]
-    )
+        a = area.argmax(axis=1) + o0
+        sampled_x[:, i+1] = a
 
 
-def _lttb(x, y, n_out):
+_numba_lttb_inner = None
+
+def _get_numba_lttb_inner():
+    """
+    Returns a numba compiled implementation of _lttb_inner or None if
+    numba is not installed.
+    """
+    global _numba_lttb_inner
+    if _numba_lttb_inner is not None:
+        return _numba_lttb_inner or None
+    try:
+        import numba
+    except ImportError:
+        _numba_lttb_inner = False
+        return None
+
+    @numba.njit(parallel=True)
+    def lttb_inner(x, y, n_out, sampled_x, offset):
+        for s in numba.prange(y.shape[0]):
+            a = 0
+            for i in range(n_out - 2):
+                if i < n_out - 3:
+                    o0, o1, o2 = offset[i], offset[i+1], offset[i+2]
+                    avg_next_x = x[o1:o2].mean()
+                    avg_next_y = y[s, o1:o2].astype(np.float64).mean()
+                else:
+                    o0, o1 = offset[-2], offset[-1]
+                    avg_next_x, avg_next_y = x[-1], y[s, -1]
+                prev_x, prev_y = x[a], y[s, a]
+                selected, max_area = o0, -1.0
+                for j in range(o0, o1):
+                    area = abs(x[j] * (prev_y - avg_next_y) + y[s, j] * (avg_next_x - prev_x)
+                               + (prev_x * avg_next_y - avg_next_x * prev_y))
+                    if area != area:
+                        # Match numpy argmax, which selects the first NaN
+                        selected = j
+                        break
+                    elif area > max_area:
+                        selected, max_area = j, area
+                a = selected
+                sampled_x[s, i+1] = a
+
+    _numba_lttb_inner = lttb_inner
+    return lttb_inner
+
+
+def _lttb(x, y, n_out, use_numba=False):
     """
     Downsample the data using the LTTB algorithm (python implementation).
 
     Args:
         x (np.ndarray): The x-values of the data.
-        y (np.ndarray): The y-values of the data.
+        y (np.ndarray): The y-values of the data, either a 1D array
+            or a 2D array of shape (n_series, n_samples) to downsample
+            multiple series sharing the same x-values at once.
         n_out (int): The number of output points.
+        use_numba (bool): Whether to use numba if it is installed.
     Returns:
-        np.array: The indexes of the selected datapoints.
+        np.array: The indexes of the selected datapoints, a 2D array
+            of shape (n_series, n_out) if y is two-dimensional.
     """
-    # Bucket size. Leave room for start and end data points
-    block_size = (y.shape[0] - 2) / (n_out - 2)
-    # Note this 'astype' cast must take place after array creation (and not with the
-    # aranage() its dtype argument) or it will cast the `block_size` step to an int
-    # before the arange array creation
-    offset = np.arange(start=1, stop=y.shape[0], step=block_size).astype(np.int64)
-
-    # Construct the output array
-    sampled_x = np.empty(n_out, dtype=np.int64)
-    sampled_x[0] = 0
-    sampled_x[-1] = x.shape[0] - 1
+    offset = _lttb_offsets(y.shape[-1], n_out)
 
     # View it as int64 to take the mean of it
     if x.dtype.kind == 'M':
@@ -126,9 +160,19 @@ def _lttb(x, y, n_out):
     if y.dtype.kind == 'M':
         y = y.view(np.int64)
 
-    _lttb_inner(x, y, n_out, sampled_x, offset)
+    ys = y[None] if y.ndim == 1 else y
+
+    # Construct the output array
+    sampled_x = np.empty((ys.shape[0], n_out), dtype=np.int64)
+    sampled_x[:, 0] = 0
+    sampled_x[:, -1] = x.shape[0] - 1
 
-    return sampled_x
+    inner = _get_numba_lttb_inner() if use_numba else None
+    if inner is None:
+        _lttb_inner(x, ys, n_out, sampled_x, offset)
+    else:
+        inner(x, ys, n_out, sampled_x, offset)
+    return sampled_x[0] if y.ndim == 1 else sampled_x
 
 
 def _nth_point(x, y, n_out):
@@ -146,12 +190,182 @@ def _nth_point(x, y, n_out):
     return np.arange(0, n_samples, max(1, math.ceil(n_samples / n_out)))
 
 
+def _argminmax(y, n_bins):
+    """
+    Returns the indexes of the minimum and maximum of each of n_bins
+    equally sized bins, ignoring NaNs.
+    """
+    n = len(y)
+    block = math.ceil(n / n_bins)
+    if y.dtype.kind == 'f' and np.isnan(y).any():
+        ymin, ymax = np.where(np.isnan(y), np.inf, y), np.where(np.isnan(y), -np.inf, y)
+    else:
+        ymin = ymax = y
+    n_full = n // block
+    stop = n_full * block
+    starts = np.arange(0, stop, block)
+    indexes = [
+        ymin[:stop].reshape(n_full, block).argmin(axis=1) + starts,
+        ymax[:stop].reshape(n_full, block).argmax(axis=1) + starts,
+    ]
+    if stop < n:
+        indexes += [[ymin[stop:].argmin() + stop], [ymax[stop:].argmax() + stop]]
+    return np.concatenate(indexes)
+
+
+def _min_max(x, y, n_out):
+    """
+    Downsampling by selecting the minimum and maximum of equally sized
+    bins, i.e. two datapoints per bin.
+
+    Args:
+        x (np.ndarray): The x-values of the data.
+        y (np.ndarray): The y-values of the data.
+        n_out (int): The number of output points.
+    Returns:
+        np.array: The indexes of the selected datapoints.
+    """
+    return np.unique(_argminmax(y, max(n_out // 2, 1)))
+
+
+def _min_max_lttb(x, y, n_out, minmax_ratio=4, use_numba=False):
+    """
+    Downsampling by preselecting minmax_ratio * n_out datapoints using
+    the MinMax algorithm and then selecting n_out datapoints from the
+    preselection using the LTTB algorithm.
+
+    Args:
+        x (np.ndarray): The x-values of the data.
+        y (np.ndarray): The y-values of the data.
+        n_out (int): The number of output points.
+        minmax_ratio (int): The ratio of preselected datapoints to n_out.
+        use_numba (bool): Whether to use numba for LTTB if it is installed.
+    Returns:
+        np.array: The indexes of the selected datapoints.
+    """
+    n = len(x)
+    if n <= n_out * minmax_ratio:
+        return _lttb(x, y, n_out, use_numba=use_numba)
+    # Always retain the first and last datapoint
+    presampled = np.concatenate([
+        [0], _min_max(x[1:-1], y[1:-1], n_out * minmax_ratio) + 1, [n - 1]
+    ])
+    selected = _lttb(x[presampled], y[presampled], n_out, use_numba=use_numba)
+    return presampled[selected]
+
+
+def _segment_arg(y, starts, ends, reduction):
+    """
+    Returns the index of the first datapoint matching the reduction
+    (np.fmin or np.fmax) in each contiguous segment, falling back to
+    the start of the segment if it only contains NaNs.
+    """
+    values = reduction.reduceat(y, starts)
+    matches = np.flatnonzero(y == np.repeat(values, ends - starts))
+    if not len(matches):
+        return starts
+    pos = np.searchsorted(matches, starts)
+    indexes = matches[np.minimum(pos, len(matches) - 1)]
+    return np.where((pos < len(matches)) & (indexes < ends), indexes, starts)
+
+
+def _m4(x, y, n_out, x_range=None):
+    """
+    Downsampling by selecting the first, last, minimum and maximum
+    datapoint of each of n_out bins spanning equal intervals along the
+    x-axis. When the bins correspond to the pixel columns of the plot
+    the rendered line is identical to the line drawn from all the
+    datapoints, at the cost of returning up to 4 * n_out datapoints.
+
+    Args:
+        x (np.ndarray): The sorted x-values of the data.
+        y (np.ndarray): The y-values of the data.
+        n_out (int): The number of bins, i.e. pixel columns.
+        x_range (tuple): The x-range spanned by the bins, defaults to
+            the range of the x-values.
+    Returns:
+        np.array: The indexes of the selected datapoints.
+    """
+    n = len(x)
+    if x.dtype.kind == 'M':
+        if x_range is not None:
+            x_range = np.array(x_range, dtype=x.dtype).view(np.int64)
+        x = x.view(np.int64)
+    x0, x1 = (x[0], x[-1]) if x_range is None else x_range
+    edges = np.linspace(x0, x1, n_out + 1)[1:-1]
+    bounds = np.searchsorted(x, edges, side='left')
+    starts = np.concatenate([[0], bounds])
+    ends = np.concatenate([bounds, [n]])
+    nonempty = starts < ends
+    starts, ends = starts[nonempty], ends[nonempty]
+    return np.unique(np.concatenate([
+        starts, ends - 1,
+        _segment_arg(y, starts, ends, np.fmin),
+        _segment_arg(y, starts, ends, np.fmax),
+    ]))
+
+
 _ALGORITHMS = {
     'lttb': _lttb,
-    'nth': _nth_point
+    'nth': _nth_point,
+    'minmax': _min_max,
+    'minmax-lttb': _min_max_lttb,
+    'm4': _m4,
 }
 
 
+class _MinMaxPyramid:
+    """
+    Multi-resolution index of the minimum and maximum values of a
+    series. Level l holds the indexes of the extrema of consecutive
+    bins of factor**l datapoints, where each level is computed from
+    the preceding level.
+    """
+
+    def __init__(self, xs, ys, factor=4):
+        self.xs, self.ys, self.factor = xs, ys, factor
+        if ys.dtype.kind == 'f' and np.isnan(ys).any():
+            ymin, ymax = np.where(np.isnan(ys), np.inf, ys), np.where(np.isnan(ys), -np.inf, ys)
+        else:
+            ymin = ymax = ys
+        dtype = np.int32 if len(ys) < np.iinfo(np.int32).max else np.int64
+        self.levels = []
+        imin = imax = np.arange(len(ys), dtype=dtype)
+        while len(imin) > factor:
+            imin = self._reduce(ymin, imin, np.argmin)
+            imax = self._reduce(ymax, imax, np.argmax)
+            self.levels.append((imin, imax))
+
+    def _reduce(self, values, indexes, arg):
+        f = self.factor
+        v = values[indexes]
+        stop = (len(v) // f) * f
+        selected = arg(v[:stop].reshape(-1, f), axis=1) + np.arange(0, stop, f)
+        if stop < len(v):
+            selected = np.append(selected, arg(v[stop:]) + stop)
+        return indexes[selected]
+
+    def candidates(self, start, stop, n_bins):
+        """
+        Returns the sorted indexes of the extrema of at least n_bins
+        bins spanning the range of datapoints between start and stop,
+        selected from the coarsest suitable level, or None if the
+        range should be downsampled from the raw data.
+        """
+        level = 0
+        while (level < len(self.levels) and
+               (stop - start) / self.factor**(level+1) >= n_bins):
+            level += 1
+        if level == 0:
+            return None
+        size = self.factor**level
+        b0, b1 = start // size, (stop - 1) // size + 1
+        imin, imax = self.levels[level-1]
+        candidates = np.concatenate([[start], imin[b0:b1], imax[b0:b1], [stop-1]])
+        candidates = candidates[(candidates >= start) & (candidates < stop)]
+        return np.unique(candidates).astype(np.int64)
+
+
 class downsample1d(ResampleOperation1D):
     """
     Implements downsampling of a regularly sampled 1D dataset.
@@ -160,22 +374,153 @@ class downsample1d(ResampleOperation1D):
 
         - `lttb`: Largest Triangle Three Buckets downsample algorithm
         - `nth`: Selects every n-th point.
+        - `minmax`: Selects the minimum and maximum of equally sized bins.
+        - `minmax-lttb`: Preselects points using `minmax` and then
+          applies `lttb` to the preselection.
+        - `m4`: Selects the first, last, minimum and maximum point of
+          each pixel column, returning up to four times `width` points
+          while rendering identically to the full data.
+
+    Zooming into large static series can be accelerated by enabling
+    the `pyramid`, which precomputes the extrema at multiple levels of
+    resolution.
+
+    When applied to an (Nd)Overlay the elements sharing the same
+    x-values, e.g. the columns of a wide DataFrame, are downsampled
+    together in a single vectorized pass.
     """
 
-    algorithm = param.Selector(default='lttb', objects=['lttb', 'nth'])
+    algorithm = param.Selector(default='lttb', objects=list(_ALGORITHMS))
+
+    minmax_ratio = param.Integer(default=4, bounds=(1, None), doc="""
+        The ratio of points preselected by the `minmax-lttb` algorithm
+        to the number of output points.""")
+
+    numba = param.Boolean(default=False, doc="""
+        Whether to use numba to accelerate the LTTB based algorithms
+        if it is installed. Compiling the implementation adds a
+        one-time overhead of a few seconds per session, so this only
+        pays off for repeated downsampling of large data.""")
+
+    pyramid = param.Boolean(default=False, doc="""
+        Whether to build a multi-resolution min/max pyramid of the
+        data, which is cached for as long as the data is alive. Each
+        subsequent zoom level is then served by preselecting the
+        extrema from the appropriate level of the pyramid, making
+        the latency independent of the size of the data. Only
+        suitable for static data sorted along the x-axis; the data
+        must not be modified inplace.""")
+
+    pyramid_factor = param.Integer(default=4, bounds=(2, None), doc="""
+        The reduction factor between subsequent levels of the pyramid.
+        The pyramid holds approximately 2 / (pyramid_factor - 1)
+        indexes per datapoint.""")
 
     def _process(self, element, key=None):
+        if isinstance(element, CompositeOverlay):
+            return self._process_overlay(element)
+        if self.p.pyramid and self.p.algorithm != 'nth':
+            return self._process_pyramid(element)
         if self.p.x_range:
             element = element[slice(*self.p.x_range)]
         if len(element) <= self.p.width:
             return element
-        xs, ys = (element.dimension_values(i) for i in range(2))
-        if ys.dtype == np.bool_:
-            ys = ys.astype(np.int8)
-        downsample = _ALGORITHMS[self.p.algorithm]
-        if self.p.algorithm == "lttb" and isinstance(element, Area):
+        xs, ys = self._values(element)
+        samples = self._downsample(xs, ys)
+        return element.iloc[samples]
+
+    def _process_pyramid(self, element):
+        """
+        Downsamples the element by preselecting the extrema of the
+        visible range from a min/max pyramid, which is built once and
+        cached for the lifetime of the data.
+        """
+        self._validate(element)
+        xdim, ydim = element.dimensions()[:2]
+        key = ('downsample_pyramid', xdim.name, ydim.name, self.p.pyramid_factor)
+        pyramid = range_cache.get(element.data, key, lambda: _MinMaxPyramid(
+            *self._values(element), factor=self.p.pyramid_factor))
+        xs, ys = pyramid.xs, pyramid.ys
+        start, stop = 0, len(xs)
+        if self.p.x_range:
+            x0, x1 = self.p.x_range
+            if xs.dtype.kind == 'M':
+                x0, x1 = (None if v is None else np.array(v, dtype=xs.dtype) for v in (x0, x1))
+            if x0 is not None:
+                start = np.searchsorted(xs, x0, side='left')
+            if x1 is not None:
+                stop = np.searchsorted(xs, x1, side='left')
+        if stop - start <= self.p.width:
+            return element.iloc[start:stop]
+        candidates = pyramid.candidates(start, stop, self.p.width)
+        if candidates is None:
+            candidates = np.arange(start, stop)
+        samples = self._downsample(xs[candidates], ys[candidates])
+        return element.iloc[candidates[samples]]
+
+    def _validate(self, element):
+        if self.p.algorithm in ("lttb", "minmax-lttb") and isinstance(element, Area):
             raise NotImplementedError(
                 "LTTB algorithm is not implemented for hv.Area"
             )
-        samples = downsample(xs, ys, self.p.width)
-        return element.iloc[samples]
+
+    def _values(self, element):
+        self._validate(element)
+        xs, ys = (element.dimension_values(i) for i in range(2))
+        if ys.dtype == np.bool_:
+            ys = ys.astype(np.int8)
+        return xs, ys
+
+    def _downsample(self, xs, ys):
+        algorithm = self.p.algorithm
+        if algorithm == 'lttb':
+            kwargs = dict(use_numba=self.p.numba)
+        elif algorithm == 'minmax-lttb':
+            kwargs = dict(use_numba=self.p.numba, minmax_ratio=self.p.minmax_ratio)
+        elif algorithm == 'm4':
+            kwargs = dict(x_range=self.p.x_range)
+        else:
+            kwargs = {}
+        return _ALGORITHMS[algorithm](xs, ys, self.p.width, **kwargs)
+
+    def _process_overlay(self, overlay):
+        """
+        Downsamples the elements in an overlay, grouping the elements
+        which share the same x-values to downsample them together.
+        """
+        data, groups = {}, []
+        for k, el in overlay.data.items():
+            if not isinstance(el, Dataset) or len(el.dimensions()) < 2:
+                data[k] = el
+                continue
+            elif self.p.pyramid and self.p.algorithm != 'nth':
+                data[k] = self._process_pyramid(el)
+                continue
+            if self.p.x_range:
+                el = el[slice(*self.p.x_range)]
+            data[k] = el
+            if len(el) <= self.p.width:
+                continue
+            xs, ys = self._values(el)
+            for group in groups:
+                gxs, gys = group[0], group[1][0][1]
+                if (gys.dtype.kind == 'M') == (ys.dtype.kind == 'M') and (
+                    gxs is xs or (gxs.dtype == xs.dtype and np.array_equal(gxs, xs))):
+                    group[1].append((k, ys))
+                    break
+            else:
+                groups.append((xs, [(k, ys)]))
+
+        for xs, members in groups:
+            if len(members) == 1:
+                samples = [self._downsample(xs, members[0][1])]
+            elif self.p.algorithm == 'lttb':
+                samples = self._downsample(xs, np.vstack([ys for _, ys in members]))
+            elif self.p.algorithm == 'nth':
+                # Samples only depend on the x-values
+                samples = [self._downsample(xs, members[0][1])]*len(members)
+            else:
+                samples = [self._downsample(xs, ys) for _, ys in members]
+            for (k, _), sample in zip(members, samples):
+                data[k] = data[k].iloc[sample]
+        return overlay.clone(list(data.items()))
@@ -30,8 +30,9 @@ from ..plot import (
 from ..util import attach_streams, displayable, collate
 from .links import LinkCallback
 from .util import (
-    bokeh3, filter_toolboxes, make_axis, update_shared_sources, empty_plot,
-    decode_bytes, theme_attr_json, cds_column_replace, get_default, merge_tools
+    bokeh3, compact_array, filter_toolboxes, make_axis, update_shared_sources,
+    empty_plot, decode_bytes, theme_attr_json, cds_column_replace, cds_column_diff,
+    get_default, merge_tools
 )
 
 if bokeh3:
@@ -72,6 +73,19 @@ class BokehPlot(DimensionedPlot, CallbackPlot):
         The height of the component (in pixels).  This can be either
         fixed or preferred height, depending on height sizing policy.""")
 
+    compact_data = param.Boolean(default=False, doc="""
+        Whether to convert the data sent to the browser into compact,
+        contiguous arrays that can always be transferred using the
+        Bokeh binary array protocol, e.g. by converting object arrays
+        of numbers to floats and downcasting float64 data to float32
+        where the loss in precision is below screen resolution.""")
+
+    incremental_updates = param.Boolean(default=False, doc="""
+        Whether to diff the data for a new frame against the current
+        contents of the ColumnDataSource and send appended rows and
+        partially changed columns as stream and patch events, instead
+        of replacing all columns on every update.""")
+
     _merged_tools = ['pan', 'box_zoom', 'box_select', 'lasso_select',
                      'poly_select', 'ypan', 'xpan']
 
@@ -140,6 +154,8 @@ class BokehPlot(DimensionedPlot, CallbackPlot):
                         'dates, for accurate tick formatting switch to '
                         'the matplotlib backend.' % values[0].calendar)
                 values = cftime_to_timestamp(values, 'ms')
+            if self.compact_data:
+                values = compact_array(values)
             new_data[k] = values
         return new_data
 
@@ -161,7 +177,9 @@ class BokehPlot(DimensionedPlot, CallbackPlot):
                 source.stream(data, stream.length)
             return
 
-        if cds_column_replace(source, data):
+        if self.incremental_updates and self._incremental_update(source, data):
+            pass
+        elif cds_column_replace(source, data):
             source.data = data
         else:
             source.data.update(data)
@@ -170,6 +188,32 @@ class BokehPlot(DimensionedPlot, CallbackPlot):
             self._update_selected(source)
 
 
+    def _incremental_update(self, source, data):
+        """
+        Attempts to update the datasource by streaming appended rows
+        and patching changed columns. Returns whether the update could
+        be applied incrementally.
+        """
+        diff = cds_column_diff(source, data)
+        if diff is None:
+            return False
+        if diff['stream']:
+            source.stream(diff['stream'], diff['rollover'])
+        if diff['replace']:
+            source.data.update(diff['replace'])
+        if diff['patches']:
+            # Patches are applied in place so the patched column is
+            # swapped for the new array to avoid modifying the data
+            # of the previous frame.
+            for k in diff['patches']:
+                column = data[k]
+                if not column.flags.writeable:
+                    column = column.copy()
+                dict.__setitem__(source.data, k, column)
+            source.patch(diff['patches'])
+        return True
+
+
     @property
     def state(self):
         """
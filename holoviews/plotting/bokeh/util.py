@@ -127,6 +127,61 @@ def decode_bytes(array):
     return decoded
 
 
+def compact_array(array, tolerance=1e-4):
+    """
+    Converts an array (or list of arrays) into a contiguous NumPy array
+    with the most compact dtype that is supported by the Bokeh binary
+    array protocol. Lists and object arrays of numbers are converted
+    to floats, 64-bit integers are cast to 32-bit integers if they fit
+    and to floats otherwise, and float64 arrays are downcast to float32
+    if the float32 resolution at the largest magnitude is smaller than
+    ``tolerance`` times the span of the data, or, for constant data,
+    if the value is exactly representable. Arrays of other types,
+    e.g. strings and datetimes, are returned unchanged.
+    """
+    if isinstance(array, list):
+        if array and all(isinstance(a, np.ndarray) for a in array):
+            return [compact_array(a, tolerance) for a in array]
+        elif not array or not all(v is None or isnumeric(v) for v in array):
+            return array
+        array = np.array([np.nan if v is None else v for v in array])
+    elif not isinstance(array, np.ndarray):
+        return array
+
+    kind, itemsize = array.dtype.kind, array.dtype.itemsize
+    if kind == 'O':
+        if not len(array) or not all(v is None or isnumeric(v) for v in array):
+            return array
+        array = np.array([np.nan if v is None else v for v in array], dtype=np.float64)
+        kind, itemsize = 'f', 8
+    if kind in 'iu' and itemsize == 8:
+        int_type = np.int32 if kind == 'i' else np.uint32
+        info = np.iinfo(int_type)
+        if not len(array) or (array.min() >= info.min and array.max() <= info.max):
+            array = array.astype(int_type)
+        else:
+            array = array.astype(np.float64)
+    elif kind == 'f' and itemsize < 4:
+        array = array.astype(np.float32)
+    elif kind == 'f' and itemsize > 4:
+        finite = array[np.isfinite(array)]
+        f32 = np.finfo(np.float32)
+        if len(finite):
+            lo, hi = finite.min(), finite.max()
+            magnitude = max(abs(lo), abs(hi))
+            if lo == hi:
+                # Constant data is only downcast if it round-trips exactly
+                compact = bool(np.float32(lo) == lo)
+            else:
+                compact = (magnitude < f32.max and
+                           magnitude*f32.eps <= tolerance*(hi-lo))
+        else:
+            compact = True
+        if compact:
+            array = array.astype(np.float32)
+    return np.ascontiguousarray(array)
+
+
 def layout_padding(plots, renderer):
     """
     Pads Nones in a list of lists of plots with empty plots.
@@ -713,6 +768,88 @@ def cds_column_replace(source, data):
     return bool(untouched and current_length and new_length and current_length[0] != new_length[0])
 
 
+def _column_changes(old, new):
+    """
+    Returns a boolean mask of the positions at which two equal length
+    arrays differ, treating NaNs in the same position as equal.
+    """
+    changed = old != new
+    if new.dtype.kind in 'fc' and old.dtype.kind in 'fc':
+        changed &= ~(np.isnan(old) & np.isnan(new))
+    elif new.dtype.kind in 'mM' and old.dtype.kind in 'mM':
+        changed &= ~(np.isnat(old) & np.isnat(new))
+    return changed
+
+
+def cds_column_diff(source, data, patch_threshold=0.5, max_candidates=3):
+    """
+    Computes an incremental update of the CDS.data given the data for
+    a new frame. Returns None if the data cannot be expressed as an
+    incremental update, otherwise a dictionary with the following keys:
+
+    * stream: A dictionary of columns to append to the CDS.
+    * rollover: The rollover length to supply when streaming.
+    * patches: A dictionary of patches in the format accepted by
+      ColumnDataSource.patch.
+    * replace: A dictionary of columns that have to be replaced in
+      full.
+
+    Streaming is used when the new data is the old data with rows
+    appended and optionally dropped from the start. Otherwise, if the
+    length is unchanged, columns are compared element-wise and any
+    column whose changes span less than ``patch_threshold`` of its
+    length is patched, unchanged columns are skipped and all other
+    columns are replaced.
+    """
+    if set(source.data) != set(data) or not data:
+        return None
+    old_cols, new_cols = {}, {}
+    for k, new in data.items():
+        old = source.data[k]
+        if not (isinstance(old, np.ndarray) and isinstance(new, np.ndarray)):
+            return None
+        elif old.ndim != 1 or new.ndim != 1 or 'O' in (old.dtype.kind, new.dtype.kind):
+            return None
+        old_cols[k], new_cols[k] = old, new
+    old_lengths = {len(v) for v in old_cols.values()}
+    new_lengths = {len(v) for v in new_cols.values()}
+    if len(old_lengths) != 1 or len(new_lengths) != 1:
+        return None
+    old_len, new_len = old_lengths.pop(), new_lengths.pop()
+    if not old_len or not new_len:
+        return None
+
+    # Find candidate offsets into the old data at which the new data starts
+    first = next(iter(new_cols))
+    candidates = np.flatnonzero(old_cols[first] == new_cols[first][0])
+    for offset in candidates[:max_candidates]:
+        overlap = old_len - offset
+        if overlap > new_len or (offset and overlap == new_len):
+            continue
+        if all(not _column_changes(old_cols[k][offset:], new_cols[k][:overlap]).any()
+               for k in new_cols):
+            stream = {k: v[overlap:] for k, v in new_cols.items()} if overlap < new_len else {}
+            return {
+                'stream': stream,
+                'rollover': new_len if offset else None,
+                'patches': {}, 'replace': {}
+            }
+
+    if old_len != new_len:
+        return None
+    patches, replace = {}, {}
+    for k, new in new_cols.items():
+        changed = np.flatnonzero(_column_changes(old_cols[k], new))
+        if not len(changed):
+            continue
+        start, end = changed[0], changed[-1]+1
+        if (end-start) < (patch_threshold*new_len):
+            patches[k] = [(slice(start, end), new[start:end])]
+        else:
+            replace[k] = new
+    return {'stream': {}, 'rollover': None, 'patches': patches, 'replace': replace}
+
+
 @contextmanager
 def hold_policy(document, policy, server=False):
     """
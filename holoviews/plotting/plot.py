@@ -3,14 +3,17 @@ Public API for all plots supported by HoloViews, regardless of
 plotting package or backend. Every plotting classes must be a subclass
 of this Plot baseclass.
 """
+import asyncio
 import uuid
 import warnings
 
 from collections import Counter, defaultdict, OrderedDict
+from contextlib import contextmanager
 from functools import partial
 from itertools import groupby, product
 
 import numpy as np
+import pandas as pd
 import param
 
 from panel.config import config
@@ -20,13 +23,16 @@ from panel.io.state import state
 from pyviz_comms import JupyterComm
 from ..selection import NoOpSelectionDisplay
 from ..core import util, traversal
+from ..core.cache import range_cache
+from ..core.dimension import Dimension
 from ..core.data import Dataset, disable_pipeline
+from ..core.data.interface import Interface
 from ..core.element import Element, Element3D
 from ..core.overlay import Overlay, CompositeOverlay
 from ..core.layout import Empty, NdLayout, Layout
 from ..core.options import Store, Compositor, SkipRendering, lookup_options
 from ..core.overlay import NdOverlay
-from ..core.spaces import HoloMap, DynamicMap
+from ..core.spaces import HoloMap, DynamicMap, get_nested_dmaps
 from ..core.util import stream_parameters, isfinite
 from ..element import Table, Graph
 from ..streams import Stream, RangeXY, RangeX, RangeY
@@ -39,6 +45,29 @@ from .util import (
     get_plot_frame, scale_fontsize, dynamic_update
 )
 
+
+@contextmanager
+def _stream_state(triggering, transient):
+    """
+    Restores the triggering state and the values of the transient
+    streams of an event which has already been dispatched, resetting
+    them on exit.
+    """
+    for s in triggering:
+        s._triggering = True
+    for s, values in transient:
+        with util.disable_constant(s):
+            s.update(**values)
+    try:
+        yield
+    finally:
+        for s in triggering:
+            s._triggering = False
+        for s, _ in transient:
+            with util.disable_constant(s):
+                s.reset()
+
+
 class Plot(param.Parameterized):
     """
     Base class of all Plot classes in HoloViews, designed to be
@@ -66,6 +95,9 @@ class Plot(param.Parameterized):
         self._pane = None
         self._triggering = []
         self._trigger = []
+        self._refresh_task = None
+        self._async_dmap_cache = None
+        self._transient_values = []
         self.set_root(root)
 
 
@@ -201,39 +233,108 @@ class Plot(param.Parameterized):
         """
         Refreshes the plot by rerendering it and then pushing
         the updated data if the plot has an associated Comm.
+
+        If the plot is displayed by a running event loop and contains
+        DynamicMaps with asynchronous callbacks, the callbacks are
+        awaited before rerendering and a refresh which is still
+        awaiting its callbacks when another refresh is triggered is
+        cancelled, so stale results are never rendered.
         """
+        async_dmaps = self._async_dmaps()
+        if async_dmaps:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                loop = None
+            if loop is not None:
+                self._refresh_async(loop, async_dmaps)
+                return
+        self._refresh()
+
+    def _async_dmaps(self):
+        """
+        Returns all DynamicMaps on the plot with asynchronous callbacks,
+        caching them after the first call since the DynamicMaps backing
+        a plot are fixed when it is initialized.
+        """
+        if self._async_dmap_cache is not None:
+            return self._async_dmap_cache
+        dmaps = []
+        for plot in self.traverse(lambda x: x, [Plot]):
+            hmap = getattr(plot, 'hmap', None)
+            for dmap in get_nested_dmaps(hmap):
+                if dmap.callback.is_async and not any(dmap is d for d in dmaps):
+                    dmaps.append(dmap)
+        self._async_dmap_cache = dmaps
+        return dmaps
+
+    def _refresh_key(self):
+        "Returns the key to refresh the plot with, resolving stream values"
+        key = self.current_key if self.current_key else self.keys[0]
+        dim_streams = [stream for stream in self.streams
+                       if any(c in self.dimensions for c in stream.contents)]
+        stream_params = stream_parameters(dim_streams)
+        key = tuple(None if d in stream_params else k
+                    for d, k in zip(self.dimensions, key))
+        return util.wrap_tuple_streams(key, self.dimensions, self.streams)
+
+    def _refresh_async(self, loop, dmaps):
+        """
+        Schedules a refresh which awaits the asynchronous callbacks of
+        the supplied DynamicMaps, cancelling any pending refresh.
+        """
+        if self._refresh_task is not None and not self._refresh_task.done():
+            self._refresh_task.cancel()
+        # Snapshot the stream state since transient streams are reset
+        # as soon as the triggering event has been dispatched
+        triggering = [s for p in self.traverse(lambda x: x, [Plot])
+                      for s in getattr(p, 'streams', []) if s._triggering]
+        transient = [(s, {k: v for k, v in s.param.values().items() if k != 'name'})
+                     for s in triggering if s.transient]
+        key = dict(zip([d.name for d in self.dimensions], self._refresh_key()))
+        self._refresh_task = loop.create_task(self._prefetch(key, dmaps, triggering, transient))
+
+    async def _prefetch(self, key, dmaps, triggering, transient):
+        for dmap in dmaps:
+            if not all(kd.name in key for kd in dmap.kdims):
+                continue
+            dmap_key = tuple(key[kd.name] for kd in dmap.kdims)
+            dmap_key = util.wrap_tuple_streams(dmap_key, dmap.kdims, dmap.streams)
+            try:
+                # Restore the state of the triggering event so the
+                # callback is called with the same values as _refresh
+                with _stream_state(triggering, transient):
+                    await dmap._execute_callback_async(*dmap_key)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                # Errors are raised by the synchronous refresh
+                pass
+        self._triggering = triggering
+        self._transient_values = transient
+        self._refresh()
+
+    def _refresh(self):
         if self.renderer.mode == 'server' and not state._unblocked(self.document):
             # If we do not have the Document lock, schedule refresh as callback
             self._triggering += [s for p in self.traverse(lambda x: x, [Plot])
                                  for s in getattr(p, 'streams', []) if s._triggering]
             if self.document and self.document.session_context:
-                self.document.add_next_tick_callback(self.refresh)
+                self.document.add_next_tick_callback(self._refresh)
                 return
 
         # Ensure that server based tick callbacks maintain stream triggering state
-        for s in self._triggering:
-            s._triggering = True
         try:
-            traverse_setter(self, '_force', True)
-            key = self.current_key if self.current_key else self.keys[0]
-            dim_streams = [stream for stream in self.streams
-                           if any(c in self.dimensions for c in stream.contents)]
-            stream_params = stream_parameters(dim_streams)
-            key = tuple(None if d in stream_params else k
-                        for d, k in zip(self.dimensions, key))
-            stream_key = util.wrap_tuple_streams(key, self.dimensions, self.streams)
-
-
-            self._trigger_refresh(stream_key)
-            if self.top_level:
-                self.push()
-        except Exception as e:
-            raise e
+            with _stream_state(self._triggering, self._transient_values):
+                traverse_setter(self, '_force', True)
+                stream_key = self._refresh_key()
+
+                self._trigger_refresh(stream_key)
+                if self.top_level:
+                    self.push()
         finally:
-            # Reset triggering state
-            for s in self._triggering:
-                s._triggering = False
             self._triggering = []
+            self._transient_values = []
 
 
     def _trigger_refresh(self, key):
@@ -670,6 +771,118 @@ class DimensionedPlot(Plot):
             dranges['factors'] = util.unique_array(expanded)
         return dranges
 
+    @classmethod
+    def _range_signature(cls, el):
+        """
+        Returns a hashable signature of the element parameters which
+        may affect the ranges computed from its data, e.g. the
+        dimensions and the bounds of an Image.
+        """
+        signature = []
+        for k, v in el.param.values().items():
+            if k in ('name', 'group', 'label', 'cdims'):
+                continue
+            elif isinstance(v, list):
+                v = tuple((d, d.range) if isinstance(d, Dimension) else d for d in v)
+            elif hasattr(v, 'lbrt'):
+                v = v.lbrt()
+            signature.append((k, v))
+        return (type(el), tuple(signature))
+
+    @classmethod
+    def _cached_range(cls, el, key, fn):
+        """
+        Looks up the range identified by the key for the data of the
+        element in the range cache, computing it with fn if needed.
+        Ranges are only cached if hv.config.cache_ranges is enabled.
+        """
+        if not util.config.cache_ranges:
+            return fn()
+        try:
+            key = (cls._range_signature(el),) + key
+            hash(key)
+        except TypeError:
+            return fn()
+        return range_cache.get(el.data, key, fn)
+
+    @classmethod
+    def _batched_ranges(cls, el):
+        """
+        Computes the data ranges of all dimensions of an element whose
+        interface supports computing multiple ranges at once, e.g. in a
+        single query or dask.compute call, instead of one per dimension.
+        """
+        if (not isinstance(el, Dataset) or isinstance(el, Graph) or
+            type(el).range is not Dataset.range or
+            getattr(el.interface.ranges, '__func__', None) is Interface.ranges.__func__):
+            return {}
+        signature = None
+        if util.config.cache_ranges:
+            try:
+                signature = cls._range_signature(el)
+                hash(signature)
+            except TypeError:
+                signature = None
+        dims, ranges = [], {}
+        for el_dim in el.dimensions():
+            if all(isfinite(r) for r in el_dim.range) or el_dim.values:
+                continue
+            key = (signature, 'range', el_dim)
+            cached = None if signature is None else range_cache.lookup(el.data, key)
+            if cached is None:
+                dims.append(el_dim)
+            else:
+                ranges[el_dim] = cached
+        if not dims or not el:
+            return ranges
+        for el_dim, data_range in el.interface.ranges(el, dims).items():
+            if signature is not None:
+                range_cache.set(el.data, (signature, 'range', el_dim), data_range)
+            ranges[el_dim] = data_range
+        return ranges
+
+    @classmethod
+    def _range_accumulator(cls, el, el_dim):
+        """
+        Returns the RangeAccumulator incrementally maintained for the
+        column of the element data corresponding to the dimension, e.g.
+        by a Buffer stream, if available.
+        """
+        if type(el).range is not Dataset.range or el_dim.nodata is not None:
+            return None
+        data = el.data
+        if isinstance(data, dict):
+            obj, key = data.get(el_dim.name), ('accumulator',)
+        elif isinstance(data, pd.DataFrame):
+            obj, key = data, ('accumulator', el_dim.name)
+        elif isinstance(data, np.ndarray) and data.ndim == 2:
+            obj, key = data, ('accumulator', el.get_dimension_index(el_dim))
+        else:
+            return None
+        return None if obj is None else range_cache.lookup(obj, key)
+
+    @classmethod
+    def _dim_transform_range(cls, el, transform):
+        "Returns the range or factors of a dim transform applied to the element"
+        values = transform.apply(el, all_values=True)
+        drange, factors = None, None
+        if values.dtype.kind == 'M':
+            drange = values.min(), values.max()
+        elif util.isscalar(values):
+            drange = values, values
+        elif values.dtype.kind in 'US':
+            factors = util.unique_array(values)
+        elif len(values) == 0:
+            drange = np.NaN, np.NaN
+        else:
+            try:
+                with warnings.catch_warnings():
+                    warnings.filterwarnings('ignore', r'All-NaN (slice|axis) encountered')
+                    drange = (np.nanmin(values), np.nanmax(values))
+            except Exception:
+                factors = util.unique_array(values)
+        return drange, factors
+
     @classmethod
     def _compute_group_range(cls, group, elements, ranges, framewise,
                              axiswise, robust, top_level, prev_frame):
@@ -681,7 +894,9 @@ class DimensionedPlot(Plot):
         robust_ranges = {}
         categorical_dims = []
         for el in elements:
+            batched_ranges = cls._batched_ranges(el)
             for el_dim in el.dimensions('ranges'):
+                accumulator = cls._range_accumulator(el, el_dim)
                 if hasattr(el, 'interface'):
                     if isinstance(el, Graph) and el_dim in el.nodes.dimensions():
                         dtype = el.nodes.interface.dtype(el.nodes, el_dim)
@@ -701,16 +916,29 @@ class DimensionedPlot(Plot):
                 elif el_dim.values:
                     ds = Dataset(el_dim.values, el_dim)
                     data_range = ds.range(el_dim, dimension_range=False)
+                elif accumulator is not None:
+                    data_range = accumulator.range()
+                elif el_dim in batched_ranges:
+                    data_range = batched_ranges[el_dim]
                 else:
-                    data_range = el.range(el_dim, dimension_range=False)
+                    data_range = cls._cached_range(
+                        el, ('range', el_dim),
+                        lambda: el.range(el_dim, dimension_range=False))
 
                 data_ranges[(el, el_dim)] = data_range
                 if dtype is not None and dtype.kind in 'uif' and robust:
                     percentile = 2 if isinstance(robust, bool) else robust
-                    robust_ranges[(el, el_dim)] = (
-                        dim(el_dim, np.nanpercentile, percentile).apply(el),
-                        dim(el_dim, np.nanpercentile, 100 - percentile).apply(el)
-                    )
+                    if accumulator is not None:
+                        robust_ranges[(el, el_dim)] = (
+                            accumulator.percentile(percentile),
+                            accumulator.percentile(100 - percentile)
+                        )
+                    else:
+                        robust_ranges[(el, el_dim)] = cls._cached_range(
+                            el, ('robust', el_dim, percentile), lambda: (
+                                dim(el_dim, np.nanpercentile, percentile).apply(el),
+                                dim(el_dim, np.nanpercentile, 100 - percentile).apply(el)
+                            ))
 
                 if (any(isinstance(r, str) for r in data_range) or
                     (el_dim.type is not None and issubclass(el_dim.type, str)) or
@@ -736,23 +964,15 @@ class DimensionedPlot(Plot):
                     dim_name = repr(v)
                     if dim_name in prev_ranges and not framewise:
                         continue
-                    values = v.apply(el, all_values=True)
-                    factors = None
-                    if values.dtype.kind == 'M':
-                        drange = values.min(), values.max()
-                    elif util.isscalar(values):
-                        drange = values, values
-                    elif values.dtype.kind in 'US':
-                        factors = util.unique_array(values)
-                    elif len(values) == 0:
-                        drange = np.NaN, np.NaN
+                    if v.params:
+                        # Parameter values may change without changing the data
+                        drange, factors = cls._dim_transform_range(el, v)
                     else:
-                        try:
-                            with warnings.catch_warnings():
-                                warnings.filterwarnings('ignore', r'All-NaN (slice|axis) encountered')
-                                drange = (np.nanmin(values), np.nanmax(values))
-                        except Exception:
-                            factors = util.unique_array(values)
+                        # The entry holds on to the transform so its id
+                        # cannot be reused while the entry is cached
+                        _, drange, factors = cls._cached_range(
+                            el, ('dim', id(v), dim_name),
+                            lambda: (v,)+cls._dim_transform_range(el, v))
                     if dim_name not in group_ranges:
                         group_ranges[dim_name] = {
                             'id': [], 'data': [], 'hard': [], 'soft': []
@@ -2,6 +2,7 @@
 Public API for all plotting renderers supported by HoloViews,
 regardless of plotting package or backend.
 """
+import asyncio
 import base64
 import os
 
@@ -38,7 +39,10 @@ from ..core.options import Store, StoreOptions, SkipRendering, Compositor
 from ..core.util import unbound_dimensions
 from ..streams import Stream
 from . import Plot
-from .util import displayable, collate, initialize_dynamic
+from .util import (
+    displayable, collate, has_async_placeholder, initialize_dynamic,
+    initialize_dynamic_async, precompute_dynamic
+)
 
 from param.parameterized import bothmethod
 
@@ -214,6 +218,15 @@ class Renderer(Exporter):
                    'or redim.values methods.')
             raise SkipRendering(msg.format(dims=dims))
 
+        # Asynchronous callbacks cannot be awaited while building the
+        # plot, so placeholder frames are refreshed once they complete
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            refresh = False
+        else:
+            refresh = not isinstance(obj, Plot) and has_async_placeholder(obj)
+
         # Initialize DynamicMaps with first data item
         initialize_dynamic(obj)
 
@@ -264,8 +277,23 @@ class Renderer(Exporter):
             if doc is None:
                 doc = Document() if self_or_cls.notebook_context else curdoc()
             plot.document = doc
+
+        if refresh:
+            plot.refresh()
         return plot
 
+    @bothmethod
+    async def get_plot_async(self_or_cls, obj, doc=None, renderer=None, **kwargs):
+        """
+        Given a HoloViews Viewable return a corresponding plot instance,
+        awaiting the asynchronous callbacks of the DynamicMaps it
+        contains for the initial frame instead of blocking the running
+        event loop, e.g. in a Jupyter kernel or a Bokeh server.
+        """
+        if not isinstance(obj, Plot):
+            await initialize_dynamic_async(obj)
+        return self_or_cls.get_plot(obj, doc, renderer, **kwargs)
+
     @bothmethod
     def get_plot_state(self_or_cls, obj, renderer=None, **kwargs):
         """
@@ -589,6 +617,9 @@ class Renderer(Exporter):
                     title = os.path.basename(basename)
                 if fmt in MIME_TYPES:
                     basename = f"{basename}.{fmt}"
+            if not isinstance(obj, Viewable):
+                # Every state is embedded, so evaluate them up front
+                precompute_dynamic(obj)
             plot.layout.save(basename, embed=True, resources=resources, title=title)
             return
 
@@ -1,3 +1,4 @@
+import itertools
 import re
 import traceback
 import warnings
@@ -16,11 +17,11 @@ from ..core import (
 from ..core.options import CallbackError, Cycle
 from ..core.operation import Operation
 from ..core.ndmapping import item_check
-from ..core.spaces import get_nested_streams
+from ..core.spaces import get_nested_dmaps, get_nested_streams
 from ..core.util import (
     match_spec, wrap_tuple, get_overlay_spec, unique_iterator,
     closest_match, is_number, isfinite, disable_constant,
-    arraylike_types
+    arraylike_types, wrap_tuple_streams
 )
 from ..element import Points
 from ..streams import LinkedStream, Params
@@ -256,6 +257,52 @@ def initialize_dynamic(obj):
             dmap[dmap._initial_key()]
 
 
+async def initialize_dynamic_async(obj):
+    """
+    Initializes all DynamicMap objects contained by the object without
+    blocking the running event loop by first awaiting the asynchronous
+    callbacks of the DynamicMaps (and of the DynamicMaps they depend
+    on) for the initial key.
+    """
+    dmaps = obj.traverse(lambda x: x, specs=[DynamicMap])
+    for dmap in dmaps:
+        if dmap.unbounded or len(dmap):
+            continue
+        initial_key = dmap._initial_key()
+        key = dict(zip([kd.name for kd in dmap.kdims], initial_key))
+        for nested in get_nested_dmaps(dmap)[::-1]:
+            if not nested.callback.is_async or not all(kd.name in key for kd in nested.kdims):
+                continue
+            nested_key = tuple(key[kd.name] for kd in nested.kdims)
+            nested_key = wrap_tuple_streams(nested_key, nested.kdims, nested.streams)
+            await nested._execute_callback_async(*nested_key)
+        dmap[initial_key]
+
+
+def precompute_dynamic(obj):
+    """
+    Evaluates every key of the DynamicMaps contained by the object
+    which declare the values of their key dimensions, e.g. before
+    embedding every state of the object, so the keys are evaluated
+    concurrently if the DynamicMaps declare an executor.
+    """
+    for dmap in obj.traverse(lambda x: x, specs=[DynamicMap]):
+        if not dmap.kdims or not all(kd.values for kd in dmap.kdims):
+            continue
+        dmap._precompute(list(itertools.product(*[kd.values for kd in dmap.kdims])))
+
+
+def has_async_placeholder(obj):
+    """
+    Whether the object contains a DynamicMap with an asynchronous
+    callback which has not been called yet but holds a placeholder
+    frame, e.g. supplied as its initial_items.
+    """
+    return any(nested.callback.is_async and len(nested) and nested.callback.args is None
+               for dmap in obj.traverse(lambda x: x, specs=[DynamicMap])
+               for nested in get_nested_dmaps(dmap))
+
+
 def get_plot_frame(map_obj, key_map, cached=False):
     """Returns the current frame in a mapping given a key mapping.
 
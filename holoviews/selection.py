@@ -1,17 +1,23 @@
-from collections import namedtuple
+import operator
+
+from collections import OrderedDict, namedtuple
 
 import numpy as np
+import pandas as pd
 import param
 
 from param.parameterized import bothmethod
 
 from .core.data import Dataset
-from .core.dimension import OrderedDict
+from .core.dimension import Dimension
 from .core.element import Element, Layout
 from .core.options import CallbackError, Store
 from .core.overlay import NdOverlay, Overlay
 from .core.layout import AdjointLayout
 from .core.spaces import GridSpace
+from .core import util
+from .core.cache import range_cache
+from .core.util import datetime_types
 from .streams import (
     Stream, SelectionExprSequence, CrossFilterSet,
     Derived, PlotReset, SelectMode, Pipe
@@ -464,6 +470,130 @@ class link_selections(_base_link_selections):
         return None if self.selected_color is None else _color_to_cmap(self.selected_color)
 
 
+_LOWER_BOUNDS = (operator.ge, operator.gt)
+_UPPER_BOUNDS = (operator.le, operator.lt)
+
+
+def _conjuncts(expr):
+    """
+    Splits a dim expression into the list of expressions which are
+    combined using the & operator.
+    """
+    from .util.transform import dim
+    if expr.ops and expr.ops[-1]['fn'] is operator.and_ and not expr.ops[-1]['reverse']:
+        other = expr.ops[-1]['args'][0]
+        if isinstance(other, dim):
+            return _conjuncts(expr.clone(ops=expr.ops[:-1])) + _conjuncts(other)
+    return [expr]
+
+
+def _bound(expr):
+    """
+    Returns the dimension, comparison and value of a dim expression
+    comparing a dimension against a scalar, e.g. dim('x') >= 1.
+    """
+    if len(expr.ops) != 1:
+        return None
+    op = expr.ops[0]
+    if (op['fn'] not in _LOWER_BOUNDS+_UPPER_BOUNDS or op['reverse'] or
+        len(op['args']) != 1 or op['kwargs'] or
+        not (np.isscalar(op['args'][0]) or isinstance(op['args'][0], datetime_types))):
+        return None
+    return expr.dimension, op['fn'], op['args'][0]
+
+
+def _tighter(bound, other):
+    """
+    Whether a bound implies the other bound on the same dimension.
+    """
+    (dim1, fn1, v1), (dim2, fn2, v2) = bound, other
+    if repr(dim1) != repr(dim2):
+        return False
+    try:
+        if fn1 in _LOWER_BOUNDS and fn2 in _LOWER_BOUNDS:
+            return v1 > v2 or (v1 == v2 and (fn1 is operator.gt or fn2 is operator.ge))
+        elif fn1 in _UPPER_BOUNDS and fn2 in _UPPER_BOUNDS:
+            return v1 < v2 or (v1 == v2 and (fn1 is operator.lt or fn2 is operator.le))
+    except TypeError:
+        pass
+    return False
+
+
+def _implies(expr, other):
+    """
+    Whether the selection expr is known to select a subset of the
+    other selection expression, i.e. when it combines the other
+    expression with further conditions using & or tightens the
+    bounds of a range selection.
+    """
+    conjuncts = _conjuncts(expr)
+    reprs = {repr(c) for c in conjuncts}
+    bounds = [b for b in map(_bound, conjuncts) if b is not None]
+    for conjunct in _conjuncts(other):
+        if repr(conjunct) in reprs:
+            continue
+        bound = _bound(conjunct)
+        if bound is None or not any(_tighter(b, bound) for b in bounds):
+            return False
+    return True
+
+
+def _expr_dims(expr):
+    """
+    Returns the names of the dimensions referenced by a dim expression
+    or None if it references parameters or widgets.
+    """
+    from .util.transform import dim
+    if not isinstance(expr.dimension, Dimension):
+        return None
+    dims = [expr.dimension.name]
+    for op in expr.ops:
+        for arg in list(op['args']) + list(op['kwargs'].values()):
+            if isinstance(arg, dim):
+                arg_dims = _expr_dims(arg)
+                if arg_dims is None:
+                    return None
+                dims += arg_dims
+    return dims
+
+
+def _refine_mask(dataset, selection_expr, previous):
+    """
+    Computes the mask of a selection expression which is a subset of
+    a previously computed selection by only evaluating the additional
+    conditions on the previously selected rows, e.g. when successively
+    narrowing down a selection. Returns None if no previous mask can
+    be refined.
+    """
+    for expr, mask in previous:
+        if (not isinstance(mask, (np.ndarray, pd.Series)) or mask.dtype != bool or
+            mask.ndim != 1 or len(mask) != len(dataset) or
+            not _implies(selection_expr, expr)):
+            continue
+        # Conditions shared with the previous selection already hold
+        satisfied = {repr(c) for c in _conjuncts(expr)}
+        conjuncts = [c for c in _conjuncts(selection_expr) if repr(c) not in satisfied]
+        dims = [_expr_dims(c) for c in conjuncts]
+        if any(d is None for d in dims):
+            return None
+        index = np.flatnonzero(np.asarray(mask))
+        try:
+            columns = {d: dataset.dimension_values(d)[index]
+                       for d in util.unique_iterator([d for ds in dims for d in ds])}
+        except Exception:
+            return None
+        subset = Dataset(columns, kdims=list(columns), datatype=['dictionary'])
+        selected = np.ones(len(index), dtype=bool)
+        for conjunct in conjuncts:
+            selected &= np.asarray(conjunct.apply(subset, strict=False), dtype=bool)
+        refined = np.zeros(len(mask), dtype=bool)
+        refined[index[selected]] = True
+        if isinstance(mask, pd.Series):
+            refined = pd.Series(refined, index=mask.index)
+        return refined
+    return None
+
+
 class SelectionDisplay:
     """
     Base class for selection display classes.  Selection display classes are
@@ -478,35 +608,70 @@ class SelectionDisplay:
     def build_selection(self, selection_streams, hvobj, operations, region_stream=None, cache={}):
         raise NotImplementedError()
 
+    @staticmethod
+    def _mask_cache(dataset, selection_expr, cache):
+        """
+        Returns the masks computed for the selection expression on
+        the data underlying the dataset, shared by all elements derived
+        from the same data, and the masks of the previous expression.
+        The masks are held by the range_cache, so they are dropped when
+        the data is garbage collected or invalidated, e.g. when a Pipe
+        or Buffer stream sends data which was modified inplace. Data
+        which cannot be weakly referenced, e.g. dictionaries, falls
+        back to the supplied cache, which holds a reference to the data
+        so its id cannot be reused.
+        """
+        key = ('selection_masks', tuple(dataset.dimensions(label='name')))
+        entry = range_cache.get(dataset.data, key, dict)
+        if range_cache.lookup(dataset.data, key) is not entry and cache is not None:
+            cache_key = (id(dataset.data),) + key
+            entry = cache.get(cache_key)
+            if entry is None or entry['data'] is not dataset.data:
+                entry = cache[cache_key] = {'data': dataset.data}
+        expr = repr(selection_expr)
+        if 'expr' not in entry:
+            entry.update(expr=expr, selection_expr=selection_expr, masks={}, previous={})
+        elif entry['expr'] != expr:
+            entry['previous'] = {mode: (entry['selection_expr'], mask)
+                                 for mode, mask in entry['masks'].items()}
+            entry.update(expr=expr, selection_expr=selection_expr, masks={})
+        return entry['masks'], entry['previous']
+
     @staticmethod
     def _select(element, selection_expr, cache={}):
         from .element import Curve, Spread
         from .util.transform import dim
         if isinstance(selection_expr, dim):
             dataset = element.dataset
-            mask = None
-            if dataset._plot_id in cache:
-                ds_cache = cache[dataset._plot_id]
-                if selection_expr in ds_cache:
-                    mask = ds_cache[selection_expr]
-                else:
-                    ds_cache.clear()
+            masks, previous = SelectionDisplay._mask_cache(dataset, selection_expr, cache)
+            if dataset.interface.gridded:
+                mode = 'gridded'
+            elif dataset.interface.multi:
+                mode = 'multi'
+            elif isinstance(element, (Curve, Spread)) and hasattr(dataset.interface, 'mask'):
+                mode = 'mask'
             else:
-                ds_cache = cache[dataset._plot_id] = {}
+                mode = 'select'
+            mask = masks.get(mode)
+            previous = [previous[mode]] if mode in previous else []
             try:
-                if dataset.interface.gridded:
+                if mode == 'gridded':
                     if mask is None:
                         mask = selection_expr.apply(dataset, expanded=True, flat=False, strict=False)
                     selection = dataset.clone(dataset.interface.mask(dataset, ~mask))
-                elif dataset.interface.multi:
+                elif mode == 'multi':
                     if mask is None:
                         mask = selection_expr.apply(dataset, expanded=False, flat=False, strict=False)
                     selection = dataset.iloc[mask]
-                elif isinstance(element, (Curve, Spread)) and hasattr(dataset.interface, 'mask'):
+                elif mode == 'mask':
+                    if mask is None:
+                        mask = _refine_mask(dataset, selection_expr, previous)
                     if mask is None:
                         mask = selection_expr.apply(dataset, keep_index=True, strict=False)
                     selection = dataset.clone(dataset.interface.mask(dataset, ~mask))
                 else:
+                    if mask is None:
+                        mask = _refine_mask(dataset, selection_expr, previous)
                     if mask is None:
                         mask = selection_expr.apply(dataset, compute=False, keep_index=True, strict=False)
                     selection = dataset.select(selection_mask=mask)
@@ -517,7 +682,7 @@ class SelectionDisplay:
             except Exception as e:
                 raise CallbackError("linked_selection aborted because it could not "
                                     "display selection for all elements: %s." % e)
-            ds_cache[selection_expr] = mask
+            masks[mode] = mask
         else:
             selection = element
         return selection
@@ -19,6 +19,7 @@ import pandas as pd
 import numpy as np
 
 from .core import util
+from .core.cache import RangeAccumulator, range_cache
 from .core.ndmapping import UniformNdMapping
 
 # Types supported by Pointer derived streams
@@ -491,6 +492,16 @@ class Pipe(Stream):
         """
         self.event(data=data)
 
+    def update(self, **kwargs):
+        """
+        Invalidates values cached for the previous and new data, which
+        may have been modified inplace, before updating.
+        """
+        if 'data' in kwargs:
+            range_cache.invalidate(self.data)
+            range_cache.invalidate(kwargs['data'])
+        return super().update(**kwargs)
+
     def _on_trigger(self):
         self._memoize_counter += 1
 
@@ -520,12 +531,28 @@ class Buffer(Pipe):
     subscribed to this stream will update the axis ranges when an
     update is pushed. This makes it possible to control whether zooming
     is allowed while streaming.
+
+    The ranges of numeric columns are accumulated incrementally as
+    chunks arrive, so plots do not have to rescan the whole buffer to
+    compute axis and color ranges on each update.
+
+    By default each update concatenates the new chunk with the tail of
+    the existing data, copying the whole buffer on every event. When
+    ``ring=True`` the Buffer instead preallocates column-wise storage
+    for ``length`` rows and writes each incoming chunk into it in
+    O(chunk) time. For NumPy arrays and dictionaries of arrays the
+    ``data`` is then an ordered view onto that storage, which means it
+    is only valid until the next update and should be copied if it has
+    to be retained. DataFrames are rebuilt from the same views but
+    pandas consolidates the columns, so each update still copies the
+    buffered rows once instead of concatenating the chunks.
     """
 
     data = param.Parameter(default=None, constant=True, doc="""
         Arbitrary data being streamed to a DynamicMap callback.""")
 
-    def __init__(self, data, length=1000, index=True, following=True, **params):
+    def __init__(self, data, length=1000, index=True, following=True,
+                 ring=False, **params):
         if isinstance(data, pd.DataFrame):
             example = data
         elif isinstance(data, np.ndarray):
@@ -559,6 +586,12 @@ class Buffer(Pipe):
 
         if index and isinstance(example, pd.DataFrame):
             example = example.reset_index()
+        self._ring = None
+        if ring:
+            if not length:
+                raise ValueError("Buffer ring storage requires a fixed, "
+                                 "non-zero length.")
+            example = self._init_ring(example, length)
         params['data'] = example
         super().__init__(**params)
         self.length = length
@@ -566,6 +599,8 @@ class Buffer(Pipe):
         self._chunk_length = 0
         self._count = 0
         self._index = index
+        self._accumulators = {}
+        self._accumulate(self.data, self.data)
 
 
     def verify(self, x):
@@ -596,16 +631,95 @@ class Buffer(Pipe):
             data = self.data.iloc[:0]
         elif isinstance(self.data, dict):
             data = {k: v[:0] for k, v in self.data.items()}
+        if self._ring is not None:
+            self._ring_rows = self._ring_pos = 0
+        self._accumulators = {}
         with util.disable_constant(self):
             self.data = data
         self.send(data)
 
 
+    def _init_ring(self, example, length):
+        """
+        Allocates the ring storage for the supplied example and writes
+        the example rows into it, returning the ordered view.
+
+        Each column is allocated with twice the buffer length and every
+        row is written to both halves, which guarantees that the last
+        ``length`` rows always occupy a contiguous region that can be
+        exposed as a view without copying.
+        """
+        if isinstance(example, np.ndarray):
+            columns = [np.asarray(example)]
+        elif isinstance(example, pd.DataFrame):
+            columns = []
+            for col in example.columns:
+                if not isinstance(example[col].dtype, np.dtype):
+                    raise ValueError(
+                        f"Buffer ring storage only supports NumPy dtypes, "
+                        f"column {col!r} has dtype {example[col].dtype}.")
+                columns.append(example[col].to_numpy())
+        else:
+            columns = [np.asarray(v) for v in example.values()]
+        self._ring = [np.empty((2*length,)+c.shape[1:], dtype=c.dtype)
+                      for c in columns]
+        self._ring_template = example
+        self._ring_rows = self._ring_pos = 0
+        return self._ring_append(example, length)
+
+
+    def _ring_append(self, data, length=None):
+        """
+        Writes a chunk of data into the ring storage and returns the
+        currently buffered rows in order, as views onto the storage
+        for arrays and dictionaries and as a consolidated copy for
+        DataFrames.
+        """
+        length = length or self.length
+        if isinstance(data, np.ndarray):
+            columns = [data]
+        elif isinstance(data, pd.DataFrame):
+            columns = [data[col].to_numpy() for col in self._ring_template.columns]
+        else:
+            columns = [np.asarray(data[k]) for k in self._ring_template]
+        data_length = len(columns[0]) if columns else 0
+        chunk_length = min(data_length, length)
+        pos = (self._ring_pos + data_length - chunk_length) % length
+        end = pos + chunk_length
+        for i, column in enumerate(columns):
+            store = self._ring[i]
+            column = column[data_length-chunk_length:]
+            dtype = np.result_type(store.dtype, column.dtype)
+            if dtype != store.dtype:
+                store = self._ring[i] = store.astype(dtype)
+            # Write into [pos, end) and mirror into the other half
+            store[pos:end] = column
+            split = min(end, length) - pos
+            store[pos+length:pos+length+split] = column[:split]
+            if end > length:
+                store[:end-length] = column[split:]
+        self._ring_pos = end % length
+        self._ring_rows = min(self._ring_rows + data_length, length)
+        self._chunk_length = data_length
+
+        start = self._ring_pos if self._ring_rows == length else 0
+        views = [store[start:start+self._ring_rows] for store in self._ring]
+        template = self._ring_template
+        if isinstance(template, np.ndarray):
+            return views[0]
+        elif isinstance(template, pd.DataFrame):
+            return pd.DataFrame(dict(zip(template.columns, views)),
+                                columns=template.columns, copy=False)
+        return dict(zip(template, views))
+
+
     def _concat(self, data):
         """
         Concatenate and slice the accepted data types to the defined
         length.
         """
+        if self._ring is not None:
+            return self._ring_append(data)
         if isinstance(data, np.ndarray):
             data_length = len(data)
             if not self.length:
@@ -652,9 +766,76 @@ class Buffer(Pipe):
                 list(data.columns) != list(self.data.columns) and self._index):
                 data = data.reset_index()
             self.verify(data)
+            self._evict(self._rows(data))
             kwargs['data'] = self._concat(data)
             self._count += 1
-        return super().update(**kwargs)
+        skip = super().update(**kwargs)
+        if data is not None:
+            self._accumulate(data, self.data)
+        return skip
+
+
+    @classmethod
+    def _rows(cls, data):
+        "Returns the number of rows in the data"
+        if isinstance(data, dict):
+            return len(next(iter(data.values()))) if data else 0
+        return len(data)
+
+
+    @classmethod
+    def _columns(cls, data):
+        """
+        Returns the numeric columns of the data as tuples of the object
+        and key used to cache the column range, the column name and
+        the column values.
+        """
+        if isinstance(data, np.ndarray):
+            columns = [(data, ('accumulator', i), i, data[:, i])
+                       for i in range(data.shape[1])]
+        elif isinstance(data, pd.DataFrame):
+            columns = [(data, ('accumulator', c), c, data[c].to_numpy())
+                       for c in data.columns]
+        elif isinstance(data, dict):
+            columns = [(v, ('accumulator',), k, v) for k, v in data.items()]
+        else:
+            columns = []
+        return [c for c in columns if RangeAccumulator.supports(c[3])]
+
+
+    def _evict(self, chunk_length):
+        """
+        Removes the rows evicted by appending a chunk of the supplied
+        length from the range accumulators. Must be called before the
+        chunk is concatenated since ring storage is overwritten.
+        """
+        if not self.length or not self._accumulators:
+            return
+        rows = self._rows(self.data)
+        evicted = min(max(rows + chunk_length - self.length, 0), rows)
+        for obj, _, name, values in self._columns(self.data):
+            if name in self._accumulators:
+                self._accumulators[name].evict(values[:evicted])
+            if isinstance(self.data, dict):
+                range_cache.invalidate(obj)
+
+
+    def _accumulate(self, chunk, data):
+        """
+        Appends the chunk to the range accumulators of each numeric
+        column and makes them available to plots via the range cache.
+        """
+        chunk_columns = {name: values for _, _, name, values in self._columns(chunk)}
+        accumulators = {}
+        for obj, key, name, values in self._columns(data):
+            accumulator = self._accumulators.get(name)
+            if accumulator is None or name not in chunk_columns:
+                accumulator = RangeAccumulator(values)
+            else:
+                accumulator.append(chunk_columns[name][-len(values):], values)
+            accumulators[name] = accumulator
+            range_cache.set(obj, key, accumulator)
+        self._accumulators = accumulators
 
 
     @property
@@ -255,6 +255,14 @@ class HomogeneousColumnTests:
                                 kdims=['x'], vdims=['y'])
         self.assertEqual(self.dataset_hm[lambda x: (x >= 5) & (x < 9)], dataset_slice)
 
+    def test_dataset_slice_hm_fractional_bounds(self):
+        dataset_slice = Dataset({'x':range(5, 9), 'y':[2 * i for i in range(5, 9)]},
+                                kdims=['x'], vdims=['y'])
+        self.assertEqual(self.dataset_hm[4.5:8.5], dataset_slice)
+
+    def test_dataset_slice_hm_out_of_bounds(self):
+        self.assertEqual(len(self.dataset_hm[20:30]), 0)
+
     def test_dataset_1D_reduce_hm(self):
         dataset = Dataset({'x':self.xs, 'y':self.y_ints}, kdims=['x'], vdims=['y'])
         self.assertEqual(dataset.reduce('x', np.mean), 10)
@@ -422,6 +430,16 @@ class HeterogeneousColumnTests(HomogeneousColumnTests):
         self.dataset_ht = Dataset({'x':self.xs, 'y':self.ys},
                                   kdims=['x'], vdims=['y'])
 
+    def test_dataset_select_hm_multiple_ranges(self):
+        dataset_slice = Dataset({'x':range(5, 8), 'y':[2 * i for i in range(5, 8)]},
+                                kdims=['x'], vdims=['y'])
+        self.assertEqual(self.dataset_hm.select(x=(3, 9), y=(10, 15)), dataset_slice)
+
+    def test_dataset_slice_unsorted(self):
+        xs = np.array([3, 1, 4, 1, 5, 9, 2, 6])
+        ds = Dataset((xs, xs*2), 'x', 'y')
+        self.assertEqual(ds[2:5], Dataset((xs[[0, 2, 6]], xs[[0, 2, 6]]*2), 'x', 'y'))
+
     # Test the constructor to be supported by all interfaces supporting
     # heterogeneous column types.
 
@@ -523,6 +541,13 @@ class HeterogeneousColumnTests(HomogeneousColumnTests):
         table = self.table.clone(vdims=[Dimension('Weight', nodata=10), 'Height'])
         self.assertEqual(table.range('Weight'), (15, 18))
 
+    def test_dataset_interface_ranges(self):
+        table = self.table.clone(vdims=[Dimension('Weight', nodata=10), 'Height'])
+        ranges = table.interface.ranges(table, ['Age', 'Weight', 'Height'])
+        self.assertEqual(list(ranges), [table.get_dimension(d) for d in ['Age', 'Weight', 'Height']])
+        for d, drange in ranges.items():
+            self.assertEqual(drange, table.interface.range(table, d))
+
     def test_dataset_sort_vdim_ht(self):
         dataset = Dataset({'x':self.xs, 'y':-self.ys},
                           kdims=['x'], vdims=['y'])
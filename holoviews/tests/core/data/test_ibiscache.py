@@ -0,0 +1,65 @@
+"""
+Tests of the caching of executed ibis queries, using a stand-in for
+ibis expressions so they do not require ibis or a database backend.
+"""
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+from holoviews.core.cache import range_cache
+from holoviews.core.data import Dataset
+from holoviews.core.data.ibis import IbisInterface
+from holoviews.element.comparison import ComparisonTestCase
+
+
+class MockExpr:
+
+    def __init__(self, df, executed):
+        self.df = df
+        self.columns = list(df.columns)
+        self.executed = executed
+
+    def __getitem__(self, columns):
+        if isinstance(columns, str):
+            return MockExpr(self.df[[columns]], self.executed)
+        return MockExpr(self.df[columns], self.executed)
+
+    def execute(self):
+        self.executed.append(self.columns)
+        return self.df
+
+
+class IbisExecuteCacheTest(ComparisonTestCase):
+
+    def setUp(self):
+        self.executed = []
+        df = pd.DataFrame({'x': np.arange(10), 'y': np.arange(10.), 'z': np.arange(10.)*2})
+        self.dataset = Dataset(df, 'x', 'y')
+        self.expr = MockExpr(df, self.executed)
+        self.dataset.data = self.expr
+
+    def test_execute_projects_dimensions(self):
+        executed = IbisInterface._execute(self.dataset)
+        self.assertEqual(self.executed, [['x', 'y']])
+        self.assertEqual(executed.dimension_values('y'), np.arange(10.))
+
+    def test_execute_cached(self):
+        IbisInterface._execute(self.dataset)
+        self.assertIsNotNone(self.dataset._cached)
+        self.assertEqual(list(range_cache.lookup(self.expr, 'ibis_executed').columns), ['x', 'y'])
+
+    def test_execute_exceeding_max_bytes_not_cached(self):
+        with patch.object(IbisInterface, 'max_cached_bytes', 100):
+            executed = IbisInterface._execute(self.dataset)
+        self.assertEqual(executed.dimension_values('x'), np.arange(10))
+        self.assertIsNone(self.dataset._cached)
+        self.assertIsNone(range_cache.lookup(self.expr, 'ibis_executed'))
+
+    def test_values_exceeding_max_bytes_fetches_column(self):
+        with patch.object(IbisInterface, 'max_cached_bytes', 100):
+            xs = IbisInterface.values(self.dataset, 'x')
+            ys = IbisInterface.values(self.dataset, 'y')
+        self.assertEqual(xs, np.arange(10))
+        self.assertEqual(ys, np.arange(10.))
+        self.assertEqual(self.executed, [['x', 'y'], ['y']])
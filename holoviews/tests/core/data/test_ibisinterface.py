@@ -1,5 +1,6 @@
 import sqlite3
 from unittest import SkipTest
+from unittest.mock import patch
 
 from tempfile import NamedTemporaryFile
 
@@ -257,6 +258,26 @@ class IbisDatasetTest(HeterogeneousColumnTests, ScalarColumnTests, InterfaceTest
 
             self.compare_dataset(expected, result, msg=str(agg))
 
+    def test_dataset_values_execute_once(self):
+        with patch.object(IbisInterface, '_execute', wraps=IbisInterface._execute) as execute:
+            self.assertEqual(self.table.dimension_values('Age'), self.age)
+            self.assertEqual(self.table.dimension_values('Weight'), self.weight)
+            self.assertEqual(len(self.table), 3)
+            self.assertEqual(self.table.clone().dimension_values('Height'), self.height)
+        self.assertEqual(execute.call_count, 1)
+
+    def test_dataset_values_execute_projected_columns(self):
+        table = self.table.clone(vdims=['Weight'])
+        table.dimension_values('Age')
+        self.assertEqual(list(table.interface.materialized(table).data.columns),
+                         ['Gender', 'Age', 'Weight'])
+
+    def test_dataset_select_values_lazy(self):
+        selected = self.table.select(Age=(11, None)).sort('Age')
+        self.assertIsInstance(selected.data, ibis.expr.types.Expr)
+        self.assertIsNone(selected.interface.materialized(selected))
+        self.assertEqual(selected.dimension_values('Weight'), np.array([10, 18]))
+
     if not IbisInterface.has_rowid():
 
         def test_dataset_iloc_slice_rows_slice_cols(self):
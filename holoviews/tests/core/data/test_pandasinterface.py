@@ -1,11 +1,13 @@
 import numpy as np
 import pandas as pd
 
+from holoviews import config
+from holoviews.core.cache import range_cache
 from holoviews.core.dimension import Dimension
 from holoviews.core.data import Dataset
 from holoviews.core.data.interface import DataError
 from holoviews.core.spaces import HoloMap
-from holoviews.element import Scatter, Points, Distribution
+from holoviews.element import Curve, Scatter, Points, Distribution
 
 
 from .base import HeterogeneousColumnTests, InterfaceTests
@@ -171,3 +173,41 @@ class PandasInterfaceTests(BasePandasInterfaceTests):
     data_type = pd.DataFrame
 
     __test__ = True
+
+    def test_select_slice_sorted(self):
+        df = pd.DataFrame({'x': np.arange(10.), 'y': np.arange(10)})
+        ds = Dataset(df, 'x', 'y')
+        self.assertEqual(ds.interface.select_slice(ds, {'x': (2.5, 7)}), slice(3, 7))
+        self.assertTrue(ds.interface.sorted(ds, 'x'))
+
+    def test_select_slice_modified_inplace(self):
+        df = pd.DataFrame({'x': np.arange(10.), 'y': np.arange(10)})
+        curve = Curve(df)
+        self.assertEqual(len(curve.select(x=(2, 5))), 3)
+        df['x'] = df['x'].values[::-1].copy()
+        self.assertEqual(curve.select(x=(2, 5)).dimension_values('x'),
+                         np.array([4., 3., 2.]))
+
+    def test_select_slice_sorted_cached(self):
+        df = pd.DataFrame({'x': np.arange(10.), 'y': np.arange(10)})
+        ds = Dataset(df, 'x', 'y')
+        cache_ranges = config.cache_ranges
+        config.cache_ranges = True
+        try:
+            self.assertTrue(ds.interface.sorted(ds, 'x'))
+        finally:
+            config.cache_ranges = cache_ranges
+        self.assertTrue(range_cache.lookup(df, ('sorted', 'x')))
+
+    def test_select_slice_datetime(self):
+        df = pd.DataFrame({'x': pd.date_range('2020-01-01', periods=10), 'y': np.arange(10)})
+        ds = Dataset(df, 'x', 'y')
+        selection = {'x': (pd.Timestamp('2020-01-03'), '2020-01-05')}
+        self.assertEqual(ds.interface.select_slice(ds, selection), slice(2, 4))
+
+    def test_select_slice_unsorted(self):
+        df = pd.DataFrame({'x': [1, 3, 2, np.nan], 'y': np.arange(4)})
+        ds = Dataset(df, 'x', 'y')
+        self.assertIsNone(ds.interface.select_slice(ds, {'x': (1, 3)}))
+        self.assertIsNone(ds.interface.select_slice(ds, {'x': [1, 3]}))
+        self.assertFalse(ds.interface.sorted(ds, 'x'))
@@ -0,0 +1,105 @@
+import numpy as np
+import pandas as pd
+
+from holoviews import Dataset, Points, config
+from holoviews.core.data.util import SpatialIndex, spatial_index
+from holoviews.element.comparison import ComparisonTestCase
+
+
+class SpatialIndexTests(ComparisonTestCase):
+
+    def setUp(self):
+        np.random.seed(1)
+        self.xs = np.random.randn(10000)
+        self.ys = np.random.randn(10000)
+        self.xs[:10] = np.nan
+        self.index = SpatialIndex(self.xs, self.ys)
+
+    def test_box(self):
+        mask = (self.xs >= -0.5) & (self.xs < 0.2) & (self.ys >= 0) & (self.ys < 1)
+        self.assertEqual(self.index.box(-0.5, 0.2, 0, 1), np.flatnonzero(mask))
+
+    def test_box_closed_both(self):
+        x0, x1 = self.xs[20], self.xs[30]
+        x0, x1 = min(x0, x1), max(x0, x1)
+        mask = (self.xs >= x0) & (self.xs <= x1) & (self.ys >= -1) & (self.ys <= 1)
+        self.assertEqual(self.index.box(x0, x1, -1, 1, closed='both'), np.flatnonzero(mask))
+
+    def test_box_unbounded(self):
+        mask = (self.xs >= 1) & np.isfinite(self.ys)
+        self.assertEqual(self.index.box(x0=1), np.flatnonzero(mask))
+
+    def test_box_outside_bounds(self):
+        self.assertEqual(len(self.index.box(10, 20, 10, 20)), 0)
+
+    def test_box_excludes_nans(self):
+        self.assertEqual(len(self.index.box()), 9990)
+
+    def test_box_unbounded_zero_extent(self):
+        ys = np.linspace(0, 1, 10000)
+        index = SpatialIndex(np.zeros(10000), ys)
+        mask = (ys >= 0.2) & (ys < 0.21)
+        self.assertEqual(index.box(None, 5, 0.2, 0.21), np.flatnonzero(mask))
+        self.assertEqual(index.box(-np.inf, np.inf, 0.2, 0.21), np.flatnonzero(mask))
+
+    def test_nearest(self):
+        for x, y in [(0, 0), (2.5, -1), (-10, 10)]:
+            expected = np.nanargmin((self.xs-x)**2 + (self.ys-y)**2)
+            self.assertEqual(self.index.nearest(x, y), expected)
+
+    def test_nearest_no_valid_points(self):
+        index = SpatialIndex(np.array([np.nan]), np.array([0.]))
+        self.assertIsNone(index.nearest(0, 0))
+
+
+class SpatialIndexDatasetTests(ComparisonTestCase):
+
+    def setUp(self):
+        np.random.seed(1)
+        self.df = pd.DataFrame({'x': np.random.randn(1000), 'y': np.random.randn(1000),
+                                'z': np.arange(1000)})
+        self._spatial_index = config.spatial_index
+        config.spatial_index = True
+
+    def tearDown(self):
+        config.spatial_index = self._spatial_index
+
+    def test_spatial_index_disabled(self):
+        config.spatial_index = False
+        self.assertIsNone(spatial_index(self.df.x, self.df.y))
+
+    def test_spatial_index_cached(self):
+        index = spatial_index(self.df.x, self.df.y)
+        self.assertIsInstance(index, SpatialIndex)
+        self.assertIs(spatial_index(self.df.x.values, self.df.y.values), index)
+
+    def test_spatial_index_non_numeric(self):
+        self.assertIsNone(spatial_index(np.array(['a', 'b']), np.array([1, 2])))
+
+    def test_select_box(self):
+        points = Points(self.df, ['x', 'y'])
+        selected = points.select(x=(0, 0.5), y=(-0.5, 0))
+        mask = (self.df.x >= 0) & (self.df.x < 0.5) & (self.df.y >= -0.5) & (self.df.y < 0)
+        self.assertEqual(selected, points.clone(self.df[mask]))
+
+    def test_select_box_zero_extent(self):
+        points = Points((np.zeros(10000), np.linspace(0, 1, 10000)))
+        selected = points.select(x=(None, 5), y=(0.2, 0.21))
+        config.spatial_index = False
+        self.assertEqual(selected, points.select(x=(None, 5), y=(0.2, 0.21)))
+
+    def test_select_box_dictionary(self):
+        ds = Dataset({'x': self.df.x.values, 'y': self.df.y.values}, ['x', 'y'],
+                     datatype=['dictionary'])
+        mask = (self.df.x >= 0) & (self.df.x < 0.5) & (self.df.y >= -0.5) & (self.df.y < 0)
+        self.assertEqual(ds.select(x=(0, 0.5), y=(-0.5, 0)).dimension_values('x'),
+                         self.df.x.values[mask])
+        self.assertEqual(len(ds.select(x=(10, 20), y=(0, 1))), 0)
+
+    def test_closest_2d(self):
+        points = Points(self.df, ['x', 'y'])
+        idx = np.argmin((self.df.x.values-0.3)**2 + (self.df.y.values-0.1)**2)
+        expected = [(self.df.x[idx], self.df.y[idx])]
+        self.assertEqual(points.closest([(0.3, 0.1)]), expected)
+        config.spatial_index = False
+        self.assertEqual(points.closest([(0.3, 0.1)]), expected)
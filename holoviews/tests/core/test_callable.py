@@ -2,13 +2,21 @@
 Unit tests of the Callable object that wraps user callbacks. Also test
 how DynamicMap validates and invokes Callable based on its signature.
 """
+import asyncio
+import os
+import tempfile
+
 from functools import partial
+from unittest.mock import patch
 
+import numpy as np
+import pandas as pd
 import param
 
 from holoviews.element.comparison import ComparisonTestCase
-from holoviews.element import Scatter
-from holoviews import streams
+from holoviews.element import Curve, Scatter
+from holoviews import Dimension, streams
+from holoviews.core.cache import DiskCache
 from holoviews.core.spaces import Callable, Generator, DynamicMap
 from holoviews.core.operation import OperationCallable
 from holoviews.operation import contours
@@ -355,3 +363,168 @@ class TestDynamicMapInvocation(ComparisonTestCase):
         xy = streams.PointerXY(x=1, y=2)
         dmap = DynamicMap(fn, kdims=['A'], streams=[xy])
         self.assertEqual(dmap['Test'], Scatter([(1, 2)], label='Test'))
+
+
+class TestAsyncCallable(ComparisonTestCase):
+
+    def test_coroutine_function_called_synchronously(self):
+        async def fn(x):
+            await asyncio.sleep(0)
+            return Curve([x, 2*x])
+        dmap = DynamicMap(fn, kdims=['x'])
+        self.assertTrue(dmap.callback.is_async)
+        self.assertEqual(dmap[1], Curve([1, 2]))
+
+    def test_coroutine_function_called_synchronously_in_running_loop(self):
+        async def fn(x):
+            return Curve([x, 2*x])
+        c = Callable(fn)
+        async def call():
+            return c(1)
+        with self.assertRaises(RuntimeError):
+            asyncio.run(call())
+        self.assertEqual(asyncio.run(c.call_async(1)), Curve([1, 2]))
+
+    def test_executor_callable_is_async(self):
+        self.assertTrue(Callable(lambda x: x, executor='thread').is_async)
+        self.assertFalse(Callable(lambda x: x).is_async)
+
+    def test_call_async_executor(self):
+        c = Callable(lambda x: x+1, executor='thread')
+        self.assertEqual(asyncio.run(c.call_async(1)), 2)
+
+    def test_call_async_invalid_executor(self):
+        c = Callable(lambda x: x+1, executor='invalid')
+        with self.assertRaises(ValueError):
+            asyncio.run(c.call_async(1))
+
+    def test_call_async_prefetches_dynamicmap(self):
+        calls = []
+        def fn(x):
+            calls.append(x)
+            return Curve([x, 2*x])
+        dmap = DynamicMap(Callable(fn, executor='thread'), kdims=['x'])
+        asyncio.run(dmap._execute_callback_async(1))
+        self.assertEqual(dmap[1], Curve([1, 2]))
+        self.assertEqual(calls, [1])
+
+    def test_call_async_prefetch_consumed_once(self):
+        calls = []
+        def fn(x):
+            calls.append(x)
+            return Curve([x, 2*x])
+        c = Callable(fn, memoize=False)
+        asyncio.run(c.call_async(1))
+        c(1)
+        c(1)
+        self.assertEqual(calls, [1, 1])
+
+    def test_call_async_prefetch_mismatched_key(self):
+        calls = []
+        async def fn(x):
+            calls.append(x)
+            return x
+        c = Callable(fn)
+        asyncio.run(c.call_async(1))
+        self.assertEqual(c(2), 2)
+        self.assertEqual(calls, [1, 2])
+
+
+def disk_cached_curve(x, calls):
+    calls.append(x)
+    df = pd.DataFrame({'x': np.arange(5), 'y': np.arange(5.)*x})
+    return Curve(df, 'x', 'y')
+
+
+class TestDiskCache(LoggingComparisonTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.cache = DiskCache(self.tmpdir.name)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+        super().tearDown()
+
+    def test_disk_cache_default_path_private(self):
+        with patch.dict(os.environ, {'XDG_CACHE_HOME': self.tmpdir.name}):
+            cache = DiskCache()
+        self.assertEqual(cache.path, os.path.join(self.tmpdir.name, 'holoviews'))
+        self.assertEqual(os.stat(cache.path).st_mode & 0o777, 0o700)
+
+    def test_disk_cache_default_path_existing_made_private(self):
+        path = os.path.join(self.tmpdir.name, 'holoviews')
+        os.makedirs(path)
+        os.chmod(path, 0o755)
+        with patch.dict(os.environ, {'XDG_CACHE_HOME': self.tmpdir.name}):
+            cache = DiskCache()
+        self.assertEqual(os.stat(cache.path).st_mode & 0o777, 0o700)
+
+    def test_disk_cache_key_hashes_full_array(self):
+        arr = np.zeros(2_000_000)
+        modified = arr.copy()
+        # An element outside the sample hashed by HashableJSON
+        modified[0] = 1
+        self.assertNotEqual(self.cache.key(disk_cached_curve, (arr,)),
+                            self.cache.key(disk_cached_curve, (modified,)))
+        self.assertEqual(self.cache.key(disk_cached_curve, (arr,)),
+                         self.cache.key(disk_cached_curve, (arr.copy(),)))
+
+    def test_disk_cache_key_hashes_full_dataframe(self):
+        df = pd.DataFrame({'x': np.zeros(1_000_001)})
+        modified = df.copy()
+        # A row outside the sample hashed by HashableJSON
+        modified.iloc[985_772, 0] = 1
+        self.assertNotEqual(self.cache.key(disk_cached_curve, (df,)),
+                            self.cache.key(disk_cached_curve, (modified,)))
+
+    def test_disk_cache_key_object_array(self):
+        # Equal values held by distinct objects
+        arrays = [np.array([str(i) * 3 for i in range(3)], dtype=object) for _ in range(2)]
+        self.assertEqual(self.cache.key(disk_cached_curve, (arrays[0],)),
+                         self.cache.key(disk_cached_curve, (arrays[1],)))
+
+    def test_disk_cache_identity_stable(self):
+        self.assertEqual(DiskCache.identity(disk_cached_curve),
+                         DiskCache.identity(disk_cached_curve))
+
+    def test_disk_cache_identity_differs_by_code(self):
+        self.assertNotEqual(DiskCache.identity(lambda x: x+1),
+                            DiskCache.identity(lambda x: x+2))
+
+    def test_disk_cache_identity_unhashable_closure(self):
+        obj = object()
+        self.assertIsNone(DiskCache.identity(lambda x: obj))
+
+    def test_disk_cache_store_load(self):
+        curve = disk_cached_curve(2, [])
+        self.cache.store('abcdef', curve)
+        self.assertIn('abcdef', self.cache)
+        self.assertEqual(self.cache.load('abcdef'), curve)
+
+    def test_disk_cache_load_missing(self):
+        with self.assertRaises(KeyError):
+            self.cache.load('abcdef')
+
+    def test_disk_cache_dynamicmap_reloads(self):
+        calls = []
+        def make_dmap():
+            fn = partial(disk_cached_curve, calls=calls)
+            return DynamicMap(Callable(fn, disk_cache=self.cache), kdims=['x'])
+        # The calls list changes the identity of the partial so use a namespace
+        self.cache.namespace = 'disk_cached_curve'
+        first = make_dmap()[3]
+        second = make_dmap()[3]
+        self.assertEqual(calls, [3])
+        self.assertEqual(first, second)
+
+    def test_disk_cache_unpicklable_value(self):
+        def callback(x):
+            return Curve([1, 2, 3], vdims=Dimension('y', value_format=lambda v: str(v)))
+        self.cache.namespace = 'unpicklable'
+        dmap = DynamicMap(Callable(callback, disk_cache=self.cache), kdims=['x'])
+        self.assertEqual(dmap[1].data, Curve([1, 2, 3]).data)
+        self.assertEqual(dmap[2].data, Curve([1, 2, 3]).data)
+        self.assertEqual(len(self.log_handler.messages['WARNING']), 1)
+        self.log_handler.assertContains('WARNING', 'cannot be pickled')
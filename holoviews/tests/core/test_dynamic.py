@@ -1,11 +1,14 @@
-import uuid
+import threading
 import time
+import uuid
 from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 import param
 import numpy as np
 from holoviews import Dimension, NdLayout, GridSpace, Layout, NdOverlay
+from holoviews.core.cache import LFUCachePolicy, LRUCachePolicy
 from holoviews.core.spaces import DynamicMap, HoloMap, Callable
 from holoviews.core.options import Store
 from holoviews.element import Image, Scatter, Curve, Text, Points
@@ -476,6 +479,187 @@ class DynamicMapMethods(ComparisonTestCase):
 
 
 
+class DynamicMapCachePolicy(ComparisonTestCase):
+
+    def _dmap(self, policy, fn=None):
+        fn = fn or (lambda x: Curve([x]))
+        return DynamicMap(fn, kdims=[Dimension('x', range=(0, 100))],
+                          cache_policy=policy)
+
+    def test_lru_cache_policy_evicts_least_recently_used(self):
+        dmap = self._dmap(LRUCachePolicy(max_items=2))
+        dmap[1]
+        dmap[2]
+        dmap[1]
+        dmap[3]
+        self.assertEqual(dmap.keys(), [1, 3])
+        self.assertEqual(dmap.cache_policy.hits, 1)
+        self.assertEqual(dmap.cache_policy.misses, 3)
+        self.assertEqual(dmap.cache_policy.evictions, 1)
+
+    def test_lfu_cache_policy_evicts_least_frequently_used(self):
+        dmap = self._dmap(LFUCachePolicy(max_items=2))
+        dmap[1]
+        dmap[1]
+        dmap[2]
+        dmap[3]
+        self.assertEqual(dmap.keys(), [1, 3])
+
+    def test_cache_policy_max_bytes(self):
+        def fn(x):
+            return Image(np.zeros((100, 100)) if x % 2 else np.zeros((2, 2)))
+        dmap = self._dmap(LRUCachePolicy(max_bytes=100*100*8+100), fn)
+        for i in range(1, 6):
+            dmap[i]
+        self.assertEqual(dmap.keys(), [4, 5])
+        self.assertEqual(dmap.cache_policy.nbytes, 100*100*8+2*2*8)
+
+    def test_cache_policy_ttl(self):
+        dmap = self._dmap(LRUCachePolicy(ttl=0.05))
+        dmap[1]
+        dmap[1]
+        time.sleep(0.1)
+        dmap[1]
+        self.assertEqual(dmap.cache_policy.stats['hits'], 1)
+        self.assertEqual(dmap.cache_policy.stats['misses'], 2)
+        self.assertEqual(dmap.cache_policy.stats['evictions'], 1)
+
+    def test_cache_policy_defaults_to_cache_size(self):
+        dmap = DynamicMap(lambda x: Curve([x]), kdims=[Dimension('x', range=(0, 100))],
+                          cache_size=2, cache_policy=LRUCachePolicy())
+        for i in range(1, 4):
+            dmap[i]
+        self.assertEqual(dmap.keys(), [2, 3])
+
+    def test_cache_policy_reset(self):
+        dmap = self._dmap(LRUCachePolicy())
+        dmap[1]
+        dmap.reset()
+        self.assertEqual(dmap.cache_policy.stats['items'], 0)
+        self.assertEqual(dmap.cache_policy.stats['misses'], 0)
+
+    def test_cache_policy_cloned(self):
+        dmap = self._dmap(LRUCachePolicy(max_items=3))
+        clone = dmap.clone()
+        self.assertIsNot(clone.cache_policy, dmap.cache_policy)
+        self.assertEqual(clone.cache_policy.max_items, 3)
+
+
+class DynamicMapExecutor(LoggingComparisonTestCase):
+
+    def _dmap(self, executor, fn=None):
+        fn = fn or (lambda x, y: Curve([x, y]))
+        kdims = [Dimension('x', values=[1, 2, 3]), Dimension('y', values=[0, 1])]
+        return DynamicMap(fn, kdims=kdims, executor=executor)
+
+    def test_executor_cross_product_key_order(self):
+        serial = self._dmap(None)[[1, 2, 3], [0, 1]]
+        parallel = self._dmap('thread')[[1, 2, 3], [0, 1]]
+        self.assertEqual(parallel.keys(), serial.keys())
+        self.assertEqual(HoloMap(parallel), HoloMap(serial))
+
+    def test_executor_instance_used(self):
+        threads = set()
+        def fn(x, y):
+            threads.add(threading.get_ident())
+            return Curve([x, y])
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            dmap = self._dmap(executor, fn)
+            dmap[[1, 2, 3], [0, 1]]
+        self.assertNotIn(threading.get_ident(), threads)
+
+    def test_executor_uses_cache(self):
+        calls = []
+        def fn(x, y):
+            calls.append((x, y))
+            return Curve([x, y])
+        dmap = self._dmap('thread', fn)
+        dmap[1, 0]
+        dmap[[1, 2], [0]]
+        self.assertEqual(sorted(calls), [(1, 0), (2, 0)])
+
+    def test_executor_layout(self):
+        layout = self._dmap('thread').layout('y')
+        self.assertEqual(layout.keys(), [0, 1])
+        self.assertEqual(layout[1][3], self._dmap(None).layout('y')[1][3])
+
+    def test_executor_calls_do_not_share_state(self):
+        def fn(x, y):
+            time.sleep(0.01)
+            if x == 2 and y == 1:
+                raise ValueError('Invalid key')
+            return Curve([x, y])
+        dmap = self._dmap('thread', fn)
+        with self.assertRaises(ValueError):
+            dmap[[1, 2, 3], [0, 1]]
+        self.assertIsNone(dmap.callback.args)
+        self.log_handler.assertContains('WARNING', 'x=2, y=1')
+
+    def test_executor_on_callable(self):
+        dmap = DynamicMap(Callable(lambda x: Curve([x]), executor='thread'), kdims=['x'])
+        self.assertEqual(dmap.callback.executor, 'thread')
+        self.assertEqual(dmap[[1, 2]].keys(), [1, 2])
+
+    def test_executor_process_unpicklable_falls_back_to_threads(self):
+        dmap = self._dmap('process')
+        self.assertEqual(dmap[[1, 2], [0]].keys(), [(1, 0), (2, 0)])
+        self.log_handler.assertContains('WARNING', 'could not be pickled')
+
+    def _threaded_dmap(self, fn=None):
+        threads = []
+        def callback(x, y):
+            threads.append(threading.get_ident())
+            return (fn or Curve)([x, y])
+        return self._dmap('thread', callback), threads
+
+    def test_executor_layout_all_dimensions(self):
+        dmap, threads = self._threaded_dmap()
+        layout = dmap.layout()
+        self.assertEqual(layout.keys(), [(x, y) for x in [1, 2, 3] for y in [0, 1]])
+        self.assertEqual(len(threads), 6)
+        self.assertNotIn(threading.get_ident(), threads)
+
+    def test_executor_grid(self):
+        dmap, threads = self._threaded_dmap()
+        grid = dmap.grid(['x', 'y'])
+        self.assertEqual(grid, self._dmap(None).grid(['x', 'y']))
+        self.assertEqual(len(threads), 6)
+        self.assertNotIn(threading.get_ident(), threads)
+
+    def test_executor_redim_values(self):
+        dmap, threads = self._threaded_dmap()
+        redimmed = dmap.redim.values(x=[1, 2])
+        self.assertEqual(redimmed.callback.executor, 'thread')
+        redimmed[[1, 2], [0, 1]]
+        self.assertEqual(len(threads), 4)
+        self.assertNotIn(threading.get_ident(), threads)
+
+    def test_executor_redim_range(self):
+        dmap = self._dmap('thread')
+        self.assertEqual(dmap.redim.range(x=(0, 5)).callback.executor, 'thread')
+
+    def test_executor_dynamic_operation(self):
+        dmap, threads = self._threaded_dmap()
+        mapped = Dynamic(dmap, operation=lambda obj: obj.relabel('A'))
+        self.assertEqual(mapped.callback.executor, 'thread')
+        self.assertEqual(mapped[[1, 2], [0]].last, Curve([2, 0], label='A'))
+        self.assertNotIn(threading.get_ident(), threads)
+
+    def test_executor_dynamic_operation_process_pool_uses_threads(self):
+        dmap = self._dmap('process')
+        mapped = Dynamic(dmap, operation=lambda obj: obj.relabel('A'))
+        self.assertEqual(mapped.callback.executor, 'thread')
+
+    def test_executor_collate(self):
+        dmap, threads = self._threaded_dmap(lambda xy: Curve(xy) + Points(xy))
+        curves = dmap.collate().Curve.I
+        self.assertEqual(curves[[1, 2, 3], [0, 1]].keys(),
+                         [(x, y) for x in [1, 2, 3] for y in [0, 1]])
+        # The initial key is evaluated by collate to determine the layout
+        self.assertEqual(threads.count(threading.get_ident()), 1)
+        self.assertEqual(len(threads), 7)
+
+
 class DynamicMapOptionsTests(CustomBackendTestCase):
 
     def test_dynamic_options(self):
@@ -484,6 +668,19 @@ class DynamicMapOptionsTests(CustomBackendTestCase):
         opts = Store.lookup_options('backend_1', dmap[0], 'plot')
         self.assertEqual(opts.options, {'plot_opt1': 'red'})
 
+    def test_dynamic_options_executor(self):
+        threads = []
+        def callback(X):
+            threads.append(threading.get_ident())
+            return ExampleElement(None)
+        dmap = DynamicMap(Callable(callback, executor='thread'),
+                          kdims=[Dimension('X', values=[0, 1, 2])])
+        dmap = dmap.options(plot_opt1='red')
+        self.assertEqual(dmap.callback.executor, 'thread')
+        dmap[[0, 1, 2]]
+        self.assertEqual(len(threads), 3)
+        self.assertNotIn(threading.get_ident(), threads)
+
     def test_dynamic_options_no_clone(self):
         dmap = DynamicMap(lambda X: ExampleElement(None), kdims=['X']).redim.range(X=(0,10))
         dmap.options(plot_opt1='red', clone=False)
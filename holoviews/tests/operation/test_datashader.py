@@ -1,6 +1,9 @@
+import asyncio
 import datetime as dt
+import threading
 
 from unittest import SkipTest, skipIf
+from unittest.mock import patch
 
 import numpy as np
 import pandas as pd
@@ -11,7 +14,10 @@ from holoviews import (
     QuadMesh, NdOverlay, Contours, Spikes, Spread, Area, Rectangles,
     Segments, Polygons, Nodes
 )
-from holoviews.streams import Tap
+from holoviews.core.cache import range_cache
+from holoviews.core.spaces import get_executor
+from holoviews.core.util import config
+from holoviews.streams import Pipe, Tap
 from holoviews.element.comparison import ComparisonTestCase
 from numpy import nan
 from packaging.version import Version
@@ -23,7 +29,7 @@ try:
     from holoviews.operation.datashader import (
         aggregate, regrid, ds_version, stack, directly_connect_edges,
         shade, spread, rasterize, datashade, AggregationOperation,
-        inspect, inspect_points, inspect_polygons
+        inspect, inspect_points, inspect_polygons, tile_cache, Refinement
     )
 except ImportError:
     raise SkipTest('Datashader not available')
@@ -717,6 +723,63 @@ class DatashaderAggregateTests(ComparisonTestCase):
         expected = Image((xs, ys, arr), vdims=Dimension('Count', nodata=0))
         self.assertEqual(agg, expected)
 
+    def test_aggregate_not_memoized_by_default(self):
+        df = pd.DataFrame({'x': [0.2, 0.4, 0], 'y': [0.3, 0.7, 0.99]})
+        params = dict(dynamic=False, x_range=(0, 1), y_range=(0, 1), width=2, height=2)
+        aggregate(Points(df), **params)
+        df['x'] *= 2
+        img = aggregate(Points(df), **params)
+        expected = Image(([0.25, 0.75], [0.25, 0.75], [[1, 0], [1, 1]]),
+                         vdims=Dimension('Count', nodata=0))
+        self.assertEqual(img, expected)
+        self.assertIsNone(range_cache._entries.get(id(df)))
+
+    def test_aggregate_dask_does_not_prune_partitions_by_default(self):
+        df = pd.DataFrame({'x': np.arange(100.), 'y': np.arange(100.) % 10})
+        ddf = dd.from_pandas(df, npartitions=10)
+        params = dict(dynamic=False, x_range=(22, 38), y_range=(0, 10), width=8, height=5)
+        with patch.object(ds.Canvas, 'points', autospec=True,
+                          side_effect=ds.Canvas.points) as canvas_points:
+            img = aggregate(Points(ddf), **params)
+        self.assertEqual(canvas_points.call_args[0][1].npartitions, 10)
+        self.assertEqual(img, aggregate(Points(df), **params))
+        self.assertIsNone(range_cache.lookup(ddf, ('partition_bounds', 'x', 'y')))
+
+    def test_aggregate_dask_prunes_partitions_with_cached_bounds(self):
+        df = pd.DataFrame({'x': np.arange(100.), 'y': np.arange(100.) % 10})
+        ddf = dd.from_pandas(df, npartitions=10)
+        params = dict(dynamic=False, x_range=(22, 38), y_range=(0, 10), width=8, height=5)
+        aggregate(Points(ddf), prune_partitions=True, **params)
+        with patch.object(ds.Canvas, 'points', autospec=True,
+                          side_effect=ds.Canvas.points) as canvas_points:
+            img = aggregate(Points(ddf), **params)
+        self.assertEqual(canvas_points.call_args[0][1].npartitions, 2)
+        self.assertEqual(img, aggregate(Points(df), **params))
+
+    def test_aggregate_dask_prunes_partitions(self):
+        df = pd.DataFrame({'x': np.arange(100.), 'y': np.arange(100.) % 10})
+        ddf = dd.from_pandas(df, npartitions=10)
+        params = dict(dynamic=False, x_range=(22, 38), y_range=(0, 10), width=8, height=5,
+                      prune_partitions=True)
+        with patch.object(ds.Canvas, 'points', autospec=True,
+                          side_effect=ds.Canvas.points) as canvas_points:
+            img = aggregate(Points(ddf), **params)
+        self.assertEqual(canvas_points.call_args[0][1].npartitions, 2)
+        self.assertEqual(img, aggregate(Points(df), **params))
+        bounds = range_cache.lookup(ddf, ('partition_bounds', 'x', 'y'))
+        self.assertEqual(bounds[0], np.arange(0., 100, 10))
+
+    def test_aggregate_dask_prunes_all_partitions(self):
+        df = pd.DataFrame({'x': np.arange(100.), 'y': np.arange(100.) % 10})
+        ddf = dd.from_pandas(df, npartitions=10)
+        params = dict(dynamic=False, x_range=(200, 300), y_range=(0, 10), width=8, height=5,
+                      prune_partitions=True)
+        with patch.object(ds.Canvas, 'points', autospec=True,
+                          side_effect=ds.Canvas.points) as canvas_points:
+            img = aggregate(Points(ddf), **params)
+        self.assertEqual(canvas_points.call_args[0][1].npartitions, 1)
+        self.assertEqual(img, aggregate(Points(df), **params))
+
 
 
 class DatashaderCatAggregateTests(ComparisonTestCase):
@@ -750,6 +813,265 @@ class DatashaderCatAggregateTests(ComparisonTestCase):
 
 
 
+class DatashaderMemoizedAggregateTests(ComparisonTestCase):
+
+    def setUp(self):
+        self._cache_ranges = config.cache_ranges
+        config.cache_ranges = True
+
+    def tearDown(self):
+        config.cache_ranges = self._cache_ranges
+
+    def test_aggregate_memoized_across_shade_parameters(self):
+        points = Points(pd.DataFrame({'x': np.random.randn(100), 'y': np.random.randn(100)}))
+        with patch.object(ds.Canvas, 'points', autospec=True,
+                          side_effect=ds.Canvas.points) as canvas_points:
+            for cmap in ['fire', 'blues']:
+                datashade(points, dynamic=False, width=20, height=20, cmap=cmap)
+            self.assertEqual(canvas_points.call_count, 1)
+            spread(rasterize(points, dynamic=False, width=20, height=20), px=2)
+            self.assertEqual(canvas_points.call_count, 1)
+            rasterize(points, dynamic=False, width=30, height=20)
+        self.assertEqual(canvas_points.call_count, 2)
+
+    def test_aggregate_memoized_not_shared(self):
+        points = Points(pd.DataFrame({'x': [0.2, 0.4, 0], 'y': [0.3, 0.7, 0.99]}))
+        params = dict(dynamic=False, x_range=(0, 1), y_range=(0, 1), width=2, height=2)
+        first = aggregate(points, **params)
+        first.data['Count'].values[:] = 10
+        second = aggregate(points, **params)
+        second.data['Count'].values[:] = 20
+        img = aggregate(points, **params)
+        expected = Image(([0.25, 0.75], [0.25, 0.75], [[1, 0], [2, 0]]),
+                         vdims=Dimension('Count', nodata=0))
+        self.assertEqual(img, expected)
+
+    def test_aggregate_memoized_invalidated(self):
+        df = pd.DataFrame({'x': [0.2, 0.4, 0], 'y': [0.3, 0.7, 0.99]})
+        params = dict(dynamic=False, x_range=(0, 1), y_range=(0, 1), width=2, height=2)
+        aggregate(Points(df), **params)
+        df.iloc[0] = (0.8, 0.3)
+        range_cache.invalidate(df)
+        img = aggregate(Points(df), **params)
+        expected = Image(([0.25, 0.75], [0.25, 0.75], [[0, 1], [2, 0]]),
+                         vdims=Dimension('Count', nodata=0))
+        self.assertEqual(img, expected)
+
+
+class DatashaderTiledAggregateTests(ComparisonTestCase):
+
+    def setUp(self):
+        np.random.seed(1)
+        self.df = pd.DataFrame({'x': np.random.randn(10000), 'y': np.random.randn(10000),
+                                'z': np.random.rand(10000)})
+        self.points = Points(self.df, vdims='z')
+        self._max_bytes = tile_cache.max_bytes
+        tile_cache.clear()
+
+    def tearDown(self):
+        tile_cache.max_bytes = self._max_bytes
+        tile_cache.clear()
+
+    def _aggregate(self, **kwargs):
+        params = dict(dynamic=False, width=40, height=30, x_range=(-5, 5),
+                      y_range=(-5, 5), tile_size=16)
+        return aggregate(self.points, **dict(params, **kwargs))
+
+    def test_aggregate_tiles_count_total(self):
+        img = self._aggregate()
+        self.assertEqual(img.data['Count'].shape, (30, 40))
+        self.assertEqual(img.bounds.lbrt(), (-5, -5, 5, 5))
+        self.assertAlmostEqual(img.data['Count'].values.sum(), 10000, delta=10)
+
+    def test_aggregate_tiles_count_rounded(self):
+        img = self._aggregate(x_range=(-1.03, 1.01))
+        counts = img.data['Count'].values
+        self.assertEqual(counts.dtype, self._aggregate(tile_size=None).data['Count'].dtype)
+        self.assertEqual(counts, np.round(counts))
+
+    def test_aggregate_tiles_pipe_inplace_update(self):
+        pipe = Pipe(data=self.df)
+        self._aggregate()
+        self.df['x'] += 2
+        pipe.send(self.df)
+        self.assertEqual(len(tile_cache), 0)
+        img = self._aggregate(x_range=(0, 10))
+        self.assertAlmostEqual(img.data['Count'].values.sum(),
+                               self.df.x.between(0, 10).sum(), delta=10)
+
+    def test_aggregate_tiles_repeated_viewport_aggregated_once(self):
+        with patch.object(ds.Canvas, 'points', autospec=True,
+                          side_effect=ds.Canvas.points) as points:
+            for _ in range(5):
+                self._aggregate()
+            self.assertEqual(points.call_count, 1)
+            for _ in range(5):
+                self._aggregate(tile_size=None)
+        self.assertEqual(points.call_count, 6)
+
+    def test_aggregate_tiles_max(self):
+        img = self._aggregate(aggregator=ds.max('z'))
+        self.assertEqual(np.nanmax(img.data['z'].values), self.df.z.max())
+
+    def test_aggregate_tiles_sum_empty_pixels(self):
+        img = self._aggregate(aggregator=ds.sum('z'), x_range=(-5, 15))
+        values = img.data['z'].values
+        self.assertTrue(np.isnan(values[:, -10:]).all())
+        self.assertAlmostEqual(np.nansum(values), self.df.z.sum())
+
+    def test_aggregate_tiles_cached(self):
+        self._aggregate(x_range=(0, 2), y_range=(0, 2))
+        ntiles = len(tile_cache)
+        with patch.object(ds.Canvas, 'points', autospec=True,
+                          side_effect=ds.Canvas.points) as points:
+            self._aggregate(x_range=(0.01, 2.01), y_range=(0, 2))
+            self.assertEqual(len(tile_cache), ntiles)
+            self.assertEqual(points.call_count, 0)
+            self._aggregate(x_range=(1, 3), y_range=(0, 2))
+        self.assertEqual(points.call_count, 1)
+        self.assertTrue(points.call_args[0][0].plot_width < 40)
+        self.assertTrue(len(tile_cache) > ntiles)
+
+    def test_aggregate_tiles_evicted(self):
+        tile_cache.max_bytes = 16*16*8*2
+        self._aggregate(aggregator=ds.max('z'))
+        self.assertEqual(len(tile_cache), 2)
+
+    def test_aggregate_tiles_unsupported_reduction(self):
+        img = self._aggregate(aggregator=ds.mean('z'))
+        self.assertEqual(img, self._aggregate(aggregator=ds.mean('z'), tile_size=None))
+        self.assertEqual(len(tile_cache), 0)
+
+    def test_rasterize_tiles(self):
+        img = rasterize(self.points, dynamic=False, width=40, height=30, x_range=(-5, 5),
+                        y_range=(-5, 5), tile_size=16, aggregator='count')
+        self.assertEqual(img, self._aggregate())
+
+
+class DatashaderProgressiveTests(ComparisonTestCase):
+
+    def setUp(self):
+        np.random.seed(1)
+        self.points = Points(pd.DataFrame({'x': np.random.randn(1000),
+                                           'y': np.random.randn(1000)}))
+        self.params = dict(width=20, height=20, x_range=(-5, 5), y_range=(-5, 5))
+
+    def test_rasterize_progressive_refines(self):
+        with patch.object(aggregate, '_progressive_min_rows', 0):
+            dmap = rasterize(self.points, progressive=True, progressive_sample=0.1,
+                             **self.params)
+            refinement = [s for s in dmap.streams if isinstance(s, Refinement)][0]
+            preliminary = dmap[()]
+            refinement._future.result()
+            refined = dmap[()]
+        expected = rasterize(self.points, dynamic=False, **self.params)
+        self.assertEqual(preliminary.data['Count'].values.sum(), 1000)
+        self.assertNotEqual(preliminary, expected)
+        self.assertEqual(refined, expected)
+
+    def test_rasterize_progressive_small_data(self):
+        dmap = rasterize(self.points, progressive=True, **self.params)
+        self.assertEqual(dmap[()], rasterize(self.points, dynamic=False, **self.params))
+        refinement = [s for s in dmap.streams if isinstance(s, Refinement)][0]
+        self.assertIsNone(refinement._future)
+
+    def test_rasterize_progressive_not_dynamic(self):
+        with patch.object(aggregate, '_progressive_min_rows', 0):
+            img = rasterize(self.points, dynamic=False, progressive=True, **self.params)
+        self.assertEqual(img, rasterize(self.points, dynamic=False, **self.params))
+
+    def test_refinement_superseded_discarded(self):
+        refinement = Refinement()
+        started, release, calls = threading.Event(), threading.Event(), []
+        def slow():
+            started.set()
+            release.wait()
+            calls.append('slow')
+        first = refinement.submit(slow)
+        started.wait()
+        second = refinement.submit(lambda: calls.append('fast'))
+        release.set()
+        first.result()
+        second.result()
+        self.assertEqual(calls, ['slow', 'fast'])
+        self.assertEqual(refinement.counter, 1)
+
+    def test_refinement_event_dispatched_on_event_loop(self):
+        refinement = Refinement()
+        threads = []
+        refinement.add_subscriber(lambda **kwargs: threads.append(threading.current_thread()))
+
+        async def refine():
+            await asyncio.wrap_future(refinement.submit(lambda: None))
+            await asyncio.sleep(0)
+
+        asyncio.run(refine())
+        self.assertEqual(threads, [threading.current_thread()])
+        self.assertEqual(refinement.counter, 1)
+
+    def test_refinement_uses_shared_executor(self):
+        threads = []
+        for _ in range(2):
+            Refinement().submit(lambda: threads.append(threading.current_thread())).result()
+        pool_threads = get_executor('thread')._threads
+        self.assertTrue(all(thread in pool_threads for thread in threads))
+
+
+@skipIf(not hasattr(ds, 'summary'), "datashader does not support summary reductions")
+class DatashaderSummaryTests(ComparisonTestCase):
+
+    def setUp(self):
+        np.random.seed(1)
+        self.points = Points(pd.DataFrame({'x': np.random.rand(100), 'y': np.random.rand(100),
+                                           'z': np.random.randn(100)}), vdims=['z'])
+        self.params = dict(width=4, height=4, x_range=(0, 1), y_range=(0, 1), dynamic=False)
+        self.summary = ds.summary(count=ds.count(), mean=ds.mean('z'))
+
+    def test_rasterize_summary_vdims(self):
+        img = rasterize(self.points, aggregator=self.summary, **self.params)
+        self.assertEqual([vd.name for vd in img.vdims], ['count', 'mean'])
+        self.assertEqual(img.vdims[0].nodata, 0)
+        count = rasterize(self.points, aggregator='count', **self.params)
+        mean = rasterize(self.points, aggregator=ds.mean('z'), **self.params)
+        self.assertEqual(img.dimension_values('count'), count.dimension_values(2))
+        self.assertEqual(img.dimension_values('mean'), mean.dimension_values(2))
+
+    def test_aggregate_summary_single_pass(self):
+        calls = []
+        canvas_points = ds.Canvas.points
+        def points(canvas, *args, **kwargs):
+            calls.append(args)
+            return canvas_points(canvas, *args, **kwargs)
+        with patch.object(ds.Canvas, 'points', points):
+            aggregate(self.points, aggregator=self.summary, **self.params)
+        self.assertEqual(len(calls), 1)
+
+    def test_aggregate_summary_empty(self):
+        img = aggregate(self.points.iloc[:0], aggregator=self.summary, **self.params)
+        self.assertEqual(img.data['count'].values, np.zeros((4, 4)))
+        self.assertTrue(np.isnan(img.data['mean'].values).all())
+
+    def test_shade_summary_vdim(self):
+        img = rasterize(self.points, aggregator=self.summary, **self.params)
+        mean = rasterize(self.points, aggregator=ds.mean('z'), **self.params)
+        self.assertEqual(shade(img, vdim='mean').data, shade(mean).data)
+        self.assertEqual(shade(img).data, shade(img, vdim='count').data)
+
+    def test_shade_summary_unknown_vdim(self):
+        img = rasterize(self.points, aggregator=self.summary, **self.params)
+        with self.assertRaises(Exception):
+            shade(img, vdim='max')
+
+    def test_inspect_summary_vdim(self):
+        img = rasterize(self.points, aggregator=self.summary, **self.params)
+        count = rasterize(self.points, aggregator='count', **self.params)
+        for vdim in ('count', 'mean'):
+            points = inspect_points(img, vdim=vdim, max_indicators=3, dynamic=False,
+                                    pixels=1, x=0.1, y=0.1)
+            self.assertEqual(points, inspect_points(count, max_indicators=3, dynamic=False,
+                                                    pixels=1, x=0.1, y=0.1))
+
+
 class DatashaderShadeTests(ComparisonTestCase):
 
     def test_shade_categorical_images_xarray(self):
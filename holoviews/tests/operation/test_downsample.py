@@ -0,0 +1,195 @@
+from unittest import skipIf
+
+import numpy as np
+import pandas as pd
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+from holoviews import Area, Curve, HLine, NdOverlay, Scatter
+from holoviews.core.cache import range_cache
+from holoviews.element.comparison import ComparisonTestCase
+from holoviews.operation.downsample import (
+    _MinMaxPyramid, _lttb, _m4, _min_max, _min_max_lttb, downsample1d
+)
+
+numba_skip = skipIf(numba is None, "numba is not available")
+
+
+class LTTBTests(ComparisonTestCase):
+
+    def setUp(self):
+        np.random.seed(1)
+        self.xs = np.arange(1000)
+        self.ys = np.random.randn(4, 1000).cumsum(axis=1)
+
+    def test_lttb_batched_matches_single_series(self):
+        batched = _lttb(self.xs, self.ys, 50, use_numba=False)
+        self.assertEqual(batched.shape, (4, 50))
+        for ys, idx in zip(self.ys, batched):
+            self.assertEqual(idx, _lttb(self.xs, ys, 50, use_numba=False))
+
+    def test_lttb_keeps_endpoints(self):
+        idx = _lttb(self.xs, self.ys[0], 50, use_numba=False)
+        self.assertEqual(idx[0], 0)
+        self.assertEqual(idx[-1], 999)
+
+    def test_lttb_datetime_xs(self):
+        xs = pd.date_range('2020-01-01', periods=1000, freq='1min').values
+        self.assertEqual(_lttb(xs, self.ys[0], 50, use_numba=False),
+                         _lttb(self.xs, self.ys[0], 50, use_numba=False))
+
+    @numba_skip
+    def test_lttb_numba_matches_numpy(self):
+        self.assertEqual(_lttb(self.xs, self.ys, 50, use_numba=True),
+                         _lttb(self.xs, self.ys, 50, use_numba=False))
+
+
+class MinMaxM4Tests(ComparisonTestCase):
+
+    def setUp(self):
+        np.random.seed(1)
+        self.xs = np.sort(np.random.rand(1000))
+        self.ys = np.random.randn(1000)
+
+    def test_min_max_selects_bin_extrema(self):
+        idx = _min_max(self.xs, self.ys, 20)
+        bins = np.array_split(np.arange(1000), 10)
+        expected = np.sort(np.concatenate([
+            [b[self.ys[b].argmin()], b[self.ys[b].argmax()]] for b in bins
+        ]))
+        self.assertEqual(idx, expected)
+
+    def test_min_max_ignores_nans(self):
+        self.ys[:50] = np.nan
+        idx = _min_max(self.xs, self.ys, 20)
+        self.assertFalse(np.isnan(self.ys[idx]).any())
+
+    def test_min_max_lttb(self):
+        idx = _min_max_lttb(self.xs, self.ys, 50, use_numba=False)
+        self.assertEqual(len(idx), 50)
+        self.assertEqual(idx[[0, -1]], np.array([0, 999]))
+        self.assertTrue((np.diff(idx) > 0).all())
+
+    def test_m4_selects_first_last_min_max_per_bin(self):
+        idx = _m4(self.xs, self.ys, 10)
+        edges = np.linspace(self.xs[0], self.xs[-1], 11)
+        bins = np.searchsorted(edges[1:-1], self.xs, side='right')
+        expected = set()
+        for b in range(10):
+            members = np.flatnonzero(bins == b)
+            ys = self.ys[members]
+            expected |= {members[0], members[-1], members[ys.argmin()], members[ys.argmax()]}
+        self.assertEqual(idx, np.array(sorted(expected)))
+
+    def test_m4_datetime_x_range(self):
+        xs = pd.date_range('2020-01-01', periods=1000, freq='1min').values
+        idx = _m4(xs, self.ys, 10, x_range=(xs[0], xs[-1]))
+        self.assertEqual(idx, _m4(np.arange(1000), self.ys, 10))
+
+
+class MinMaxPyramidTests(ComparisonTestCase):
+
+    def setUp(self):
+        np.random.seed(1)
+        self.ys = np.random.randn(1000)
+        self.pyramid = _MinMaxPyramid(np.arange(1000), self.ys, factor=4)
+
+    def test_pyramid_levels(self):
+        self.assertEqual([len(imin) for imin, _ in self.pyramid.levels], [250, 63, 16, 4])
+        imin, imax = self.pyramid.levels[1]
+        self.assertEqual(imin[3], 48 + self.ys[48:64].argmin())
+        self.assertEqual(imax[3], 48 + self.ys[48:64].argmax())
+
+    def test_pyramid_candidates_small_range(self):
+        self.assertIsNone(self.pyramid.candidates(0, 100, 50))
+
+    def test_pyramid_candidates(self):
+        candidates = self.pyramid.candidates(10, 990, 50)
+        self.assertEqual(candidates[[0, -1]], np.array([10, 989]))
+        self.assertTrue(len(candidates) >= 100)
+        self.assertIn(self.ys.argmin(), candidates)
+        self.assertIn(self.ys.argmax(), candidates)
+
+
+class Downsample1DTests(ComparisonTestCase):
+
+    def setUp(self):
+        np.random.seed(1)
+        self.df = pd.DataFrame(np.random.randn(1000, 3).cumsum(axis=0),
+                               columns=['a', 'b', 'c'])
+        self.df['x'] = np.arange(1000)
+
+    def test_downsample1d_curve(self):
+        curve = Curve(self.df, 'x', 'a')
+        downsampled = downsample1d(curve, dynamic=False, width=100, numba=False)
+        self.assertEqual(len(downsampled), 100)
+
+    def test_downsample1d_curve_algorithms(self):
+        curve = Curve(self.df, 'x', 'a')
+        for algorithm in ('minmax', 'minmax-lttb', 'm4'):
+            downsampled = downsample1d(curve, dynamic=False, width=100,
+                                       algorithm=algorithm, numba=False)
+            self.assertTrue(len(downsampled) <= 400)
+
+    def test_downsample1d_ndoverlay_minmax(self):
+        overlay = NdOverlay({c: Curve(self.df, 'x', c) for c in 'abc'})
+        downsampled = downsample1d(overlay, dynamic=False, width=100, algorithm='minmax')
+        for k, el in downsampled.items():
+            self.assertEqual(el, downsample1d(overlay[k], dynamic=False, width=100,
+                                              algorithm='minmax'))
+
+    def test_downsample1d_ndoverlay_matches_per_element(self):
+        overlay = NdOverlay({c: Curve(self.df, 'x', c) for c in 'abc'})
+        downsampled = downsample1d(overlay, dynamic=False, width=100, numba=False)
+        self.assertIsInstance(downsampled, NdOverlay)
+        for k, el in downsampled.items():
+            expected = downsample1d(overlay[k], dynamic=False, width=100, numba=False)
+            self.assertEqual(el, expected)
+
+    def test_downsample1d_overlay_mixed_elements(self):
+        overlay = Curve(self.df, 'x', 'a') * Scatter(self.df, 'x', 'b') * HLine(0)
+        downsampled = downsample1d(overlay, dynamic=False, width=100,
+                                   algorithm='nth')
+        self.assertEqual([len(el) for el in downsampled.values()[:2]], [100, 100])
+        self.assertEqual(downsampled.values()[2], HLine(0))
+
+    def test_downsample1d_overlay_x_range(self):
+        overlay = NdOverlay({c: Curve(self.df, 'x', c) for c in 'abc'})
+        downsampled = downsample1d(overlay, dynamic=False, width=100,
+                                   x_range=(0, 500), numba=False)
+        for el in downsampled:
+            self.assertEqual(len(el), 100)
+            self.assertTrue(el.range('x')[1] <= 500)
+
+    def test_downsample1d_overlay_area_lttb_raises(self):
+        overlay = NdOverlay({c: Area(self.df, 'x', c) for c in 'abc'})
+        with self.assertRaises(NotImplementedError):
+            downsample1d(overlay, dynamic=False, width=100)
+
+    def test_downsample1d_pyramid_cached(self):
+        curve = Curve(self.df, 'x', 'a')
+        downsampled = downsample1d(curve, dynamic=False, width=50, pyramid=True,
+                                   algorithm='minmax', x_range=(100, 900))
+        self.assertTrue(25 < len(downsampled) <= 50)
+        x0, x1 = downsampled.range('x')
+        self.assertTrue(x0 >= 100 and x1 < 900)
+        key = ('downsample_pyramid', 'x', 'a', 4)
+        self.assertIsInstance(range_cache.lookup(self.df, key), _MinMaxPyramid)
+
+    def test_downsample1d_pyramid_contains_extrema(self):
+        curve = Curve(self.df, 'x', 'a')
+        downsampled = downsample1d(curve, dynamic=False, width=50, pyramid=True,
+                                   algorithm='m4')
+        self.assertEqual(downsampled.range('a'), curve.range('a'))
+
+    def test_downsample1d_pyramid_datetime_x_range(self):
+        self.df['x'] = pd.date_range('2020-01-01', periods=1000, freq='1min')
+        curve = Curve(self.df, 'x', 'a')
+        x_range = (pd.Timestamp('2020-01-01 01:00'), pd.Timestamp('2020-01-01 10:00'))
+        downsampled = downsample1d(curve, dynamic=False, width=50, pyramid=True,
+                                   x_range=x_range, numba=False)
+        self.assertEqual(len(downsampled), 50)
+        self.assertEqual(downsampled.range('x')[0], x_range[0])
@@ -165,6 +165,13 @@ class TestElementPlot(LoggingComparisonTestCase, TestBokehPlot):
         plot = bokeh_renderer.get_plot(curve)
         self.assertEqual(plot.state.title.text, 'Called')
 
+    def test_element_compact_data(self):
+        curve = Curve((np.arange(10), np.linspace(0, 1, 10))).opts(compact_data=True)
+        plot = bokeh_renderer.get_plot(curve)
+        source = plot.handles['source']
+        self.assertEqual(source.data['x'].dtype, np.int32)
+        self.assertEqual(source.data['y'].dtype, np.float32)
+
     def test_element_update_visible(self):
         checkbox = pn.widgets.Checkbox(value=True)
         scatter = Scatter([]).apply.opts(visible=checkbox)
@@ -1,3 +1,5 @@
+import threading
+
 from collections import OrderedDict
 from io import BytesIO
 from unittest import SkipTest
@@ -5,7 +7,8 @@ from unittest import SkipTest
 import numpy as np
 import param
 
-from holoviews import DynamicMap, HoloMap, Image, GridSpace, Table, Curve
+from holoviews import DynamicMap, HoloMap, Image, GridSpace, Table, Curve, Dimension
+from holoviews.core.spaces import Callable
 from holoviews.streams import Stream
 from holoviews.plotting import Renderer
 from holoviews.element.comparison import ComparisonTestCase
@@ -43,6 +46,17 @@ class BokehRendererTest(ComparisonTestCase):
         bytesio = BytesIO()
         self.renderer.save(self.image1, bytesio)
 
+    def test_save_html_dynamicmap_executor(self):
+        threads = []
+        def callback(x):
+            threads.append(threading.get_ident())
+            return Curve([x, 1])
+        dmap = DynamicMap(Callable(callback, executor='thread'),
+                          kdims=[Dimension('x', values=[1, 2, 3])])
+        self.renderer.save(dmap, BytesIO())
+        self.assertEqual(len(threads), 3)
+        self.assertNotIn(threading.get_ident(), threads)
+
     def test_render_get_plot_server_doc(self):
         renderer = self.renderer.instance(mode='server')
         plot = renderer.get_plot(self.image1)
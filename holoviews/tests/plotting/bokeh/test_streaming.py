@@ -1,8 +1,14 @@
+import asyncio
+
 import numpy as np
 
+from bokeh.document import Document
+from bokeh.document.events import ColumnsPatchedEvent, ColumnsStreamedEvent
+
 from holoviews.core import DynamicMap
+from holoviews.core.spaces import Callable
 from holoviews.element import Curve
-from holoviews.streams import Buffer
+from holoviews.streams import Buffer, Stream, Tap
 
 from .test_plot import TestBokehPlot, bokeh_renderer
 
@@ -38,3 +44,145 @@ class TestBufferStreamPlot(TestBokehPlot):
         self.assertEqual(x_range.end, 2)
         self.assertEqual(y_range.start, -1)
         self.assertEqual(y_range.end, 1)
+
+
+class TestIncrementalUpdatePlot(TestBokehPlot):
+
+    def _get_plot_events(self, callback):
+        stream = Stream.define('Length', length=5)()
+        dmap = DynamicMap(callback, streams=[stream]).opts(incremental_updates=True)
+        self.doc = Document()
+        plot = bokeh_renderer.get_plot(dmap, doc=self.doc)
+        self.doc.add_root(plot.state)
+        events = []
+        self.doc.on_change(lambda event: events.append(type(event)))
+        return plot, stream, events
+
+    def test_incremental_update_streams_appended_rows(self):
+        plot, stream, events = self._get_plot_events(
+            lambda length: Curve(np.arange(length)))
+        stream.event(length=8)
+        source = plot.handles['source']
+        self.assertEqual(events, [ColumnsStreamedEvent])
+        self.assertEqual(source.data['y'], np.arange(8))
+
+    def test_incremental_update_patches_changed_rows(self):
+        def callback(length):
+            ys = np.zeros(10)
+            ys[length] = 1
+            return Curve(ys)
+        plot, stream, events = self._get_plot_events(callback)
+        stream.event(length=6)
+        expected = np.zeros(10)
+        expected[6] = 1
+        source = plot.handles['source']
+        self.assertEqual(events, [ColumnsPatchedEvent])
+        self.assertEqual(source.data['y'], expected)
+
+
+class TestAsyncDynamicMapPlot(TestBokehPlot):
+
+    def test_async_callback_superseded_refresh_cancelled(self):
+        stream = Stream.define('Length', length=5)()
+        started, completed = [], []
+        async def callback(length):
+            started.append(length)
+            await asyncio.sleep(0.01)
+            completed.append(length)
+            return Curve(np.arange(length))
+        dmap = DynamicMap(callback, streams=[stream])
+        plot = bokeh_renderer.get_plot(dmap)
+        async def trigger():
+            stream.event(length=3)
+            first = plot._refresh_task
+            await asyncio.sleep(0)
+            stream.event(length=7)
+            await plot._refresh_task
+            return first
+        first = asyncio.run(trigger())
+        self.assertTrue(first.cancelled())
+        self.assertEqual(started, [5, 3, 7])
+        self.assertEqual(completed, [5, 7])
+        self.assertEqual(plot.handles['source'].data['y'], np.arange(7))
+
+    def test_async_callback_transient_stream_refresh(self):
+        tap = Tap(transient=True)
+        calls = []
+        async def callback(x, y):
+            calls.append((x, y))
+            await asyncio.sleep(0)
+            return Curve([0 if x is None else x, 1])
+        dmap = DynamicMap(callback, streams=[tap])
+        plot = bokeh_renderer.get_plot(dmap)
+        async def trigger():
+            tap.event(x=3, y=4)
+            await plot._refresh_task
+        asyncio.run(trigger())
+        self.assertEqual(calls, [(None, None), (3, 4)])
+        self.assertEqual(plot.handles['source'].data['y'], np.array([3, 1]))
+        self.assertEqual((tap.x, tap.y), (None, None))
+        self.assertFalse(tap._triggering)
+
+    def test_executor_callback_refresh(self):
+        stream = Stream.define('Length', length=5)()
+        dmap = DynamicMap(Callable(lambda length: Curve(np.arange(length)), executor='thread'),
+                          streams=[stream])
+        plot = bokeh_renderer.get_plot(dmap)
+        async def trigger():
+            stream.event(length=3)
+            await plot._refresh_task
+        asyncio.run(trigger())
+        self.assertEqual(plot.handles['source'].data['y'], np.arange(3))
+
+    def test_async_callback_get_plot_in_running_loop(self):
+        stream = Stream.define('Length', length=5)()
+        async def callback(length):
+            await asyncio.sleep(0)
+            return Curve(np.arange(length))
+        dmap = DynamicMap(callback, streams=[stream])
+        async def render():
+            return await bokeh_renderer.get_plot_async(dmap)
+        plot = asyncio.run(render())
+        self.assertEqual(plot.handles['source'].data['y'], np.arange(5))
+
+    def test_async_callback_nested_get_plot_in_running_loop(self):
+        stream = Stream.define('Length', length=5)()
+        async def callback(length):
+            await asyncio.sleep(0)
+            return Curve(np.arange(length))
+        dmap = DynamicMap(callback, streams=[stream]).opts(color='red')
+        async def render():
+            return await bokeh_renderer.get_plot_async(dmap)
+        plot = asyncio.run(render())
+        self.assertEqual(plot.handles['source'].data['y'], np.arange(5))
+
+    def test_async_callback_placeholder_in_running_loop(self):
+        stream = Stream.define('Length', length=5)()
+        async def callback(length):
+            await asyncio.sleep(0)
+            return Curve(np.arange(length))
+        dmap = DynamicMap(callback, streams=[stream], initial_items=[((), Curve([]))])
+        async def render():
+            plot = bokeh_renderer.get_plot(dmap)
+            placeholder = len(plot.handles['source'].data['y'])
+            await plot._refresh_task
+            return plot, placeholder
+        plot, placeholder = asyncio.run(render())
+        self.assertEqual(placeholder, 0)
+        self.assertEqual(plot.handles['source'].data['y'], np.arange(5))
+
+    def test_async_callback_get_plot_in_running_loop_without_placeholder(self):
+        async def callback():
+            return Curve([1, 2, 3])
+        dmap = DynamicMap(callback)
+        async def render():
+            bokeh_renderer.get_plot(dmap)
+        with self.assertRaisesRegex(RuntimeError, 'get_plot_async'):
+            asyncio.run(render())
+
+    def test_async_dmaps_cached(self):
+        dmap = DynamicMap(Callable(lambda: Curve([1, 2, 3]), executor='thread'))
+        plot = bokeh_renderer.get_plot(dmap)
+        dmaps = plot._async_dmaps()
+        self.assertEqual(dmaps, [dmap])
+        self.assertIs(plot._async_dmaps(), dmaps)
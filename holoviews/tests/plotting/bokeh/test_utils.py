@@ -1,6 +1,12 @@
+import numpy as np
+
+from bokeh.models import ColumnDataSource
+
 from holoviews.core import Store
 from holoviews.element.comparison import ComparisonTestCase
-from holoviews.plotting.bokeh.util import filter_batched_data, glyph_order
+from holoviews.plotting.bokeh.util import (
+    cds_column_diff, compact_array, filter_batched_data, glyph_order
+)
 from holoviews.plotting.bokeh.styles import expand_batched_style
 
 bokeh_renderer = Store.renderers['bokeh']
@@ -74,3 +80,101 @@ class TestBokehUtilsInstantiation(ComparisonTestCase):
         order = glyph_order(['scatter_1', 'patch_1', 'rect_1'],
                             ['scatter', 'patch'])
         self.assertEqual(order, ['scatter_1', 'patch_1', 'rect_1'])
+
+
+class TestCDSColumnDiff(ComparisonTestCase):
+
+    def setUp(self):
+        self.source = ColumnDataSource(data={
+            'x': np.arange(10.), 'y': np.arange(10.)*2
+        })
+
+    def test_cds_column_diff_append(self):
+        data = {'x': np.arange(12.), 'y': np.arange(12.)*2}
+        diff = cds_column_diff(self.source, data)
+        self.assertEqual(diff['stream'], {'x': np.array([10., 11.]),
+                                          'y': np.array([20., 22.])})
+        self.assertEqual(diff['rollover'], None)
+        self.assertEqual(diff['patches'], {})
+
+    def test_cds_column_diff_rollover(self):
+        data = {'x': np.arange(2., 12.), 'y': np.arange(2., 12.)*2}
+        diff = cds_column_diff(self.source, data)
+        self.assertEqual(diff['stream'], {'x': np.array([10., 11.]),
+                                          'y': np.array([20., 22.])})
+        self.assertEqual(diff['rollover'], 10)
+
+    def test_cds_column_diff_unchanged(self):
+        data = {'x': np.arange(10.), 'y': np.arange(10.)*2}
+        diff = cds_column_diff(self.source, data)
+        self.assertEqual(diff, {'stream': {}, 'rollover': None,
+                                'patches': {}, 'replace': {}})
+
+    def test_cds_column_diff_patch(self):
+        y = np.arange(10.)*2
+        y[3:5] = np.nan
+        data = {'x': np.arange(10.), 'y': y}
+        diff = cds_column_diff(self.source, data)
+        self.assertEqual(diff['stream'], {})
+        self.assertEqual(list(diff['patches']), ['y'])
+        (index, values), = diff['patches']['y']
+        self.assertEqual(index, slice(3, 5))
+        self.assertEqual(values, np.array([np.nan, np.nan]))
+
+    def test_cds_column_diff_replace(self):
+        data = {'x': np.arange(10.), 'y': np.arange(10.)*3}
+        diff = cds_column_diff(self.source, data)
+        self.assertEqual(diff['patches'], {})
+        self.assertEqual(diff['replace'], {'y': data['y']})
+
+    def test_cds_column_diff_length_change(self):
+        data = {'x': np.arange(5.), 'y': np.arange(5.)*3}
+        self.assertIsNone(cds_column_diff(self.source, data))
+
+    def test_cds_column_diff_new_columns(self):
+        data = {'x': np.arange(10.), 'z': np.arange(10.)}
+        self.assertIsNone(cds_column_diff(self.source, data))
+
+
+class TestCompactArray(ComparisonTestCase):
+
+    def test_compact_array_float_downcast(self):
+        arr = compact_array(np.linspace(0, 1, 10))
+        self.assertEqual(arr.dtype, np.float32)
+
+    def test_compact_array_float_large_magnitude(self):
+        arr = compact_array(1.6e12 + np.arange(10.))
+        self.assertEqual(arr.dtype, np.float64)
+
+    def test_compact_array_float_constant(self):
+        arr = compact_array(np.full(10, 0.5))
+        self.assertEqual(arr.dtype, np.float32)
+
+    def test_compact_array_float_constant_large_magnitude(self):
+        arr = compact_array(np.full(10, 1.6e12 + 0.1))
+        self.assertEqual(arr.dtype, np.float64)
+        self.assertEqual(arr[0], 1.6e12 + 0.1)
+
+    def test_compact_array_int64_fits_int32(self):
+        arr = compact_array(np.arange(10, dtype='int64'))
+        self.assertEqual(arr.dtype, np.int32)
+
+    def test_compact_array_int64_overflow(self):
+        arr = compact_array(np.array([0, 2**40], dtype='int64'))
+        self.assertEqual(arr.dtype, np.float64)
+
+    def test_compact_array_object_numbers(self):
+        arr = compact_array(np.array([0, None, 2.5], dtype=object))
+        self.assertEqual(arr, np.array([0, np.nan, 2.5], dtype=np.float32))
+
+    def test_compact_array_object_strings_unchanged(self):
+        arr = np.array(['A', 'B'], dtype=object)
+        self.assertIs(compact_array(arr), arr)
+
+    def test_compact_array_non_contiguous(self):
+        arr = compact_array(np.arange(20, dtype='int32')[::2])
+        self.assertTrue(arr.flags['C_CONTIGUOUS'])
+
+    def test_compact_array_list_of_arrays(self):
+        arrs = compact_array([np.arange(3.), np.arange(4.)])
+        self.assertEqual([a.dtype for a in arrs], [np.float32, np.float32])
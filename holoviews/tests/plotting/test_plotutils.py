@@ -1,8 +1,12 @@
+import threading
 from unittest import SkipTest
+from unittest.mock import patch
 
 import numpy as np
+import pandas as pd
 
-from holoviews import NdOverlay, Overlay, Dimension
+from holoviews import NdOverlay, Overlay, Dimension, config
+from holoviews.core.cache import DataCache, RangeAccumulator, range_cache
 from holoviews.core.spaces import DynamicMap, HoloMap
 from holoviews.core.options import Store, Cycle
 from holoviews.element.comparison import ComparisonTestCase
@@ -14,7 +18,8 @@ from holoviews.plotting.util import (
     initialize_dynamic, split_dmap_overlay, _get_min_distance_numpy,
     bokeh_palette_to_palette, mplcmap_to_palette, color_intervals,
     get_range, get_axis_padding)
-from holoviews.streams import PointerX
+from holoviews.streams import PointerX, Pipe
+from holoviews.util.transform import dim
 
 from holoviews.plotting.bokeh import util
 bokeh_renderer = Store.renderers['bokeh']
@@ -658,6 +663,186 @@ class TestRangeUtilities(ComparisonTestCase):
         self.assertEqual(hrange, (-1, 3))
 
 
+class TestRangeCache(ComparisonTestCase):
+
+    def setUp(self):
+        self.cache = DataCache()
+        self.calls = []
+        self._cache_ranges = config.cache_ranges
+        config.cache_ranges = True
+
+    def tearDown(self):
+        config.cache_ranges = self._cache_ranges
+
+    def _compute(self, value):
+        self.calls.append(value)
+        return value
+
+    def test_data_cache_reuses_value(self):
+        data = np.arange(10)
+        self.assertEqual(self.cache.get(data, 'a', lambda: self._compute(1)), 1)
+        self.assertEqual(self.cache.get(data, 'a', lambda: self._compute(2)), 1)
+        self.assertEqual(self.calls, [1])
+
+    def test_data_cache_invalidate(self):
+        data = np.arange(10)
+        self.cache.get(data, 'a', lambda: self._compute(1))
+        self.cache.invalidate(data)
+        self.assertEqual(self.cache.get(data, 'a', lambda: self._compute(2)), 2)
+
+    def test_data_cache_drops_garbage_collected_data(self):
+        data = np.arange(10)
+        self.cache.get(data, 'a', lambda: self._compute(1))
+        self.assertEqual(len(self.cache), 1)
+        del data
+        self.assertEqual(len(self.cache), 0)
+
+    def test_data_cache_max_items(self):
+        self.cache.max_items = 2
+        arrays = [np.arange(i) for i in range(3)]
+        for arr in arrays:
+            self.cache.get(arr, 'a', lambda: self._compute(1))
+        self.assertEqual(len(self.cache), 2)
+
+    def test_data_cache_unsupported_data(self):
+        data = {'x': np.arange(3)}
+        self.cache.get(data, 'a', lambda: self._compute(1))
+        self.cache.get(data, 'a', lambda: self._compute(1))
+        self.assertEqual(self.calls, [1, 1])
+
+    def test_data_cache_concurrent_access(self):
+        arrays = [np.arange(i) for i in range(50)]
+        self.cache.max_items = 10
+        errors = []
+        def update(offset):
+            try:
+                for i in range(2000):
+                    arr = arrays[(i+offset) % len(arrays)]
+                    self.cache.set(arr, 'a', i)
+                    self.cache.lookup(arr, 'a')
+                    if i % 7 == 0:
+                        self.cache.invalidate(arr)
+            except Exception as e:
+                errors.append(e)
+        threads = [threading.Thread(target=update, args=(i,)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+        self.assertTrue(len(self.cache) <= 10)
+
+    def test_compute_ranges_shared_data(self):
+        df = pd.DataFrame({'x': np.arange(10), 'y': np.arange(10)*2.})
+        overlay = Scatter(df) * Curve(df)
+        bokeh_renderer.get_plot(overlay)
+        self.assertEqual(range_cache.get(df, 'other', lambda: None), None)
+        keys = [k for k in range_cache._entries[id(df)][1] if k != 'other']
+        self.assertEqual({k[1:] for k in keys if k[0][0] is Scatter},
+                         {('range', Dimension('x')), ('range', Dimension('y'))})
+
+    def test_compute_ranges_not_cached_by_default(self):
+        config.cache_ranges = False
+        df = pd.DataFrame({'x': np.arange(10), 'y': np.arange(10)*2.})
+        bokeh_renderer.get_plot(Scatter(df))
+        self.assertIsNone(range_cache._entries.get(id(df)))
+        df['y'] *= 2
+        plot = bokeh_renderer.get_plot(Scatter(df).opts(padding=0))
+        self.assertEqual(plot.handles['y_range'].end, 36)
+
+    def test_compute_ranges_dim_transform_cached(self):
+        df = pd.DataFrame({'x': np.arange(10), 'y': np.arange(10)*2.})
+        transform = dim('y')*2
+        bokeh_renderer.get_plot(Scatter(df).opts(color=transform, backend='bokeh'))
+        entries = range_cache._entries[id(df)][1]
+        cached = [v for k, v in entries.items() if k[1] == 'dim']
+        self.assertEqual(len(cached), 1)
+        self.assertIs(cached[0][0], transform)
+
+    def test_compute_ranges_batched(self):
+        try:
+            import dask.dataframe as dd
+        except ImportError:
+            raise SkipTest('Test requires dask')
+        df = pd.DataFrame({'x': np.arange(10), 'y': np.arange(10)*2., 'z': -np.arange(10)})
+        scatter = Scatter(dd.from_pandas(df, npartitions=2), 'x', ['y', 'z'])
+        interface = scatter.interface
+        with patch.object(interface, 'range', wraps=interface.range) as range_fn, \
+             patch.object(interface, 'ranges', wraps=interface.ranges) as ranges_fn:
+            plot = bokeh_renderer.get_plot(scatter)
+        self.assertEqual(range_fn.call_count, 0)
+        self.assertEqual(ranges_fn.call_count, 1)
+        self.assertEqual(plot.ranges[('Scatter',)]['z']['data'], (-9, 0))
+
+    def test_compute_ranges_image_bounds(self):
+        arr = np.random.rand(3, 3)
+        img1 = Image(arr, bounds=(0, 0, 1, 1))
+        img2 = Image(arr, bounds=(0, 0, 2, 2))
+        plot = bokeh_renderer.get_plot(img1 + img2)
+        x_range = plot.subplots[(0, 1)].subplots['main'].handles['x_range']
+        self.assertEqual((x_range.start, x_range.end), (0, 2))
+
+    def test_pipe_invalidates_range_cache(self):
+        df = pd.DataFrame({'x': np.arange(10), 'y': np.arange(10)*2.})
+        pipe = Pipe(data=df)
+        dmap = DynamicMap(Scatter, streams=[pipe]).opts(framewise=True, padding=0, backend='bokeh')
+        plot = bokeh_renderer.get_plot(dmap)
+        df['y'] *= 2
+        pipe.send(df)
+        y_range = plot.handles['y_range']
+        self.assertEqual(y_range.end, 36)
+
+
+class TestRangeAccumulator(ComparisonTestCase):
+
+    def _stream(self, values, chunks, length, percentile=False):
+        accumulator = RangeAccumulator(values)
+        if percentile:
+            accumulator.percentile(50)
+        for chunk in chunks:
+            evicted = max(len(values) + len(chunk) - length, 0)
+            accumulator.evict(values[:evicted])
+            values = np.concatenate([values, chunk])[-length:]
+            accumulator.append(chunk, values)
+        return accumulator, values
+
+    def test_range_accumulator_append(self):
+        acc, values = self._stream(np.arange(10.), [np.array([20., -3.])], 20)
+        self.assertEqual(acc.range(), (-3, 20))
+
+    def test_range_accumulator_evict_extremum(self):
+        values = np.array([100., 1, 2, 3])
+        acc, values = self._stream(values, [np.array([4.]), np.array([5.])], 4)
+        self.assertEqual(acc.range(), (2, 5))
+
+    def test_range_accumulator_nan_and_inf(self):
+        values = np.array([np.nan, 1, 2])
+        acc, values = self._stream(values, [np.array([np.inf, 3.])], 10)
+        self.assertEqual(acc.range(), (1, 3))
+
+    def test_range_accumulator_percentile(self):
+        values = np.random.RandomState(1).rand(10000)
+        chunks = [np.random.RandomState(i).rand(100) for i in range(5)]
+        acc, values = self._stream(values, chunks, 10000)
+        for q in (2, 50, 98):
+            self.assertAlmostEqual(acc.percentile(q), np.percentile(values, q), 2)
+
+    def test_range_accumulator_percentile_incremental(self):
+        values = np.random.RandomState(1).rand(10000)
+        chunks = [np.random.RandomState(i).rand(1000)*0.5 for i in range(5)]
+        acc, values = self._stream(values, chunks, 10000, percentile=True)
+        for q in (2, 50, 98):
+            self.assertAlmostEqual(acc.percentile(q), np.percentile(values, q), 2)
+
+    def test_range_accumulator_percentile_updated(self):
+        values = np.random.RandomState(1).rand(1000)
+        acc = RangeAccumulator(values)
+        acc.percentile(50)
+        chunk = np.full(1000, 0.1)
+        acc.evict(values)
+        acc.append(chunk, chunk)
+        self.assertAlmostEqual(acc.percentile(50), 0.1, 2)
+
 
 class TestBokehUtils(ComparisonTestCase):
 
@@ -1,13 +1,18 @@
 from unittest import skip, skipIf
 
 import holoviews as hv
+import numpy as np
 import pandas as pd
 
+from holoviews.core.cache import range_cache
 from holoviews.core.options import Cycle, Store
 from holoviews.element import ErrorBars, Points, Rectangles, Table, VSpan
 from holoviews.plotting.util import linear_gradient
-from holoviews.selection import link_selections
-from holoviews.streams import SelectionXY
+from holoviews.selection import (
+    SelectionDisplay, _implies, _refine_mask, link_selections
+)
+from holoviews.streams import Pipe, SelectionXY
+from holoviews.util.transform import dim
 from holoviews.element.comparison import ComparisonTestCase
 
 try:
@@ -757,3 +762,96 @@ class TestLinkSelectionsBokeh(TestLinkSelections):
     @skip("Bokeh ErrorBars selection not yet supported")
     def test_overlay_points_errorbars_dynamic(self):
         pass
+
+
+class TestSelectionRefinement(ComparisonTestCase):
+
+    def setUp(self):
+        self.data = pd.DataFrame({'x': np.linspace(0, 1, 101), 'y': np.linspace(1, 0, 101),
+                                  'z': np.arange(101)})
+        self.points = hv.Dataset(self.data, ['x', 'y', 'z']).to(Points, ['x', 'y'], [], [])
+
+    @staticmethod
+    def entry(element):
+        key = ('selection_masks', tuple(element.dataset.dimensions(label='name')))
+        return range_cache.lookup(element.dataset.data, key)
+
+    @staticmethod
+    def box(x0, x1, y0, y1):
+        return ((dim('x') >= x0) & (dim('x') <= x1)) & ((dim('y') >= y0) & (dim('y') <= y1))
+
+    def test_implies_intersection(self):
+        expr = self.box(0, 0.5, 0, 1)
+        self.assertTrue(_implies(expr & (dim('z') > 3), expr))
+        self.assertFalse(_implies(expr | (dim('z') > 3), expr))
+        self.assertFalse(_implies(expr, expr & (dim('z') > 3)))
+
+    def test_implies_shrinking_box(self):
+        expr = self.box(0, 0.5, 0, 1)
+        self.assertTrue(_implies(self.box(0.1, 0.4, 0, 0.8), expr))
+        self.assertFalse(_implies(self.box(-0.1, 0.4, 0, 0.8), expr))
+
+    def test_refine_mask(self):
+        ds = self.points.dataset
+        expr = self.box(0, 0.5, 0, 1)
+        mask = expr.apply(ds, keep_index=True)
+        for refined_expr in [self.box(0.1, 0.4, 0.2, 1), expr & (dim('z') % 2 == 0)]:
+            refined = _refine_mask(ds, refined_expr, [(expr, mask)])
+            self.assertEqual(refined.values, refined_expr.apply(ds))
+
+    def test_refine_mask_not_subset(self):
+        ds = self.points.dataset
+        expr = self.box(0, 0.5, 0, 1)
+        mask = expr.apply(ds, keep_index=True)
+        self.assertIsNone(_refine_mask(ds, self.box(0, 0.6, 0, 1), [(expr, mask)]))
+
+    def test_select_refines_cached_mask(self):
+        expr = self.box(0, 0.5, 0, 1)
+        SelectionDisplay._select(self.points, expr)
+        refined_expr = expr & (dim('z') > 20)
+        selected = SelectionDisplay._select(self.points, refined_expr)
+        self.assertEqual(selected, self.points.dataset.select(selection_expr=refined_expr))
+        self.assertEqual(self.entry(self.points)['selection_expr'], refined_expr)
+
+    def test_select_shares_mask_across_elements(self):
+        expr = self.box(0, 0.5, 0, 1)
+        ds = self.points.dataset
+        elements = [self.points, hv.Scatter(ds, 'x', 'y'), ds.select(z=(10, 90)).to(Points, ['x', 'y'], [], [])]
+        SelectionDisplay._select(elements[0], expr)
+        entry = self.entry(self.points)
+        mask = entry['masks']['select']
+        for element in elements[1:]:
+            selected = SelectionDisplay._select(element, expr)
+            self.assertEqual(selected, element.dataset.select(selection_expr=expr))
+            self.assertIs(self.entry(element), entry)
+            self.assertIs(entry['masks']['select'], mask)
+
+    def test_select_drops_masks_of_collected_data(self):
+        expr = self.box(0, 0.5, 0, 1)
+        entries = len(range_cache)
+        for i in range(5):
+            SelectionDisplay._select(Points(self.data.copy(), ['x', 'y']), expr)
+        self.assertEqual(len(range_cache), entries)
+
+    def test_select_masks_invalidated_by_pipe(self):
+        expr = dim('x') >= 0.5
+        pipe = Pipe(data=self.data)
+        points = Points(self.data, ['x', 'y'])
+        self.assertEqual(len(SelectionDisplay._select(points, expr)), 51)
+        self.data['x'] -= 0.1
+        pipe.send(self.data)
+        self.assertEqual(len(SelectionDisplay._select(points, expr)), 41)
+    def test_select_dict_data_uses_dataset_cache(self):
+        img = hv.Image((np.arange(4), np.arange(3), np.arange(12).reshape(3, 4)),
+                       datatype=['grid'])
+        self.assertIsInstance(img.data, dict)
+        expr = dim('x') > 1
+        cache = {}
+        SelectionDisplay._select(img, expr, cache)
+        key = (id(img.data), 'selection_masks', ('x', 'y', 'z'))
+        entry = cache[key]
+        mask = entry['masks']['gridded']
+        SelectionDisplay._select(img, expr, cache)
+        self.assertIs(cache[key]['masks']['gridded'], mask)
+        SelectionDisplay._select(img, dim('x') > 2, cache)
+        self.assertIs(entry['previous']['gridded'][1], mask)
@@ -8,6 +8,7 @@ import pandas as pd
 import param
 from panel.widgets import IntSlider
 
+from holoviews.core.cache import range_cache
 from holoviews.core.spaces import DynamicMap
 from holoviews.core.util import Version
 from holoviews.element import Points, Scatter, Curve, Histogram, Polygons
@@ -951,6 +952,116 @@ class TestBufferDataFrameStream(ComparisonTestCase):
         self.assertEqual(buff.data, data.iloc[:0, :].reset_index())
 
 
+class TestBufferRingStream(ComparisonTestCase):
+
+    def test_buffer_ring_requires_length(self):
+        error = "Buffer ring storage requires a fixed, non-zero length."
+        with self.assertRaisesRegex(ValueError, error):
+            Buffer(np.array([[0, 1]]), length=0, ring=True)
+
+    def test_buffer_ring_array_send(self):
+        buff = Buffer(np.array([[0, 1]]), length=3, ring=True)
+        buff.send(np.array([[1, 2]]))
+        self.assertEqual(buff.data, np.array([[0, 1], [1, 2]]))
+
+    def test_buffer_ring_array_wraparound(self):
+        buff = Buffer(np.array([[0, 1]]), length=3, ring=True)
+        buff.send(np.array([[1, 2], [2, 3]]))
+        buff.send(np.array([[3, 4], [4, 5]]))
+        self.assertEqual(buff.data, np.array([[2, 3], [3, 4], [4, 5]]))
+        self.assertEqual(buff._chunk_length, 2)
+
+    def test_buffer_ring_array_patch_larger_than_length(self):
+        buff = Buffer(np.array([[0, 1]]), length=2, ring=True)
+        buff.send(np.array([[1, 2], [2, 3], [3, 4]]))
+        self.assertEqual(buff.data, np.array([[2, 3], [3, 4]]))
+
+    def test_buffer_ring_dict_wraparound(self):
+        data = {'x': np.array([0]), 'y': np.array([1.])}
+        buff = Buffer(data, length=3, ring=True)
+        for i in range(1, 5):
+            buff.send({'x': np.array([i]), 'y': np.array([i+1.])})
+        self.assertEqual(buff.data, {'x': np.array([2, 3, 4]),
+                                     'y': np.array([3., 4., 5.])})
+
+    def test_buffer_ring_dict_upcasts_dtype(self):
+        data = {'x': np.array([0]), 'y': np.array([1])}
+        buff = Buffer(data, length=3, ring=True)
+        buff.send({'x': np.array([1]), 'y': np.array([2.5])})
+        self.assertEqual(buff.data['y'], np.array([1, 2.5]))
+
+    def test_buffer_ring_dframe_wraparound(self):
+        data = pd.DataFrame({'x': np.array([0]), 'y': np.array([1])})
+        buff = Buffer(data, length=2, index=False, ring=True)
+        buff.send(pd.DataFrame({'x': np.array([1]), 'y': np.array([2])}))
+        buff.send(pd.DataFrame({'x': np.array([2]), 'y': np.array([3])}))
+        dframe = pd.DataFrame({'x': np.array([1, 2]), 'y': np.array([2, 3])})
+        self.assertEqual(buff.data, dframe)
+
+    def test_buffer_ring_dframe_unsupported_dtype(self):
+        data = pd.DataFrame({'x': pd.Categorical(['a'])})
+        error = "Buffer ring storage only supports NumPy dtypes"
+        with self.assertRaisesRegex(ValueError, error):
+            Buffer(data, index=False, ring=True)
+
+    def test_buffer_ring_clear(self):
+        data = {'x': np.array([0, 1]), 'y': np.array([1, 2])}
+        buff = Buffer(data, length=3, ring=True)
+        buff.clear()
+        buff.send({'x': np.array([5]), 'y': np.array([6])})
+        self.assertEqual(buff.data, {'x': np.array([5]), 'y': np.array([6])})
+
+
+class TestBufferRangeAccumulation(ComparisonTestCase):
+
+    def _ranges(self, buff):
+        data = buff.data
+        if isinstance(data, dict):
+            return {k: range_cache.lookup(v, ('accumulator',)).range()
+                    for k, v in data.items()}
+        columns = data.columns if isinstance(data, pd.DataFrame) else range(data.shape[1])
+        return {c: range_cache.lookup(data, ('accumulator', c)).range()
+                for c in columns}
+
+    def test_buffer_dict_accumulates_ranges(self):
+        buff = Buffer({'x': np.array([0, 1]), 'y': np.array([5., 1.])}, length=3)
+        buff.send({'x': np.array([2]), 'y': np.array([3.])})
+        self.assertEqual(self._ranges(buff), {'x': (0, 2), 'y': (1, 5)})
+        buff.send({'x': np.array([3]), 'y': np.array([2.])})
+        self.assertEqual(self._ranges(buff), {'x': (1, 3), 'y': (1, 3)})
+
+    def test_buffer_dframe_accumulates_ranges(self):
+        data = pd.DataFrame({'x': [0, 1], 'y': [5., 1.]})
+        buff = Buffer(data, length=2, index=False)
+        buff.send(pd.DataFrame({'x': [2], 'y': [3.]}))
+        self.assertEqual(self._ranges(buff), {'x': (1, 2), 'y': (1, 3)})
+
+    def test_buffer_array_accumulates_ranges(self):
+        buff = Buffer(np.array([[0, 5.], [1, 1.]]), length=2)
+        buff.send(np.array([[2, 3.]]))
+        self.assertEqual(self._ranges(buff), {0: (1, 2), 1: (1, 3)})
+
+    def test_buffer_ring_accumulates_ranges(self):
+        buff = Buffer({'x': np.array([0, 1]), 'y': np.array([5., 1.])}, length=2, ring=True)
+        for i in range(2, 5):
+            buff.send({'x': np.array([i]), 'y': np.array([10.-i])})
+        self.assertEqual(self._ranges(buff), {'x': (3, 4), 'y': (6, 7)})
+
+    def test_buffer_clear_resets_ranges(self):
+        buff = Buffer({'x': np.array([0, 10])}, length=3)
+        buff.clear()
+        buff.send({'x': np.array([5])})
+        self.assertEqual(self._ranges(buff), {'x': (5, 5)})
+
+    def test_buffer_plot_ranges_use_accumulator(self):
+        buff = Buffer({'x': np.arange(3.), 'y': np.array([5., 1., 3.])}, length=3)
+        buff.send({'x': np.array([3.]), 'y': np.array([2.])})
+        curve = Curve(buff.data)
+        accumulator = range_cache.lookup(buff.data['y'], ('accumulator',))
+        from holoviews.plotting.plot import DimensionedPlot
+        self.assertIs(DimensionedPlot._range_accumulator(curve, curve.vdims[0]), accumulator)
+
+
 class Sum(Derived):
     v = param.Number(constant=True)
 
@@ -8,6 +8,7 @@ import holoviews as hv
 
 from collections import OrderedDict
 from unittest import skipIf
+from unittest.mock import patch
 
 import numpy as np
 import pandas as pd
@@ -25,10 +26,12 @@ except ImportError:
     xr = None
 
 xr_skip = skipIf(xr is None, "xarray not available")
+dd_skip = skipIf(dd is None, "dask not available")
 
 from holoviews.core.data import Dataset
 from holoviews.element.comparison import ComparisonTestCase
-from holoviews.util.transform import dim
+from holoviews.core.util import config
+from holoviews.util.transform import _CompiledExpression, dim
 
 
 class Params(param.Parameterized):
@@ -492,6 +495,54 @@ class TestDimTransforms(ComparisonTestCase):
         expr = dim('z').xr.coarsen({'x': 4}).mean()
         self.assert_apply_xarray(expr, self.dataset_xarray.data.z.coarsen({'x': 4}).mean())
 
+    # Lazy evaluation
+
+    @dd_skip
+    def test_dask_applies_ops_before_compute(self):
+        interface = self.dataset_dask.interface
+        expr = (dim('float') > 0.5) & (dim('int') < 9)
+        with patch.object(interface, 'values', wraps=interface.values) as values:
+            result = expr.apply(self.dataset_dask)
+        self.assertEqual([call.kwargs['compute'] for call in values.call_args_list], [False, False])
+        self.assertEqual(result, ((self.linear_floats > 0.5) & (self.linear_ints < 9)).values)
+
+    @dd_skip
+    def test_dask_norm_lazy(self):
+        expr = dim('float').norm() * 255
+        result = expr.apply(self.dataset_dask, keep_index=True, compute=False)
+        self.assertIsInstance(result, dd.Series)
+        self.assertEqual(result.compute().values, expr.apply(self.dataset))
+
+    @dd_skip
+    def test_dask_unsupported_op_materializes(self):
+        def double(values):
+            if not isinstance(values, np.ndarray):
+                raise TypeError('Expected NumPy array')
+            return values * 2
+        expr = dim('float', double)
+        self.assertEqual(expr.apply(self.dataset_dask), self.linear_floats.values * 2)
+
+    @dd_skip
+    def test_dask_op_failing_on_compute_materializes(self):
+        def fail(values):
+            raise TypeError('Unsupported partition')
+        def double(values):
+            if isinstance(values, dd.Series):
+                return values.map_partitions(fail, meta=values)
+            return values * 2
+        expr = dim('float', double)
+        with self.assertLogs('param', level='DEBUG') as logs:
+            result = expr.apply(self.dataset_dask)
+        self.assertEqual(result, self.linear_floats.values * 2)
+        self.assertIn('evaluating it on materialized values', logs.output[0])
+
+    @dd_skip
+    def test_dask_unexpected_error_not_caught(self):
+        def double(values):
+            raise ZeroDivisionError
+        with self.assertRaises(ZeroDivisionError):
+            dim('float', double).apply(self.dataset_dask)
+
     # Dynamic arguments
 
     def test_dynamic_mul(self):
@@ -524,6 +575,66 @@ class TestDimTransforms(ComparisonTestCase):
         self.assertEqual(expr, expr2)
 
 
+class TestCompiledDimTransforms(TestDimTransforms):
+    """
+    Runs all dim transform tests with compilation of elementwise
+    expressions enabled.
+    """
+
+    def setUp(self):
+        super().setUp()
+        self._compile_transforms = config.compile_transforms
+        config.compile_transforms = True
+
+    def tearDown(self):
+        config.compile_transforms = self._compile_transforms
+        super().tearDown()
+
+    def test_compiled_cached(self):
+        expr = dim('float').norm() * 255
+        compiled = _CompiledExpression.compile(expr)
+        self.assertEqual(len(compiled.steps), 2)
+        self.assertIs(_CompiledExpression.compile(expr), compiled)
+
+    def test_compiled_reuses_buffers(self):
+        expr = ((dim('float') * 2 + 1) / 3) - dim('negative')
+        values = [self.linear_floats.values, self.negative.values]
+        compiled = _CompiledExpression.compile(expr)
+        calls = []
+        def ufunc_wrapper(ufunc):
+            def wrapped(*args, **kwargs):
+                if np.size(args[0]):
+                    calls.append('out' in kwargs)
+                return ufunc(*args, **kwargs)
+            return wrapped
+        compiled.steps = [(ufunc_wrapper(fn), operands, extra)
+                          for fn, operands, extra in compiled.steps]
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            result = compiled._evaluate_numpy(values, self.dataset, {}, False)
+        self.assertEqual(result, ((values[0] * 2 + 1) / 3) - values[1])
+        self.assertEqual(calls, [False, True, True, True])
+
+    def test_compiled_not_compilable(self):
+        self.assertIsNone(_CompiledExpression.compile(dim('float')))
+        self.assertIsNone(_CompiledExpression.compile(dim('float').cumsum() * 2))
+        self.assertIsNone(_CompiledExpression.compile(dim('float').bin([0, 0.5, 1])))
+
+    def test_compiled_parameter_argument(self):
+        params = Params(a=1)
+        expr = dim('float') * params.param.a
+        self.assertEqual(expr.apply(self.dataset), self.linear_floats.values)
+        params.a = 2
+        self.assertEqual(expr.apply(self.dataset), self.linear_floats.values*2)
+
+    def test_compiled_keep_index(self):
+        expr = (dim('float') > 0.5) & (dim('int') < 9)
+        pd.testing.assert_series_equal(
+            expr.apply(self.dataset, keep_index=True),
+            (self.linear_floats > 0.5) & (self.linear_ints < 9)
+        )
+
+
 def test_dataset_transform_by_spatial_select_expr_index_not_0_based():
     """Ensure 'spatial_select' expression works when index not zero-based.
     Use 'spatial_select' defined by four nodes to select index 104, 105.
@@ -4,6 +4,7 @@ import inspect
 import shutil
 
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from inspect import Parameter, Signature
 from types import FunctionType
 from pathlib import Path
@@ -1029,10 +1030,17 @@ class Dynamic(param.ParameterizedFunction):
         if not isinstance(operation, Operation):
             operation = function.instance(fn=apply)
             op_kwargs = {'kwargs': op_kwargs}
+
+        # Inherit the executor of the wrapped DynamicMap, the operation
+        # cannot be pickled so process pools are replaced by threads
+        executor = map_obj.callback.executor if isinstance(map_obj, DynamicMap) else None
+        if executor == 'process' or isinstance(executor, ProcessPoolExecutor):
+            executor = 'thread'
         return OperationCallable(dynamic_operation, inputs=[map_obj],
                                  link_inputs=self.p.link_inputs,
                                  operation=operation,
-                                 operation_kwargs=op_kwargs)
+                                 operation_kwargs=op_kwargs,
+                                 executor=executor)
 
 
     def _make_dynamic(self, hmap, dynamic_fn, streams):
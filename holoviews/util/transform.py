@@ -9,7 +9,7 @@ import param
 
 from ..core.data import PandasInterface
 from ..core.dimension import Dimension
-from ..core.util import flatten, resolve_dependent_value, unique_iterator
+from ..core.util import config, flatten, resolve_dependent_value, unique_iterator
 
 
 def _maybe_map(numpy_fn):
@@ -34,6 +34,22 @@ def _maybe_map(numpy_fn):
     return fn
 
 
+def _reduce(values, reduction):
+    """Applies a NumPy reduction or the equivalent method of column
+    objects which do not support NumPy reductions, e.g. ibis columns.
+    """
+    if isinstance(values, np.ndarray) or not hasattr(values, reduction):
+        return getattr(np, reduction)(values)
+    return getattr(values, reduction)()
+
+
+def _log(values):
+    """Natural logarithm of arrays or ibis columns."""
+    if hasattr(values, 'log') and not isinstance(values, np.ndarray):
+        return values.log()
+    return np.log(values)
+
+
 def norm(values, min=None, max=None):
     """Unity-based normalization to scale data into 0-1 range.
 
@@ -47,8 +63,8 @@ def norm(values, min=None, max=None):
     Returns:
         Array of normalized values
     """
-    min = np.min(values) if min is None else min
-    max = np.max(values) if max is None else max
+    min = _reduce(values, 'min') if min is None else min
+    max = _reduce(values, 'max') if max is None else max
     return (values - min) / (max-min)
 
 
@@ -64,9 +80,9 @@ def lognorm(values, min=None, max=None):
     Returns:
         Array of normalized values
     """
-    min = np.log(np.min(values)) if min is None else np.log(min)
-    max = np.log(np.max(values)) if max is None else np.log(max)
-    return (np.log(values) - min) / (max-min)
+    min = _log(_reduce(values, 'min')) if min is None else np.log(min)
+    max = _log(_reduce(values, 'max')) if max is None else np.log(max)
+    return (_log(values) - min) / (max-min)
 
 
 class iloc:
@@ -199,6 +215,285 @@ function_types = (
 )
 
 
+_namespace_attrs = {}
+
+def _namespace_attributes(ns):
+    """
+    Returns the public attributes of a namespace, caching them since
+    dir() is too slow to call on every attribute access.
+    """
+    try:
+        return _namespace_attrs[ns]
+    except (KeyError, TypeError):
+        pass
+    attrs = {attr for attr in dir(ns) if not attr.startswith('_')}
+    try:
+        _namespace_attrs[ns] = attrs
+    except TypeError:
+        pass
+    return attrs
+
+
+class _CompiledExpression:
+    """
+    Fused evaluator for dim expressions consisting solely of
+    elementwise operations on numeric columns. The expression tree is
+    flattened into a sequence of steps once, which are then evaluated
+    either in a single numexpr call, if available, or as a chain of
+    NumPy ufunc calls which write into the intermediate buffers that
+    are no longer needed instead of allocating a new array per
+    operation.
+    """
+
+    _ufuncs = {
+        operator.add: np.add, operator.sub: np.subtract,
+        operator.mul: np.multiply, operator.truediv: np.true_divide,
+        operator.floordiv: np.floor_divide, operator.mod: np.remainder,
+        operator.pow: np.power, operator.and_: np.bitwise_and,
+        operator.or_: np.bitwise_or, operator.eq: np.equal,
+        operator.ne: np.not_equal, operator.ge: np.greater_equal,
+        operator.gt: np.greater, operator.le: np.less_equal,
+        operator.lt: np.less, operator.lshift: np.left_shift,
+        operator.rshift: np.right_shift, operator.neg: np.negative,
+        operator.pos: np.positive, operator.inv: np.invert,
+        abs: np.absolute
+    }
+
+    _numexpr_templates = {
+        np.add: '({} + {})', np.subtract: '({} - {})',
+        np.multiply: '({} * {})', np.true_divide: '({} / {})',
+        np.power: '({} ** {})', np.bitwise_and: '({} & {})',
+        np.bitwise_or: '({} | {})', np.equal: '({} == {})',
+        np.not_equal: '({} != {})', np.greater_equal: '({} >= {})',
+        np.greater: '({} > {})', np.less_equal: '({} <= {})',
+        np.less: '({} < {})', np.negative: '(-{})', np.invert: '(~{})',
+        np.absolute: 'abs({})', np.log: 'log({})', np.log10: 'log10({})',
+        np.log1p: 'log1p({})', np.exp: 'exp({})', np.expm1: 'expm1({})',
+        np.sqrt: 'sqrt({})', np.sin: 'sin({})', np.cos: 'cos({})',
+        np.tan: 'tan({})', np.arcsin: 'arcsin({})', np.arccos: 'arccos({})',
+        np.arctan: 'arctan({})', np.sinh: 'sinh({})', np.cosh: 'cosh({})',
+        np.tanh: 'tanh({})', np.arctan2: 'arctan2({}, {})'
+    }
+
+    # Below this size the overhead of a numexpr call outweighs the gains
+    numexpr_threshold = 65536
+
+    def __init__(self, expr):
+        self.ops = expr.ops
+        self.leaves = []
+        self.steps = []
+        self._compile(expr)
+        # pandas differs from NumPy for integer division by zero
+        self.pandas_compatible = not any(
+            fn in (np.floor_divide, np.remainder) for fn, _, _ in self.steps
+        )
+
+    @classmethod
+    def compile(cls, expr):
+        """
+        Returns the compiled form of the expression, cached on the
+        expression, or None if it cannot be compiled.
+        """
+        compiled = expr.__dict__.get('_compiled')
+        if compiled is None or (compiled and compiled.ops is not expr.ops):
+            try:
+                compiled = cls(expr)
+            except ValueError:
+                compiled = False
+            if compiled and not compiled.steps:
+                compiled = False
+            expr.__dict__['_compiled'] = compiled
+        return compiled or None
+
+    def _operand(self, arg):
+        if isinstance(arg, dim):
+            return self._compile(arg)
+        elif isinstance(arg, param.Parameter):
+            return ('param', arg)
+        elif isinstance(arg, (bool, int, float, np.bool_, np.number)):
+            return ('const', arg)
+        raise ValueError(f'Cannot compile {arg!r} argument.')
+
+    def _compile(self, expr):
+        if type(expr) is not dim or not isinstance(expr.dimension, Dimension):
+            raise ValueError(f'Cannot compile {expr!r} expression.')
+        for i, leaf in enumerate(self.leaves):
+            if leaf == expr.dimension:
+                operand = ('leaf', i)
+                break
+        else:
+            operand = ('leaf', len(self.leaves))
+            self.leaves.append(expr.dimension)
+        for op in expr.ops:
+            fn, args, kwargs = op['fn'], op['args'], op['kwargs']
+            if fn is norm or fn is lognorm:
+                if args or set(kwargs) - {'min', 'max'}:
+                    raise ValueError(f'Cannot compile {fn.__name__} with arguments.')
+                kwargs = {k: self._operand(v) for k, v in kwargs.items()}
+                self.steps.append((fn, [operand], (expr.dimension, kwargs)))
+            else:
+                ufunc = self._ufuncs.get(fn, fn)
+                if (not isinstance(ufunc, np.ufunc) or kwargs or ufunc.nout != 1
+                    or len(args) != ufunc.nin-1):
+                    raise ValueError(f'Cannot compile {fn!r} operation.')
+                operands = [operand] + [self._operand(arg) for arg in args]
+                if op['reverse']:
+                    operands = operands[::-1]
+                self.steps.append((ufunc, operands, None))
+            operand = ('step', len(self.steps)-1)
+        return operand
+
+    @staticmethod
+    def _scalar(operand):
+        kind, value = operand
+        if kind == 'param':
+            value = resolve_dependent_value(value)
+        if not isinstance(value, (bool, int, float, np.bool_, np.number)):
+            raise ValueError(f'Cannot evaluate {value!r} argument.')
+        return value
+
+    def _norm_range(self, fn, values, dataset, dimension, kwargs, ranges, strict):
+        kwargs = {k: self._scalar(v) for k, v in kwargs.items()}
+        eldim = dataset.get_dimension(dimension if strict else dimension.name).name
+        drange = ranges.get(eldim, {})
+        drange = drange.get('combined', drange)
+        if drange != {} and not ('min' in kwargs and 'max' in kwargs):
+            vmin, vmax = drange
+        else:
+            vmin, vmax = kwargs.get('min'), kwargs.get('max')
+        vmin = np.min(values) if vmin is None else vmin
+        vmax = np.max(values) if vmax is None else vmax
+        if fn is lognorm:
+            vmin, vmax = np.log(vmin), np.log(vmax)
+        return vmin, vmax-vmin
+
+    def _evaluate_numpy(self, values, dataset, ranges, strict):
+        pool, results = {}, []
+        def compute(ufunc, args, owned):
+            # Buffers of consumed intermediates may be reused as output
+            for arg, own in zip(args, owned):
+                if own and isinstance(arg, np.ndarray) and arg.ndim:
+                    pool.setdefault((arg.dtype, arg.shape), []).append(arg)
+            dtype = ufunc(*(np.empty(0, a.dtype) if isinstance(a, np.ndarray) else a
+                            for a in args)).dtype
+            shape = np.broadcast_shapes(*(np.shape(a) for a in args))
+            buffers = pool.get((dtype, shape))
+            if buffers:
+                return ufunc(*args, out=buffers.pop())
+            return ufunc(*args)
+
+        for fn, operands, extra in self.steps:
+            args, owned = [], []
+            for kind, value in operands:
+                if kind == 'leaf':
+                    args.append(values[value])
+                elif kind == 'step':
+                    args.append(results[value])
+                    results[value] = None
+                else:
+                    args.append(self._scalar((kind, value)))
+                owned.append(kind == 'step')
+            if fn is np.power and not isinstance(args[1], np.ndarray):
+                # ndarray.__pow__ special cases scalar exponents, e.g. squares
+                results.append(operator.pow(*args))
+                continue
+            elif extra is None:
+                results.append(compute(fn, args, owned))
+                continue
+            dimension, kwargs = extra
+            result, own = args[0], owned[0]
+            vmin, span = self._norm_range(fn, result, dataset, dimension,
+                                          kwargs, ranges, strict)
+            if fn is lognorm:
+                result, own = compute(np.log, [result], [own]), True
+            result = compute(np.subtract, [result, vmin], [own, False])
+            results.append(compute(np.true_divide, [result, span], [True, False]))
+        return results[-1]
+
+    def _evaluate_numexpr(self, values, dataset, ranges, strict):
+        import numexpr as ne
+        local_dict = {f'v{i}': v for i, v in enumerate(values)}
+        def variable(value):
+            name = f'v{len(local_dict)}'
+            local_dict[name] = value
+            return name
+
+        results = []
+        for fn, operands, extra in self.steps:
+            args = []
+            for kind, value in operands:
+                if kind == 'leaf':
+                    args.append(f'v{value}')
+                elif kind == 'step':
+                    args.append(results[value])
+                else:
+                    args.append(variable(self._scalar((kind, value))))
+            if extra is None:
+                results.append(self._numexpr_templates[fn].format(*args))
+                continue
+            dimension, kwargs = extra
+            operand = args[0]
+            if operand not in local_dict:
+                # Data dependent limits require the operand to be evaluated
+                operand = variable(ne.evaluate(operand, local_dict=local_dict))
+            vmin, span = self._norm_range(fn, local_dict.get(operand), dataset,
+                                          dimension, kwargs, ranges, strict)
+            if fn is lognorm:
+                operand = f'log({operand})'
+            results.append(f'(({operand} - {variable(vmin)}) / {variable(span)})')
+        return ne.evaluate(results[-1], local_dict=local_dict)
+
+    def __call__(self, dataset, flat, expanded, ranges, keep_index, compute, strict):
+        """
+        Evaluates the compiled expression on the dataset, returning
+        None if the referenced columns are not numeric NumPy arrays or
+        pandas Series, e.g. for lazy or datetime data.
+        """
+        values, index, names = [], None, set()
+        for dimension in self.leaves:
+            lookup = dimension if strict else dimension.name
+            vals = dataset.interface.values(
+                dataset, lookup, expanded=expanded, flat=flat,
+                compute=compute, keep_index=keep_index
+            )
+            if isinstance(vals, pd.Series):
+                if not self.pandas_compatible:
+                    return None
+                index = vals.index
+                names.add(vals.name)
+                vals = vals.values
+            if not isinstance(vals, np.ndarray) or vals.dtype.kind not in 'biuf':
+                return None
+            values.append(vals)
+
+        numexpr = None
+        if (values[0].size >= self.numexpr_threshold and
+            all(v.dtype.kind == 'b' or v.dtype == np.float64 for v in values) and
+            all(fn in self._numexpr_templates or extra is not None
+                for fn, _, extra in self.steps)):
+            try:
+                import numexpr
+            except ImportError:
+                pass
+
+        try:
+            if numexpr is not None:
+                try:
+                    data = self._evaluate_numexpr(values, dataset, ranges, strict)
+                except Exception:
+                    numexpr = None
+            if numexpr is None:
+                # pandas suppresses floating point warnings
+                with np.errstate(**({'all': 'ignore'} if index is not None else {})):
+                    data = self._evaluate_numpy(values, dataset, ranges, strict)
+        except ValueError:
+            return None
+
+        if index is not None:
+            data = pd.Series(data, index=index, name=names.pop() if len(names) == 1 else None)
+        return data
+
+
 class dim:
     """
     dim transform objects are a way to express deferred transforms on
@@ -240,9 +535,20 @@ class dim:
 
     _unary_funcs = {operator.pos: '+', operator.neg: '-', operator.not_: '~'}
 
+    # Functions applied as methods of lazy column objects which do not
+    # support them, e.g. ibis column expressions
+    _method_funcs = {
+        abs: 'abs', np.absolute: 'abs', np.sqrt: 'sqrt', np.exp: 'exp',
+        np.log2: 'log2', np.ceil: 'ceil', np.floor: 'floor', np.sign: 'sign'
+    }
+
     _all_funcs = [_binary_funcs, _builtin_funcs, _custom_funcs,
                   _numpy_funcs, _unary_funcs]
 
+    # Errors raised by lazy backends which do not support an operation,
+    # after which the expression is evaluated on materialized values
+    _lazy_errors = (AttributeError, NotImplementedError, TypeError, ValueError)
+
     _namespaces = {'numpy': 'np'}
 
     namespace = 'numpy'
@@ -279,7 +585,7 @@ class dim:
         self.ops = ops
 
     def __getstate__(self):
-        return self.__dict__
+        return {k: v for k, v in self.__dict__.items() if k != '_compiled'}
 
     def __setstate__(self, state):
         self.__dict__.update(state)
@@ -317,8 +623,7 @@ class dim:
                 # calling then we are using custom API of the dim
                 # transform itself, so set namespace to None
                 ns = None
-        extras = {ns_attr for ns_attr in dir(ns) if not ns_attr.startswith('_')}
-        if attr in extras and attr not in super().__dir__():
+        if attr in _namespace_attributes(ns) and attr not in super().__dir__():
             return type(self)(self, attr, accessor=True)
         else:
             return super().__getattribute__(attr)
@@ -617,6 +922,10 @@ class dim:
             if 'axis' not in kwargs and not isinstance(fn, np.ufunc):
                 kwargs['axis'] = None
             fn = fn_name
+        elif (fn in self._method_funcs and not kwargs and
+              not isinstance(data, (np.ndarray, pd.Series)) and
+              hasattr(data, self._method_funcs[fn])):
+            fn = fn_name = self._method_funcs[fn]
 
         if isinstance(fn, str):
             accessor = kwargs.pop('accessor', None)
@@ -678,8 +987,17 @@ class dim:
         Implements conversion of data from namespace specific object,
         e.g. pandas Series to NumPy array.
         """
-        if hasattr(data, 'compute') and compute:
-            data = data.compute()
+        if compute:
+            if hasattr(data, 'compute'):
+                data = data.compute()
+            elif hasattr(data, 'execute'):
+                # ibis expression
+                data = data.execute()
+            elif hasattr(data, 'to_pandas'):
+                # cuDF series
+                data = data.to_pandas()
+        if drop_index and hasattr(data, 'index') and hasattr(data, 'values'):
+            data = data.values
         return data
 
     def _coerce(self, data):
@@ -740,13 +1058,50 @@ class dim:
             dataset = dataset if dimension in dataset else dataset.nodes
 
         dataset = self._coerce(dataset)
+        if (config.compile_transforms and type(self) is dim and
+            not isinstance(dataset, Graph) and not dataset.interface.lazy):
+            compiled = _CompiledExpression.compile(self)
+            if compiled is not None:
+                data = compiled(dataset, flat, expanded, ranges, keep_index,
+                                compute, strict)
+                if data is not None:
+                    return data
+
         if self.namespace != 'numpy':
-            compute_for_compute = False
-            keep_index_for_compute = True
+            modes = [(False, True)]
+        elif dataset.interface.lazy:
+            # Apply the operations to the native (lazy) column objects
+            # and only compute the result, falling back to materialized
+            # values if the backend does not support an operation
+            modes = [(False, True), (compute, keep_index)]
         else:
-            compute_for_compute = compute
-            keep_index_for_compute = keep_index
+            modes = [(compute, keep_index)]
+        for i, (compute_for_compute, keep_index_for_compute) in enumerate(modes):
+            try:
+                data = self._evaluate(
+                    dataset, dimension, flat, expanded, ranges, all_values,
+                    keep_index_for_compute, compute_for_compute, strict
+                )
+                drop_index = keep_index_for_compute and not keep_index
+                compute_data = not compute_for_compute and compute
+                if (drop_index or compute_data):
+                    data = self._compute_data(data, drop_index, compute_data)
+            except self._lazy_errors as e:
+                if i == len(modes)-1:
+                    raise
+                param.main.param.debug(
+                    f'Applying {self!r} to the lazy columns of the {dataset.interface.datatype} '
+                    f'data failed with {e!r}, evaluating it on materialized values instead.')
+                continue
+            break
+        return data
 
+    def _evaluate(self, dataset, dimension, flat, expanded, ranges, all_values,
+                  keep_index, compute, strict):
+        """
+        Looks up the values of the dimension and applies the operations
+        of the expression to them.
+        """
         if dimension.name == '*':
             data = dataset.data
             eldim = None
@@ -758,21 +1113,17 @@ class dim:
             eldim = dataset.get_dimension(lookup).name
             data = dataset.interface.values(
                 dataset, lookup, expanded=expanded, flat=flat,
-                compute=compute_for_compute, keep_index=keep_index_for_compute
+                compute=compute, keep_index=keep_index
             )
         for op in self.ops:
             fn, fn_name, args, kwargs, accessor = self._resolve_op(
                 op, dataset, data, flat, expanded, ranges, all_values,
-                keep_index_for_compute, compute_for_compute, strict
+                keep_index, compute, strict
             )
             drange = ranges.get(eldim, {})
             drange = drange.get('combined', drange)
             data = self._apply_fn(dataset, data, fn, fn_name, args,
                                   kwargs, accessor, drange)
-        drop_index = keep_index_for_compute and not keep_index
-        compute = not compute_for_compute and compute
-        if (drop_index or compute):
-            data = self._compute_data(data, drop_index, compute)
         return data
 
     def __repr__(self):